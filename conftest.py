@@ -14,18 +14,36 @@ pytest_plugins = [
 
 
 import shutil
+import tempfile
 import re
 # from src.gtas_python_core_v2.gtas_python_core_vault_v2 import Vault
 from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page
 import os
 import pytest
-import requests
 from datetime import datetime
 from pathlib import Path
 import json
-import time
 import logging
 from dotenv import load_dotenv  # type: ignore
+from utils.schema_registry import get_schema_registry
+from utils.retention_filter import update_tracker_retention
+from utils.tracker_projection import update_tracker_projection
+from utils.validation_helpers import get_validation_cache_stats, set_validation_mode, VALIDATION_MODES
+from utils.testrail_client import TestRailClient
+from utils.testrail_cache import TestRailSuiteCache
+from utils.feature_case_ids import collect_case_ids
+from utils.parallel import (
+    SHARED_DIR_KEY, get_worker_id, is_xdist_worker, is_xdist_controller, worker_artifact_path,
+    get_shared_dir, read_shared_json, write_shared_json,
+)
+from utils.login_state import LoginStateCache, resolve_member_type, MEMBER_TYPE_MARKER, MEMBER_TAG_PREFIX, MEMBER_TYPES
+from utils.credentials import MemberType
+from utils.context_pool import (
+    BrowserContextPool, PersistentProfileContext, get_context_pool_size, is_persistent_profile_enabled,
+    get_persistent_profile_dir, FRESH_CONTEXT_MARKER,
+)
+from utils.testrail_reporter import TestRailReporter, REPORTER_THREAD_NAME, DEFAULT_BATCH_SIZE, DEFAULT_BATCH_INTERVAL_SECONDS
+from utils.beacon_latency import get_latency_recorder
 
 # .env 파일 로드 (프로젝트 루트 기준)
 project_root = Path(__file__).parent
@@ -78,8 +96,6 @@ logger = logging.getLogger(__name__)
 #     page.close()
 
 
-STATE_PATH = "state.json"
-
 # ============================================
 # BrowserSession: 브라우저 세션 관리 클래스
 # ============================================
@@ -152,6 +168,15 @@ class BrowserSession:
             logger.warning("BrowserSession: 복귀할 이전 페이지가 없음")
             return False
     
+    def iter_pages(self):
+        """
+        page stack의 열린 페이지를 최근 전환 순으로 반환 (새 탭으로 이동한 뒤 목록 페이지 조회용)
+        
+        Returns:
+            list: 닫히지 않은 Page 리스트 (현재 active page가 첫 번째)
+        """
+        return [p for p in reversed(self._page_stack) if not p.is_closed()]
+    
     def get_page_stack(self):
         """
         디버깅용: 현재 page stack의 URL 리스트 반환
@@ -162,6 +187,45 @@ class BrowserSession:
         return [p.url for p in self._page_stack]
 
 
+def pytest_addoption(parser):
+    """검증 모드 옵션 (지정하면 config.json의 validation_mode/validation_sample_size보다 우선)"""
+    group = parser.getgroup("tracking", "트래킹 로그 검증")
+    group.addoption(
+        "--validation-mode",
+        action="store",
+        default=None,
+        choices=VALIDATION_MODES,
+        help="로그 검증 모드: full(전체), fail_fast(첫 불일치에서 중단), sampled(이벤트 타입별 최신 N개)",
+    )
+    group.addoption(
+        "--validation-sample-size",
+        action="store",
+        type=int,
+        default=None,
+        help="sampled 모드에서 이벤트 타입별로 검증할 최신 로그 수",
+    )
+
+
+def pytest_configure(config):
+    """pytest 옵션으로 지정한 검증 모드 적용, 회원 종류 마커 등록, xdist 컨트롤러면 워커와 공유할 폴더 생성"""
+    set_validation_mode(
+        config.getoption("--validation-mode"),
+        config.getoption("--validation-sample-size"),
+    )
+    config.addinivalue_line("markers", f"{MEMBER_TYPE_MARKER}(name): 시나리오 로그인 회원 종류 (normal/club/business)")
+    for member_type in MEMBER_TYPES:
+        config.addinivalue_line("markers", f"{MEMBER_TAG_PREFIX}{member_type}: {member_type} 회원으로 로그인한 컨텍스트 사용 (Feature 태그)")
+    config.addinivalue_line("markers", f"{FRESH_CONTEXT_MARKER}: 컨텍스트 풀을 쓰지 않고 새 브라우저 컨텍스트에서 실행 (Feature 태그)")
+    if is_xdist_controller(config):
+        config._tracking_shared_dir = tempfile.mkdtemp(prefix="tracking_xdist_")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """(xdist 컨트롤러) 워커에 공유 폴더 경로 전달"""
+    node.workerinput[SHARED_DIR_KEY] = node.config._tracking_shared_dir
+
+
 # ------------------------
 # :일: Playwright 세션 단위 fixture
 # ------------------------
@@ -182,94 +246,76 @@ def browser(pw):
 # ------------------------
 # :셋: Context fixture (각 시나리오마다 독립적으로 생성)
 # ------------------------
+@pytest.fixture(scope="session")
+def context_pool(pw, request):
+    """
+    브라우저 컨텍스트 풀 (세션 단위)
+    config.json persistent_profile이 Y이면 전용 프로필 폴더의 영구 컨텍스트(HTTP 캐시 유지),
+    아니면 context_pool_size 크기의 풀 (0이면 None, 시나리오마다 새 컨텍스트)
+    """
+    if is_persistent_profile_enabled():
+        pool = PersistentProfileContext(pw, get_persistent_profile_dir())
+        yield pool
+        pool.close()
+        return
+    size = get_context_pool_size()
+    if size <= 0:
+        yield None
+        return
+    pool = BrowserContextPool(request.getfixturevalue("browser"), size)
+    yield pool
+    pool.close()
+
+
 @pytest.fixture(scope="function")
-def context(browser, ensure_login_state):
+def context(context_pool, login_state_cache, member_type, bdd_context, request):
     """
     브라우저 컨텍스트 fixture
-    각 시나리오마다 독립적으로 생성되고 종료 시 정리됩니다.
+    시나리오의 회원 종류(member_type) state로 생성하므로 계정 전환에 UI 로그인이 필요 없습니다.
+    컨텍스트 풀(또는 영구 프로필)을 사용하면 이전 시나리오의 컨텍스트를 초기화해서 재사용하고,
+    풀을 사용하지 않거나 fresh_context 마커/태그가 있으면 각 시나리오마다 새로 생성 후 종료합니다.
     """
-    ctx = browser.new_context(storage_state=ensure_login_state)
+    state_path = login_state_cache.get(member_type)
+    if context_pool is None or request.node.get_closest_marker(FRESH_CONTEXT_MARKER):
+        # 세션 브라우저는 새 컨텍스트가 필요할 때만 실행 (영구 프로필 모드에서는 fresh_context 시나리오용)
+        ctx = request.getfixturevalue("browser").new_context(storage_state=state_path)
+        yield ctx
+        ctx.close()
+        return
+    ctx = context_pool.acquire(state_path)
     yield ctx
-    ctx.close()
-# ------------------------
-# :셋: 로그인 상태 검증
-# ------------------------
-def is_state_valid(state_path: str) -> bool:
-    """state.json이 유효한지 확인 (쿠키 기반)"""
-    if not os.path.exists(state_path):
-        return False
-    try:
-        with open(state_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        cookies = data.get("cookies", [])
-        now = time.time()
-        # 쿠키 하나라도 만료되지 않았으면 로그인 유지 가능
-        if any("expires" in c and c["expires"] and c["expires"] > now for c in cookies):
-            return True
-        return False
-    except Exception as e:
-        print(f"[WARN] state.json 검증 오류: {e}")
-        return False
-# ------------------------
-# :넷: 로그인 수행 + state.json 저장
-# ------------------------
-def create_login_state(pw):
-    """로그인 수행 후 state.json 저장"""
-    from utils.urls import base_url
-    from utils.credentials import get_credentials, MemberType
-    
-    print("[INFO] 로그인 절차 시작")
-    # 계정 정보 가져오기 (일반회원 사용)
-    credentials = get_credentials(MemberType.NORMAL)
-    username = credentials["username"]
-    password = credentials["password"]
-    
-    browser = pw.chromium.launch(headless=False)  # 화면 확인용
-    context = browser.new_context()
-    page = context.new_page()
-    page.goto(base_url())
-    # 로그인 페이지 이동 및 입력
-    page.click("text=로그인")
-    page.fill("#typeMemberInputId", username)
-    page.fill("#typeMemberInputPassword", password)
-    page.click("#btn_memberLogin")
-    # 로그인 완료 대기
-    page.wait_for_selector("text=로그아웃", timeout=15000)
-    # 로그인 상태 저장
-    context.storage_state(path=STATE_PATH)
-    import json
-    with open(STATE_PATH, 'r', encoding='utf-8') as f:
-        state = json.load(f)
-        cookies_count = len(state.get('cookies', []))
-        origins_count = len(state.get('origins', []))
-        logger.debug(f"저장된 쿠키 수: {cookies_count}")
-        logger.debug(f"저장된 origins 수: {origins_count}")
-        
-        if origins_count > 0:
-            for origin in state.get('origins', []):
-                origin_url = origin.get('origin', 'N/A')
-                localStorage_count = len(origin.get('localStorage', []))
-                sessionStorage_count = len(origin.get('sessionStorage', []))
-                logger.debug(f"Origin: {origin_url}")
-                print(f"  - localStorage: {localStorage_count}개 항목")
-                print(f"  - sessionStorage: {sessionStorage_count}개 항목")
-        else:
-            print("[WARNING] origins가 저장되지 않았습니다. localStorage/sessionStorage가 복원되지 않을 수 있습니다.")
-    
-    browser.close()
-    print("[INFO] 로그인 완료 및 state.json 저장됨")
+    # 트래커 리스너 해제 후 반납 (다음 시나리오에서 이전 트래커가 요청을 받지 않도록)
+    tracker = bdd_context.get('tracker')
+    if tracker is not None and tracker.is_tracking:
+        tracker.stop()
+    context_pool.release(ctx)
 # ------------------------
-# :다섯: 로그인 상태 fixture
+# :넷: 로그인 상태 fixture
 # ------------------------
 @pytest.fixture(scope="session")
-def ensure_login_state(pw):
+def login_state_cache(pw, request):
     """
-    매 세션마다 로그인 수행하여 새로운 state.json 생성
-    기존 state.json이 있어도 무시하고 새로 로그인
+    회원 종류별 로그인 state 캐시 (세션 단위)
+    처음 필요한 회원 종류만 확보(유효한 state 재사용 또는 로그인)하고 만료 전까지 재사용
+    xdist 실행 시에는 파일 잠금으로 한 워커만 확인/로그인하고 나머지 워커는 그 state 파일을 사용
     """
-    print("[INFO] 세션 시작 → 새로 로그인 수행")
-    create_login_state(pw)
-    return STATE_PATH
+    return LoginStateCache(pw, get_shared_dir(request.config))
+
+
+@pytest.fixture(scope="session")
+def ensure_login_state(login_state_cache):
+    """일반회원 로그인 state 파일 경로"""
+    return login_state_cache.get(MemberType.NORMAL)
+
+
+@pytest.fixture(scope="function")
+def member_type(request):
+    """
+    시나리오 회원 종류
+    @pytest.mark.parametrize("member_type", [...], indirect=True), @pytest.mark.member_type("club"),
+    Feature/Scenario 태그(@member_club, @member_business) 순으로 지정, 없으면 일반회원
+    """
+    return resolve_member_type(request)
 # ------------------------
 # :넷: page fixture (각 시나리오마다 독립적으로 생성)
 # ------------------------
@@ -422,9 +468,9 @@ def _capture_screenshot(case_id_num, request=None, step_func_args=None):
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             # case_id_num이 숫자면 TestRail 케이스 ID, 아니면 일반 파일명
             if isinstance(case_id_num, (int, str)) and str(case_id_num).isdigit():
-                screenshot_path = f"screenshots/{case_id_num}_{timestamp}.png"
+                screenshot_path = str(worker_artifact_path(f"screenshots/{case_id_num}_{timestamp}.png"))
             else:
-                screenshot_path = f"screenshots/{case_id_num}_{timestamp}.png"
+                screenshot_path = str(worker_artifact_path(f"screenshots/{case_id_num}_{timestamp}.png"))
             os.makedirs(os.path.dirname(screenshot_path), exist_ok=True)
             page.screenshot(path=screenshot_path, timeout=2000)
             print(f"[TestRail] 스크린샷 저장 완료: {screenshot_path}")
@@ -456,28 +502,6 @@ def _collect_step_logs():
     return None
 
 
-def _attach_screenshot_to_testrail(result_id, screenshot_path):
-    """
-    TestRail 결과에 스크린샷 첨부
-    
-    Args:
-        result_id: TestRail 결과 ID
-        screenshot_path: 스크린샷 파일 경로
-    """
-    if not screenshot_path or not result_id:
-        return
-    
-    try:
-        with open(screenshot_path, "rb") as f:
-            testrail_post(
-                f"add_attachment_to_result/{result_id}",
-                files={"attachment": f},
-            )
-        print(f"[TestRail] 스크린샷 첨부 완료: {screenshot_path}")
-    except Exception as e:
-        logger.warning(f"TestRail 스크린샷 업로드 실패: {e}")
-
-
 @pytest.hookimpl(hookwrapper=True)
 def pytest_bdd_before_step(request, feature, scenario, step, step_func):
     """
@@ -488,6 +512,21 @@ def pytest_bdd_before_step(request, feature, scenario, step, step_func):
     outcome = yield
 
 
+def pytest_bdd_before_step_call(request, feature, scenario, step, step_func, step_func_args):
+    """
+    모듈 타이틀을 받는 스텝은 실행 전에 트래커 projection을 해당 모듈 스키마 키로 좁힘
+    (같은 스텝의 스크롤/클릭 비콘부터 적용, 영역 전체 projection은 모듈을 알기 전까지만 사용)
+    """
+    bdd_context = step_func_args.get('bdd_context') if step_func_args else None
+    module_title = step_func_args.get('module_title') if step_func_args else None
+    if bdd_context is None or not module_title:
+        return
+    try:
+        update_tracker_projection(bdd_context, module_title)
+    except Exception as e:
+        logger.warning(f"트래커 projection 적용 실패 (무시됨): {e}")
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_bdd_after_step(request, feature, scenario, step, step_func, step_func_args):
     """
@@ -497,6 +536,19 @@ def pytest_bdd_after_step(request, feature, scenario, step, step_func, step_func
     """
     outcome = yield
     
+    # 모듈/상품이 정해진 스텝 이후부터 트래커 보존 필터 적용 (config.json tracker_retention)
+    # projection도 스텝에서 저장한 module_title 기준으로 맞춤
+    bdd_context = step_func_args.get('bdd_context') if step_func_args else None
+    if bdd_context is not None:
+        try:
+            update_tracker_retention(bdd_context)
+        except Exception as e:
+            logger.warning(f"트래커 보존 필터 적용 실패 (무시됨): {e}")
+        try:
+            update_tracker_projection(bdd_context)
+        except Exception as e:
+            logger.warning(f"트래커 projection 적용 실패 (무시됨): {e}")
+    
     # 훅 시작 로그 (예외 발생 전에도 출력되도록 try 밖에)
     logger.debug(f"===== pytest_bdd_after_step 시작: 스텝='{step.name}' =====")
     
@@ -526,10 +578,13 @@ def pytest_bdd_after_step(request, feature, scenario, step, step_func, step_func
                         if validation_failed:
                             step_status = "failed"
                             validation_error = bdd_context.get('validation_error_message', '검증 실패')
+                            # ValidationReport는 TestRail 코멘트용 길이 제한 요약으로 변환
+                            if hasattr(validation_error, 'summary'):
+                                validation_error = validation_error.summary()
                             # outcome.excinfo가 있으면 그것을 우선, 없으면 validation_error 사용
                             if error_msg is None or not error_msg:
                                 error_msg = validation_error
-                            logger.debug(f"검증 스텝 실패 감지: validation_failed={validation_failed}, error_msg={error_msg}")
+                            logger.debug("검증 스텝 실패 감지: validation_failed=%s, error_msg=%s", validation_failed, error_msg)
                     else:
                         # 프론트 동작 스텝: frontend_action_failed 확인
                         if bdd_context.get('frontend_action_failed'):
@@ -694,22 +749,9 @@ def pytest_bdd_after_step(request, feature, scenario, step, step_func, step_func
                 "comment": comment,
             }
             
-            result_id = None
-            try:
-                logger.debug(f"TestRail API 호출: add_result_for_case/{testrail_run_id}/{case_id_num}")
-                result_obj = testrail_post(
-                    f"add_result_for_case/{testrail_run_id}/{case_id_num}", 
-                    payload
-                )
-                result_id = result_obj.get("id")
-                print(f"[TestRail] 스텝 '{step.name}' 결과 기록 완료 (case_id: {step_case_id}, status: {step_status}, result_id: {result_id})")
-            except Exception as e:
-                logger.warning(f"스텝 TestRail 기록 실패: {e}")
-                import traceback
-                logger.debug(f"TestRail 기록 실패 상세:\n{traceback.format_exc()}")
-            
-            # 스크린샷 첨부
-            _attach_screenshot_to_testrail(result_id, screenshot_path)
+            # 결과 기록·스크린샷 첨부는 백그라운드 스레드에서 처리 (스텝 실행 시간에 TestRail 응답 시간이 더해지지 않도록)
+            testrail_reporter.submit_result(testrail_run_id, case_id_num, payload, screenshot_path, label=step.name)
+            logger.debug(f"TestRail 결과 기록 대기열 추가: case_id={step_case_id}, status={step_status}")
             
         elif step_case_id:
             # TC 번호는 있지만 testrail_run_id가 없는 경우 (TestRail 연동 미활성화)
@@ -752,6 +794,11 @@ def pytest_bdd_after_step(request, feature, scenario, step, step_func, step_func
         logger.debug(f"===== pytest_bdd_after_step 종료 (예외 발생) =====")
 
 
+def pytest_bdd_after_scenario(request, feature, scenario):
+    """시나리오 종료 시 모아 둔 TestRail 결과 기록 요청 (기다리지 않음)"""
+    testrail_reporter.flush()
+
+
 # JSON 파일이 들어 있는 폴더 지정
 JSON_DIR = Path(__file__).parent / "json"  # json 폴더 내의 JSON 파일 전부 대상
 
@@ -768,6 +815,8 @@ except json.JSONDecodeError as e:
 
 # TestRail 기록: testrail_report가 Y일 때만 Run 생성·결과 기록
 TESTRAIL_REPORT_ENABLED = (config.get("testrail_report") or "N").strip().upper() == "Y"
+# Run에 포함할 케이스 범위: collected (수집된 시나리오의 TC만, 기본) / section (section_id 하위 전체)
+TESTRAIL_RUN_SCOPE = (config.get("testrail_run_scope") or "collected").strip().lower()
 # 세션 종료 시 close_run 호출 여부 (기본 Y, testrail_report로 Run을 만든 경우에만 의미 있음)
 TESTRAIL_CLOSE_RUN_ON_FINISH = (config.get("testrail_close_run_on_finish") or "Y").strip().upper() == "Y"
 
@@ -796,21 +845,27 @@ test_logs = {}  # {nodeid: 로그 문자열} - 테스트별 로그 저장
 current_test_nodeid = None  # 현재 실행 중인 테스트의 nodeid
 
 
+# TestRail API 클라이언트 (세션 재사용: keep-alive 연결, 타임아웃, 재시도)
+testrail_client = (
+    TestRailClient(TESTRAIL_BASE_URL, TESTRAIL_USER, TESTRAIL_TOKEN) if TESTRAIL_REPORT_ENABLED else None
+)
+
+
 def testrail_get(endpoint):
-    url = f"{TESTRAIL_BASE_URL}/index.php?/api/v2/{endpoint}"
-    r = requests.get(url, auth=(TESTRAIL_USER, TESTRAIL_TOKEN))
-    r.raise_for_status()
-    return r.json()
+    return testrail_client.get(endpoint)
 
 
 def testrail_post(endpoint, payload=None, files=None):
-    url = f"{TESTRAIL_BASE_URL}/index.php?/api/v2/{endpoint}"
-    if files:
-        r = requests.post(url, auth=(TESTRAIL_USER, TESTRAIL_TOKEN), files=files)
-    else:
-        r = requests.post(url, auth=(TESTRAIL_USER, TESTRAIL_TOKEN), json=payload)
-    r.raise_for_status()
-    return r.json()
+    return testrail_client.post(endpoint, payload, files)
+
+
+# TestRail 결과 기록 큐 (add_result_for_case / add_attachment_to_result를 백그라운드에서 호출)
+# 결과는 시나리오 종료 시 또는 testrail_batch_size건 / testrail_batch_interval_seconds초마다 add_results_for_cases로 묶어 기록
+testrail_reporter = TestRailReporter(
+    testrail_post,
+    batch_size=int(config.get("testrail_batch_size") or DEFAULT_BATCH_SIZE),
+    batch_interval_seconds=float(config.get("testrail_batch_interval_seconds") or DEFAULT_BATCH_INTERVAL_SECONDS),
+)
 
 
 from collections import defaultdict
@@ -857,45 +912,14 @@ def get_all_subsection_ids(parent_section_id, all_sections):
     return result_ids
 
 
-@pytest.hookimpl(tryfirst=True)
-def pytest_sessionstart(session):
-    """
-    테스트 실행 시작 시:
-    1. section_id 기반으로 해당 섹션과 모든 하위 섹션의 케이스 ID 가져오기
-    2. 그 케이스들로 Run 생성
+def _collect_subtree_case_ids(section_id_int, all_sections, all_cases):
     """
-    global testrail_run_id, case_id_map
+    section_id와 모든 하위 섹션에 속한 케이스 ID 수집 (case_id_map도 함께 갱신)
     
-    if not TESTRAIL_REPORT_ENABLED:
-        print("[TestRail] testrail_report가 Y가 아님 — 기록 비활성화")
-        return
-    
-    logger.debug(f"pytest_sessionstart 실행 시작")
-    logger.debug(f"현재 testrail_run_id 값: {testrail_run_id}")
-    
-    if testrail_run_id is not None:
-        print(f"[TestRail] 이미 Run(ID={testrail_run_id})이 존재합니다. 새 Run 생성 생략")
-        return
-    
-    if not TESTRAIL_SECTION_ID:
-        logger.error(f"TESTRAIL_SECTION_ID가 정의되지 않았습니다.")
-        raise RuntimeError("[TestRail] TESTRAIL_SECTION_ID가 정의되지 않았습니다.")
-    
-    # TESTRAIL_SECTION_ID를 정수로 변환
-    try:
-        section_id_int = int(TESTRAIL_SECTION_ID)
-    except (ValueError, TypeError):
-        raise RuntimeError(f"[TestRail] TESTRAIL_SECTION_ID '{TESTRAIL_SECTION_ID}'를 정수로 변환할 수 없습니다.")
-    
-    # 1. 모든 섹션 가져오기
-    print(f"[TestRail] 모든 섹션 가져오기 중...")
-    all_sections = testrail_get(
-        f"get_sections/{TESTRAIL_PROJECT_ID}&suite_id={TESTRAIL_SUITE_ID}"
-    )
-    
-    # 디버깅: 섹션 구조 확인
+    Raises:
+        RuntimeError: 해당 섹션 트리에 케이스가 없음
+    """
     print(f"[TestRail] 총 {len(all_sections)}개 섹션 발견")
-    print(f"[TestRail] 찾고자 하는 섹션 ID: {section_id_int} (타입: {type(section_id_int).__name__})")
     
     # 지정된 섹션이 존재하는지 확인
     section_exists = any(s.get("id") == section_id_int for s in all_sections)
@@ -905,34 +929,20 @@ def pytest_sessionstart(session):
         for s in all_sections[:10]:
             print(f"  - ID: {s.get('id')}, Name: {s.get('name')}, Parent ID: {s.get('parent_id')}")
     
-    # 2. 지정된 섹션과 모든 하위 섹션 ID 찾기 → 서브트리 집합 (O(1) 조회용)
+    # 지정된 섹션과 모든 하위 섹션 ID 찾기 → 서브트리 집합 (O(1) 조회용)
     all_section_ids = get_all_subsection_ids(section_id_int, all_sections)
     all_section_ids = list(dict.fromkeys(all_section_ids))  # 순서 유지하면서 중복 제거
     subtree_section_ids = set(all_section_ids)
     print(f"[TestRail] 섹션 ID {section_id_int}와 하위 섹션 {len(all_section_ids) - 1}개 발견 (중복 제거됨): {all_section_ids}")
     
-    # 3. 스위트 전체 케이스 한 번에 가져오기 (페이지네이션) 후 로컬 필터링
+    case_id_map.clear()
     all_case_ids = []
-    limit = 250
-    offset = 0
-    base_cases_url = f"get_cases/{TESTRAIL_PROJECT_ID}&suite_id={TESTRAIL_SUITE_ID}&limit={limit}&offset="
-    while True:
-        try:
-            cases = testrail_get(base_cases_url + str(offset))
-        except Exception as e:
-            logger.warning(f"스위트 전체 케이스 가져오기 실패 (offset={offset}): {e}")
-            break
-        if not cases:
-            break
-        for c in cases:
-            sid = c.get("section_id")
-            if sid is not None and sid in subtree_section_ids:
-                case_id = c["id"]
-                all_case_ids.append(case_id)
-                case_id_map.setdefault(sid, []).append(case_id)
-        if len(cases) < limit:
-            break
-        offset += limit
+    for c in all_cases:
+        sid = c.get("section_id")
+        if sid is not None and sid in subtree_section_ids:
+            case_id = c["id"]
+            all_case_ids.append(case_id)
+            case_id_map.setdefault(sid, []).append(case_id)
     # 중복 제거 (같은 케이스가 여러 번 나올 수 있음)
     all_case_ids = list(dict.fromkeys(all_case_ids))
     
@@ -940,8 +950,122 @@ def pytest_sessionstart(session):
         raise RuntimeError(f"[TestRail] section_id '{section_id_int}'와 하위 섹션에 케이스가 없습니다.")
     
     print(f"[TestRail] 총 {len(all_case_ids)}개 케이스 수집 완료")
+    return all_case_ids
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    """
+    테스트 실행 시작 시 트래킹 스키마 파일 워밍업 (레지스트리에 병렬 로드)
+    TestRail Run은 수집이 끝난 뒤 pytest_collection_finish에서 생성
+    """
+    get_schema_registry().warm_up()
+    
+    if not TESTRAIL_REPORT_ENABLED:
+        print("[TestRail] testrail_report가 Y가 아님 — 기록 비활성화")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_finish(session):
+    """
+    수집 완료 후 TestRail Run 생성
+    1. 수집된 시나리오의 스텝/Examples에서 TC 번호(C\\d+)를 모아 그 케이스만으로 Run 생성 (섹션 트리 조회 생략)
+    2. 참조 케이스를 알 수 없거나 testrail_run_scope가 "section"이면
+       section_id 기반으로 해당 섹션과 모든 하위 섹션의 케이스 ID를 가져와 Run 생성 (json/testrail_cache_*.json 캐시 사용)
+    """
+    global testrail_run_id
+    
+    if not TESTRAIL_REPORT_ENABLED or session.config.option.collectonly:
+        return
+    
+    if is_xdist_worker(session.config):
+        # xdist 워커: 수집한 TC 번호만 공유 폴더에 남기고, Run은 컨트롤러가 생성 (pytest_xdist_node_collection_finished)
+        collected_case_ids = collect_case_ids(session.items) if TESTRAIL_RUN_SCOPE == "collected" else None
+        write_shared_json(get_shared_dir(session.config) / f"collected_{get_worker_id()}.json", {"case_ids": collected_case_ids})
+        return
+    
+    logger.debug(f"pytest_collection_finish 실행 시작")
+    logger.debug(f"현재 testrail_run_id 값: {testrail_run_id}")
+    
+    if testrail_run_id is not None:
+        print(f"[TestRail] 이미 Run(ID={testrail_run_id})이 존재합니다. 새 Run 생성 생략")
+        return
+    
+    collected_case_ids = None
+    if TESTRAIL_RUN_SCOPE == "collected":
+        collected_case_ids = collect_case_ids(session.items)
+        if collected_case_ids is not None and not collected_case_ids:
+            print("[TestRail] 수집된 시나리오에 TC 번호가 없어 Run을 생성하지 않습니다.")
+            return
+    
+    _create_testrail_run(collected_case_ids)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_node_collection_finished(node, ids):
+    """
+    (xdist 컨트롤러) 첫 워커의 수집이 끝나면 그 워커가 남긴 TC 번호로 Run을 한 번만 생성하고 공유 폴더에 Run ID 기록
+    워커는 모두 같은 항목을 수집하며, 테스트 배분은 모든 워커의 수집이 끝난 뒤 시작되므로 워커가 Run ID를 읽기 전에 기록됨
+    """
+    global testrail_run_id
+    
+    if not TESTRAIL_REPORT_ENABLED or testrail_run_id is not None:
+        return
+    shared_dir = get_shared_dir(node.config)
+    collected = read_shared_json(shared_dir / f"collected_{node.gateway.id}.json", {})
+    collected_case_ids = collected.get("case_ids")
+    if collected_case_ids is not None and not collected_case_ids:
+        print("[TestRail] 수집된 시나리오에 TC 번호가 없어 Run을 생성하지 않습니다.")
+        testrail_run_id = 0
+        return
+    _create_testrail_run(collected_case_ids)
+    write_shared_json(shared_dir / "testrail_run.json", {"run_id": testrail_run_id})
+
+
+def _resolve_shared_testrail_run_id(config):
+    """(xdist 워커) 컨트롤러가 만든 Run ID를 공유 폴더에서 읽음"""
+    global testrail_run_id
+    
+    if testrail_run_id is not None or not TESTRAIL_REPORT_ENABLED or not is_xdist_worker(config):
+        return
+    shared = read_shared_json(get_shared_dir(config) / "testrail_run.json")
+    if shared and shared.get("run_id"):
+        testrail_run_id = shared["run_id"]
+        logger.debug(f"공유된 TestRail Run ID 사용: {testrail_run_id}")
+
+
+def _create_testrail_run(collected_case_ids=None):
+    """
+    TestRail Run 생성
+    
+    Args:
+        collected_case_ids: 수집된 시나리오가 참조하는 TC 번호 (None이면 section_id 하위 전체)
+    """
+    global testrail_run_id
+    
+    if not TESTRAIL_SECTION_ID:
+        logger.error(f"TESTRAIL_SECTION_ID가 정의되지 않았습니다.")
+        raise RuntimeError("[TestRail] TESTRAIL_SECTION_ID가 정의되지 않았습니다.")
+    
+    # TESTRAIL_SECTION_ID를 정수로 변환
+    try:
+        section_id_int = int(TESTRAIL_SECTION_ID)
+    except (ValueError, TypeError):
+        raise RuntimeError(f"[TestRail] TESTRAIL_SECTION_ID '{TESTRAIL_SECTION_ID}'를 정수로 변환할 수 없습니다.")
+    
+    suite_cache = TestRailSuiteCache(testrail_get, TESTRAIL_PROJECT_ID, TESTRAIL_SUITE_ID)
+    if collected_case_ids is not None:
+        # 1. 수집된 시나리오의 TC 번호만 사용
+        all_case_ids = list(collected_case_ids)
+        run_scope = f"수집된 시나리오 TC {len(all_case_ids)}개"
+        print(f"[TestRail] 수집된 시나리오에서 TC {len(all_case_ids)}개 발견 (섹션 트리 조회 생략)")
+    else:
+        # 2. 섹션/케이스 목록 (디스크 캐시 + updated_after 증분 조회, utils.testrail_cache 참고)
+        all_sections, all_cases = suite_cache.load()
+        all_case_ids = _collect_subtree_case_ids(section_id_int, all_sections, all_cases)
+        run_scope = f"section_id '{section_id_int}' (하위 섹션 포함)"
     
-    # 4. Run 생성 (이름은 config.json의 testrail_run_name, 없으면 기본값)
+    # 3. Run 생성 (이름은 config.json의 testrail_run_name, 없으면 기본값)
     _ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     _run_name_tpl = (config.get("testrail_run_name") or "").strip()
     if not _run_name_tpl:
@@ -957,10 +1081,30 @@ def pytest_sessionstart(session):
     }
     try:
         logger.debug(f"TestRail Run 생성 시도: project_id={TESTRAIL_PROJECT_ID}, case_ids 개수={len(all_case_ids)}")
-        run = testrail_post(f"add_run/{TESTRAIL_PROJECT_ID}", payload)
+        try:
+            run = testrail_post(f"add_run/{TESTRAIL_PROJECT_ID}", payload)
+        except Exception as e:
+            if collected_case_ids is not None:
+                # 피처 파일에 스위트에 없는 TC 번호가 있을 수 있으므로 스위트 케이스와 대조 후 한 번 더 시도
+                logger.warning(f"수집된 TC로 Run 생성 실패, 스위트 케이스와 대조 후 재시도: {e}")
+                _, all_cases = suite_cache.load(force_full=True)
+                suite_case_ids = {c["id"] for c in all_cases}
+                unknown_case_ids = [case_id for case_id in all_case_ids if case_id not in suite_case_ids]
+                if unknown_case_ids:
+                    print(f"[TestRail] 스위트에 없는 TC 제외: {', '.join(f'C{case_id}' for case_id in unknown_case_ids)}")
+                all_case_ids = [case_id for case_id in all_case_ids if case_id in suite_case_ids]
+            elif suite_cache.used_cache:
+                # 캐시에 삭제/이동된 케이스가 남아 있을 수 있으므로 전체 조회 후 한 번 더 시도
+                logger.warning(f"캐시된 케이스로 Run 생성 실패, 전체 조회 후 재시도: {e}")
+                all_sections, all_cases = suite_cache.load(force_full=True)
+                all_case_ids = _collect_subtree_case_ids(section_id_int, all_sections, all_cases)
+            else:
+                raise
+            payload["case_ids"] = all_case_ids
+            run = testrail_post(f"add_run/{TESTRAIL_PROJECT_ID}", payload)
         testrail_run_id = run["id"]
-        print(f"[TestRail] section_id '{section_id_int}' (하위 섹션 포함) Run 생성 완료 (ID={testrail_run_id})")
-        logger.debug(f"pytest_sessionstart 완료: testrail_run_id={testrail_run_id}")
+        print(f"[TestRail] {run_scope} Run 생성 완료 (ID={testrail_run_id})")
+        logger.debug(f"Run 생성 완료: testrail_run_id={testrail_run_id}")
     except Exception as e:
         logger.error(f"TestRail Run 생성 실패: {e}")
         import traceback
@@ -977,6 +1121,8 @@ class TestLogHandler(logging.Handler):
     
     def emit(self, record):
         """로그 레코드를 수집"""
+        if record.threadName == REPORTER_THREAD_NAME:  # TestRail 기록 스레드 로그는 스텝 로그에 섞지 않음
+            return
         if record.levelno >= logging.INFO:  # INFO 이상만 수집
             log_message = self.format(record)
             self.logs.append(log_message)
@@ -1005,6 +1151,7 @@ def pytest_runtest_setup(item):
     global current_test_nodeid
     current_test_nodeid = item.nodeid
     test_log_handler.clear()
+    _resolve_shared_testrail_run_id(item.config)
     
     outcome = yield
 
@@ -1056,13 +1203,53 @@ def pytest_sessionfinish(session, exitstatus):
     전체 테스트 종료 후 Run 닫기
     """
     global testrail_run_id
-    if testrail_run_id and TESTRAIL_CLOSE_RUN_ON_FINISH:
+    # 대기 중인 결과를 모두 기록한 뒤 Run 닫기
+    if testrail_reporter.pending():
+        print(f"[TestRail] 대기 중인 결과 {testrail_reporter.pending()}건 기록 중...")
+    testrail_reporter.drain()
+    if testrail_reporter.stats['results'] or testrail_reporter.stats['failed']:
+        reporter_stats = testrail_reporter.stats
+        print(
+            f"[TestRail] 결과 {reporter_stats['results']}건, 첨부 {reporter_stats['attachments']}건 기록 "
+            f"(요청 {reporter_stats['requests']}회, 재시도 {reporter_stats['retries']}회, 실패 {reporter_stats['failed']}건)"
+        )
+    # xdist 워커는 Run을 닫지 않음 (모든 워커가 끝난 뒤 컨트롤러가 닫음)
+    closes_run = bool(testrail_run_id) and not is_xdist_worker(session.config)
+    if closes_run and TESTRAIL_CLOSE_RUN_ON_FINISH:
         testrail_post(f"close_run/{testrail_run_id}", {})
         print(f"[TestRail] Run {testrail_run_id} 종료 완료")
-    elif testrail_run_id and not TESTRAIL_CLOSE_RUN_ON_FINISH:
+    elif closes_run and not TESTRAIL_CLOSE_RUN_ON_FINISH:
         print(f"[TestRail] testrail_close_run_on_finish가 N — Run 자동 종료 생략 (Run ID={testrail_run_id})")
+    if testrail_client is not None:
+        testrail_client.close()
 
-    screenshots_dir = "screenshots"
+    registry_stats = get_schema_registry().stats()
+    print(
+        f"[SchemaRegistry] hits={registry_stats['hits']}, misses={registry_stats['misses']}, "
+        f"entries={registry_stats['entries']}"
+    )
+    latency_recorder = get_latency_recorder()
+    latency_report_path = latency_recorder.write_report()
+    for event_type, stats in latency_recorder.summary().items():
+        print(
+            f"[BeaconLatency] {event_type}: n={stats['count']}, p50={stats['p50']:.0f}ms, "
+            f"p95={stats['p95']:.0f}ms, p99={stats['p99']:.0f}ms"
+        )
+    if latency_report_path:
+        print(f"[BeaconLatency] 리포트 저장: {latency_report_path}")
+
+    validation_cache_stats = get_validation_cache_stats()
+    print(
+        f"[ValidationCache] hits={validation_cache_stats['hits']}, "
+        f"misses={validation_cache_stats['misses']}"
+    )
+
+    # xdist 워커는 자기 폴더(screenshots/<워커 ID>)만 정리, 전체 폴더는 컨트롤러(또는 단일 프로세스)가 정리
+    screenshots_dir = os.path.join("screenshots", get_worker_id()) if get_worker_id() else "screenshots"
     if os.path.exists(screenshots_dir):
         shutil.rmtree(screenshots_dir)  # 폴더 통째로 삭제
         print(f"[CLEANUP] '{screenshots_dir}' 폴더 삭제 완료")
+
+    shared_dir = getattr(session.config, "_tracking_shared_dir", None)
+    if shared_dir:
+        shutil.rmtree(shared_dir, ignore_errors=True)
@@ -12,6 +12,7 @@ Feature: G마켓 SRP 트래킹 로그 정합성 검증
     Then 모든 트래킹 로그를 JSON 파일로 저장함
     Then Module Exposure 로그가 정합성 검증을 통과해야 함 (TC: C1166807)
     And Product Exposure 로그가 정합성 검증을 통과해야 함 (TC: C1166808)
+    And Product Exposure 노출 위치 정합성 검증을 통과해야 함 (TC: C1166808)
     And Product Click 로그가 정합성 검증을 통과해야 함 (TC: C1166810)
     And Product ATC Click 로그가 정합성 검증을 통과해야 함 (TC: C1166811)
 
@@ -27,6 +28,7 @@ Feature: G마켓 SRP 트래킹 로그 정합성 검증
     Then 모든 트래킹 로그를 JSON 파일로 저장함
     Then Module Exposure 로그가 정합성 검증을 통과해야 함 (TC: <tc_module_exposure>)
     And Product Exposure 로그가 정합성 검증을 통과해야 함 (TC: <tc_product_exposure>)
+    And Product Exposure 노출 위치 정합성 검증을 통과해야 함 (TC: <tc_product_exposure>)
     And Product Click 로그가 정합성 검증을 통과해야 함 (TC: <tc_product_click>)
     And Product ATC Click 로그가 정합성 검증을 통과해야 함 (TC: <tc_atc_click>)
 
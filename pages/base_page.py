@@ -3,13 +3,29 @@ Base Page Object 클래스
 모든 Page Object의 기본이 되는 클래스
 """
 from playwright.sync_api import Page, Locator, expect
-from typing import Optional
+from typing import Optional, List, Dict, Any
 from urllib.parse import unquote, parse_qs, urlparse
 import logging
 import time
 import re
+from contextlib import contextmanager
+from utils.beacon_latency import (
+    adaptive_timeout_ms,
+    get_latency_recorder,
+    tab_load_latency_type,
+    ACTION_CLICK,
+    ACTION_NAVIGATION,
+    ACTION_SCROLL,
+    TAB_OPEN_LATENCY,
+)
+from utils.NetworkTracker import get_page_tracker, mark_page_action
+from utils.tracking_idle import wait_for_tracker_idle
 logger = logging.getLogger(__name__)
 
+# 지연 측정값이 없을 때 사용할 기본 대기 시간 (ms)
+PDP_PV_WAIT_TIMEOUT_MS = 15000
+NEW_PAGE_TIMEOUT_MS = 30000
+
 
 class BasePage:
     """모든 Page Object의 기본 클래스"""
@@ -24,6 +40,63 @@ class BasePage:
         self.page = page
         self.timeout = 30000  # 기본 타임아웃 30초
     
+    def _mark_action(self, kind: str, label: Optional[str] = None) -> None:
+        """
+        실제 클릭/이동/스크롤 직전 동작 시각 기록 (동작 → 비콘 지연 측정용, 트래킹 중이 아니면 무시)
+        
+        Args:
+            kind: ACTION_CLICK, ACTION_NAVIGATION, ACTION_SCROLL
+            label: 동작 설명 (선택자, URL 등)
+        """
+        mark_page_action(self.page, kind, label)
+    
+    def wait_for_tracking_idle(self, fallback_seconds: float, quiet_ms: Optional[int] = None, expect_type: Optional[str] = None) -> None:
+        """
+        동작 후 비콘 안정화 대기 (page의 컨텍스트에서 트래킹 중인 tracker 기준, 없으면 fallback_seconds 고정 대기)
+        
+        Args:
+            fallback_seconds: 기존 고정 대기 시간 (초), 대기 상한
+            quiet_ms: 비콘 없이 지나야 하는 시간 (ms)
+            expect_type: 지정하면 이 타입 비콘이 들어온 뒤에만 유휴로 판단
+        """
+        wait_for_tracker_idle(get_page_tracker(self.page), fallback_seconds, quiet_ms, expect_type)
+    
+    @contextmanager
+    def expect_new_page(self, default_timeout_ms: int = NEW_PAGE_TIMEOUT_MS):
+        """
+        블록 안의 클릭으로 열리는 새 탭 대기 (context.expect_page)
+        타임아웃은 측정된 새 탭 열림 지연 p99 + 여유, 측정값이 없으면 default_timeout_ms
+        새 탭이 열리면 소요 시간을 지연 리포트에 기록
+        
+        Args:
+            default_timeout_ms: 측정값이 없을 때 타임아웃 (ms)
+        
+        Example:
+            with self.expect_new_page() as new_page_info:
+                locator.click()
+            new_page = new_page_info.value
+        """
+        started_at = time.time()
+        with self.page.context.expect_page(timeout=adaptive_timeout_ms(TAB_OPEN_LATENCY, default_timeout_ms)) as new_page_info:
+            yield new_page_info
+        get_latency_recorder().record(TAB_OPEN_LATENCY, (time.time() - started_at) * 1000.0, ACTION_CLICK)
+    
+    @staticmethod
+    def wait_for_new_page_load_state(new_page: Page, state: str, default_timeout_ms: int = NEW_PAGE_TIMEOUT_MS) -> None:
+        """
+        새 탭 load state 대기
+        타임아웃은 측정된 state별 새 탭 로드 지연 p99 + 여유, 측정값이 없으면 default_timeout_ms
+        
+        Args:
+            new_page: 새 탭 Page
+            state: 'domcontentloaded', 'load', 'networkidle'
+            default_timeout_ms: 측정값이 없을 때 타임아웃 (ms)
+        """
+        latency_type = tab_load_latency_type(state)
+        started_at = time.time()
+        new_page.wait_for_load_state(state, timeout=adaptive_timeout_ms(latency_type, default_timeout_ms))
+        get_latency_recorder().record(latency_type, (time.time() - started_at) * 1000.0)
+    
     def goto(self, url: str) -> None:
         """
         페이지로 이동
@@ -32,6 +105,7 @@ class BasePage:
             url: 이동할 URL
         """
         logger.info(f"페이지 이동: {url}")
+        self._mark_action(ACTION_NAVIGATION, url)
         self.page.goto(url, wait_until="domcontentloaded")
 
     def go_back(self, timeout: Optional[int] = None) -> None:
@@ -56,6 +130,7 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         logger.debug(f"클릭: {selector}")
+        self._mark_action(ACTION_CLICK, selector)
         self.page.locator(selector).click(timeout=timeout)
     
     def fill(self, selector: str, value: str, timeout: Optional[int] = None) -> None:
@@ -309,6 +384,7 @@ class BasePage:
             module_locator: 모듈 Locator 객체
         """
         logger.debug("모듈 스크롤")
+        self._mark_action(ACTION_SCROLL)
         try:
             module_locator.scroll_into_view_if_needed()
         except Exception as e:
@@ -323,6 +399,7 @@ class BasePage:
             module_locator: 모듈 Locator 객체
         """
         logger.debug("모듈 스크롤")
+        self._mark_action(ACTION_SCROLL)
         try:
             module_locator.evaluate("el => el.scrollIntoView({ block: 'end', inline: 'nearest' })")
         except Exception as e:
@@ -357,6 +434,7 @@ class BasePage:
             product_locator: 상품 Locator 객체
         """
         logger.debug("상품 요소 스크롤")
+        self._mark_action(ACTION_SCROLL)
         try:
             product_locator.scroll_into_view_if_needed()
         except Exception as e:
@@ -371,6 +449,7 @@ class BasePage:
             product_locator: 상품 Locator 객체
         """
         logger.debug("상품 요소 스크롤")
+        self._mark_action(ACTION_SCROLL)
         try:
             product_locator.scroll_into_view_if_needed()
         except Exception as e:
@@ -403,6 +482,47 @@ class BasePage:
         logger.debug(f"상품 번호로 상품 찾기: {goodscode}")
         return self.page.locator(f'a[data-montelena-goodscode="{goodscode}"]').nth(0)
 
+    def get_product_bounding_boxes(self, module_locator: Locator) -> List[Dict[str, Any]]:
+        """
+        모듈 내 모든 상품 요소의 위치 정보를 한 번의 evaluate로 수집
+        (상품별 bounding_box 호출 대비 브라우저 왕복 1회)
+
+        Args:
+            module_locator: 모듈 Locator 객체
+
+        Returns:
+            상품별 위치 정보 리스트 (같은 상품 번호는 첫 요소만)
+            [{"goodscode", "x", "y", "w", "h", "visible_ratio"}, ...]
+            - x, y: 문서 기준 좌표 (스크롤 위치 포함)
+            - visible_ratio: 현재 뷰포트에 보이는 면적 비율 (0~1)
+        """
+        logger.debug("모듈 내 상품 위치 정보 수집")
+        return module_locator.first.evaluate(
+            """root => {
+                const vw = window.innerWidth, vh = window.innerHeight;
+                const seen = new Set();
+                const boxes = [];
+                for (const el of root.querySelectorAll('[data-montelena-goodscode]')) {
+                    const code = el.getAttribute('data-montelena-goodscode');
+                    if (!code || seen.has(code)) continue;
+                    seen.add(code);
+                    const r = el.getBoundingClientRect();
+                    const area = r.width * r.height;
+                    const iw = Math.max(0, Math.min(r.right, vw) - Math.max(r.left, 0));
+                    const ih = Math.max(0, Math.min(r.bottom, vh) - Math.max(r.top, 0));
+                    boxes.push({
+                        goodscode: code,
+                        x: r.left + window.scrollX,
+                        y: r.top + window.scrollY,
+                        w: r.width,
+                        h: r.height,
+                        visible_ratio: area > 0 ? (iw * ih) / area : 0,
+                    });
+                }
+                return boxes;
+            }"""
+        )
+
     def get_by_role_and_click(self, role: str, name: str = None, timeout: Optional[int] = None, **kwargs) -> None:
         """
         역할 기반 로케이터로 요소 찾아서 클릭
@@ -415,6 +535,7 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         logger.debug(f"역할 기반 클릭: role={role}, name={name}")
+        self._mark_action(ACTION_CLICK, f"role={role}, name={name}")
         self.get_by_role(role, name=name, **kwargs).click(timeout=timeout)
     
     def get_by_role_and_fill(self, role: str, value: str, name: str = None, timeout: Optional[int] = None, **kwargs) -> None:
@@ -443,6 +564,7 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         logger.debug(f"텍스트 기반 클릭: text={text}")
+        self._mark_action(ACTION_CLICK, text)
         self.get_by_text(text, exact=exact).click(timeout=timeout)
     
     def click_and_expect_dialog(self, selector: str = None, locator: Locator = None, timeout: Optional[int] = None, accept: bool = True) -> None:
@@ -496,6 +618,7 @@ class BasePage:
             # 클릭 실행
             if locator:
                 logger.debug("Locator를 사용하여 클릭")
+                self._mark_action(ACTION_CLICK)
                 locator.click(timeout=timeout)
             else:
                 logger.debug(f"Selector를 사용하여 클릭: {selector}")
@@ -573,7 +696,7 @@ class BasePage:
     # ============================================
     
     @staticmethod
-    def wait_until_pdp_pv_collected(tracker, goodscode: str, page: Page, timeout_ms: int = 15000, poll_interval: float = 0.3) -> None:
+    def wait_until_pdp_pv_collected(tracker, goodscode: str, page: Page, timeout_ms: Optional[int] = None, poll_interval: float = 0.3) -> None:
         """
         PDP PV 로그 수집이 확인될 때까지 폴링
         해당 goodscode에 대한 PDP PV 로그 수신 시 logger.info 출력 후 종료
@@ -582,9 +705,11 @@ class BasePage:
             tracker: NetworkTracker 인스턴스
             goodscode: 상품 코드
             page: Playwright Page 객체
-            timeout_ms: 타임아웃 (밀리초, 기본값: 15000)
+            timeout_ms: 타임아웃 (밀리초, None이면 측정된 PDP PV 지연 p99 + 여유, 측정값이 없으면 15000)
             poll_interval: 폴링 간격 (초, 기본값: 0.3)
         """
+        if timeout_ms is None:
+            timeout_ms = adaptive_timeout_ms('PDP PV', PDP_PV_WAIT_TIMEOUT_MS)
         try:
             page.wait_for_load_state("domcontentloaded", timeout=3000)
         except Exception:
@@ -597,7 +722,7 @@ class BasePage:
                 return
             time.sleep(poll_interval)
         logger.warning(f"PDP PV 수집 대기 타임아웃 ({timeout_ms}ms): goodscode={goodscode}")
-        time.sleep(2)
+        wait_for_tracker_idle(tracker, 2)
 
     def get_module_by_spmc(self, module_spmc: str) -> Locator:
         """
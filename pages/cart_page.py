@@ -1,7 +1,7 @@
-import time
 import logging
 import json
 from pages.base_page import BasePage
+from utils.beacon_latency import ACTION_CLICK, ACTION_NAVIGATION
 from playwright.sync_api import Page, Locator, expect
 from utils.urls import product_url, search_url, cart_url
 from typing import Optional
@@ -24,6 +24,7 @@ class CartPage(BasePage):
         장바구니 페이지로 이동
         """
         logger.debug("장바구니 페이지로 이동")
+        self._mark_action(ACTION_NAVIGATION, cart_url())
         self.page.goto(cart_url(), wait_until="domcontentloaded", timeout=30000)
         logger.info("장바구니 페이지 이동 완료")
     
@@ -32,6 +33,7 @@ class CartPage(BasePage):
         상품 페이지로 이동
         """
         logger.debug("장바구니 페이지로 이동")
+        self._mark_action(ACTION_NAVIGATION, product_url(goodscode))
         self.page.goto(product_url(goodscode), wait_until="domcontentloaded", timeout=30000)
         logger.info("장바구니 페이지 이동 완료")
 
@@ -55,6 +57,7 @@ class CartPage(BasePage):
         logger.debug("장바구니 버튼이 화면에 보이도록 스크롤 완료")
         
         # 버튼 클릭
+        self._mark_action(ACTION_CLICK)
         buy_button.click(timeout=timeout)
         logger.info("장바구니 버튼 클릭 완료")
 
@@ -83,6 +86,7 @@ class CartPage(BasePage):
         logger.debug("그룹 옵션레이어 화면에 보이도록 스크롤 완료")
         
         # 그룹 옵션레이어 클릭
+        self._mark_action(ACTION_CLICK)
         group_product_layer.click(timeout=timeout)
         logger.debug("그룹 옵션레이어 클릭 완료")
 
@@ -98,9 +102,11 @@ class CartPage(BasePage):
         logger.debug("n번쨰 그룹상품 화면에 보이도록 스크롤 완료")
         
         # n번쨰 그룹상품 클릭
+        self._mark_action(ACTION_CLICK)
         group_product.click(timeout=timeout)
 
         # 선택 버튼 클릭
+        self._mark_action(ACTION_CLICK)
         self.page.get_by_text("선택", exact=True).nth(0).click()
         logger.info("n번쨰 그룹상품 선택택 완료")
 
@@ -154,11 +160,13 @@ class CartPage(BasePage):
             logger.debug("장바구니로 버튼 클릭 시도")
             btn.wait_for(state="attached", timeout=timeout)
             btn.scroll_into_view_if_needed(timeout=timeout)
+            self._mark_action(ACTION_CLICK)
             btn.click(timeout=timeout)
         except Exception as e:
             logger.debug("장바구니로 버튼 클릭 실패, 헤더 장바구니 링크로 대체: %s", e)
             link.wait_for(state="attached", timeout=timeout)
             link.scroll_into_view_if_needed(timeout=timeout)
+            self._mark_action(ACTION_CLICK)
             link.click(timeout=timeout)
 
         logger.info("장바구니 페이지로 이동 완료")
@@ -246,6 +254,7 @@ class CartPage(BasePage):
         상품 클릭
         """
         logger.debug(f"상품 클릭: {product_locator}")
+        self._mark_action(ACTION_CLICK)
         product_locator.click()
         logger.info("상품 클릭 완료")
 
@@ -254,6 +263,7 @@ class CartPage(BasePage):
         모듈 내 장바구니 버튼 클릭
         """
         logger.debug(f"모듈 내 장바구니 버튼 클릭: {goodscode}")
+        self._mark_action(ACTION_CLICK)
         self.page.locator(f'.button__cart[data-montelena-goodscode="{goodscode}"]').nth(0).click()
         logger.info("모듈 내 장바구니 버튼 클릭 완료")
 
@@ -275,21 +285,21 @@ class CartPage(BasePage):
         # 버튼이 존재하지 않으면 성공
         if button_locator.count() == 0:
             logger.info(f"장바구니 담기 완료 확인됨: {goodscode} (버튼 없음)")
-            # ATC 이벤트 수집을 위한 대기 시간
-            time.sleep(1.5)
+            # ATC 이벤트 수집을 위한 대기 (비콘이 멈추면 바로 진행, 최대 1.5초)
+            self.wait_for_tracking_idle(1.5)
             return
         
         # 버튼이 보이지 않을 때까지 대기 (또는 이미 숨겨져 있으면 성공)
         try:
             button_locator.first.wait_for(state="hidden", timeout=timeout)
             logger.info(f"장바구니 담기 완료 확인됨: {goodscode} (버튼 숨김)")
-            # ATC 이벤트 수집을 위한 대기 시간
-            time.sleep(1.5)
+            # ATC 이벤트 수집을 위한 대기 (비콘이 멈추면 바로 진행, 최대 1.5초)
+            self.wait_for_tracking_idle(1.5)
         except Exception:
             # 타임아웃 후에도 버튼이 보이면 실패
             if button_locator.first.is_visible():
                 raise AssertionError(f"장바구니 버튼이 여전히 보입니다: {goodscode}")
             # 보이지 않으면 성공
             logger.info(f"장바구니 담기 완료 확인됨: {goodscode}")
-            # ATC 이벤트 수집을 위한 대기 시간
-            time.sleep(1.5)
\ No newline at end of file
+            # ATC 이벤트 수집을 위한 대기 (비콘이 멈추면 바로 진행, 최대 1.5초)
+            self.wait_for_tracking_idle(1.5)
\ No newline at end of file
@@ -2,6 +2,7 @@
 G마켓 홈 페이지 객체
 """
 from pages.base_page import BasePage
+from utils.beacon_latency import ACTION_CLICK
 from playwright.sync_api import Page
 from utils.urls import base_url
 import logging
@@ -64,10 +65,12 @@ class HomePage(BasePage):
         
         # 클릭 시도
         try:
+            self._mark_action(ACTION_CLICK)
             search_button.click(timeout=5000)
             logger.debug("일반 클릭 성공")
         except Exception as e:
             logger.warning(f"일반 클릭 실패, force 클릭 시도: {e}")
+            self._mark_action(ACTION_CLICK)
             search_button.click(force=True)
             logger.debug("force 클릭 완료")
         
@@ -107,10 +110,12 @@ class HomePage(BasePage):
         
         # 클릭 시도
         try:
+            self._mark_action(ACTION_CLICK)
             login_button.click(timeout=5000)
             logger.debug("일반 클릭 성공")
         except Exception as e:
             logger.warning(f"일반 클릭 실패, force 클릭 시도: {e}")
+            self._mark_action(ACTION_CLICK)
             login_button.click(force=True)
             logger.debug("force 클릭 완료")
         
@@ -2,6 +2,7 @@ import time
 import logging
 import json
 from pages.base_page import BasePage
+from utils.beacon_latency import ACTION_NAVIGATION
 from playwright.sync_api import Page, Locator, expect
 from utils.urls import item_base_url, list_url
 from typing import Optional
@@ -28,6 +29,7 @@ class ListPage(BasePage):
         """
         logger.debug(f"LP 페이지 이동: category_id={category_id}")
         list_page_url = list_url(category_id)
+        self._mark_action(ACTION_NAVIGATION, list_page_url)
         self.page.goto(list_page_url, wait_until="domcontentloaded", timeout=30000)
         logger.info(f"LP 페이지 이동 완료: category_id={category_id}")
 
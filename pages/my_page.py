@@ -2,6 +2,7 @@ import time
 import logging
 import json
 from pages.base_page import BasePage
+from utils.beacon_latency import ACTION_CLICK
 from playwright.sync_api import Page, Locator, expect
 # from utils.urls import my_url
 from typing import Optional
@@ -41,6 +42,7 @@ class MyPage(BasePage):
         동일 링크가 2개 있을 수 있어 첫 번째 요소만 클릭.
         """
         logger.info("주문내역 버튼 클릭")
+        self._mark_action(ACTION_CLICK)
         self.page.locator(".text__menu:has-text('주문내역')").first.click()
 
     def is_order_history_page_displayed(self):
@@ -76,6 +78,7 @@ class MyPage(BasePage):
         주문내역에서 상품코드로 담기버튼 클릭
         """
         logger.debug(f"주문내역에서 상품코드로 담기버튼 클릭: {goodscode}")
+        self._mark_action(ACTION_CLICK)
         self.page.locator(f".button__cart[data-montelena-goodscode='{goodscode}']").click()
 
     def atc_alert_close(self):
@@ -92,6 +95,7 @@ class MyPage(BasePage):
         logger.debug(f"주문내역에서 상품코드로 상품 클릭: {goodscode}")
         loc = self.page.locator(f"{self._ORDER_ITEM_IMG}[data-montelena-goodscode='{goodscode}']").first
         self._scroll_order_item_into_view(loc)
+        self._mark_action(ACTION_CLICK)
         loc.click()
 
     def click_product_in_order_history_and_wait_new_page(self, goodscode: str) -> Page:
@@ -113,7 +117,8 @@ class MyPage(BasePage):
         time.sleep(3)
 
         try:
-            with self.page.context.expect_page(timeout=5000) as new_page_info:
+            with self.expect_new_page(5000) as new_page_info:
+                self._mark_action(ACTION_CLICK)
                 product_locator.click(force=True, timeout=3000)
 
             new_page = new_page_info.value
@@ -130,7 +135,8 @@ class MyPage(BasePage):
                     logger.debug("팝업 닫기 버튼 클릭 완료")
                     time.sleep(2)
 
-                with self.page.context.expect_page(timeout=10000) as new_page_info:
+                with self.expect_new_page(10000) as new_page_info:
+                    self._mark_action(ACTION_CLICK)
                     product_locator.click(force=True, timeout=3000)
 
                 new_page = new_page_info.value
@@ -143,7 +149,7 @@ class MyPage(BasePage):
         logger.debug("새 탭을 포커스로 가져옴")
 
         try:
-            new_page.wait_for_load_state("domcontentloaded", timeout=30000)
+            self.wait_for_new_page_load_state(new_page, "domcontentloaded")
             logger.debug("새 탭 DOM 로드 완료")
         except Exception as e:
             logger.warning(f"domcontentloaded 대기 실패: {e}")
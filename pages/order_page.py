@@ -2,6 +2,7 @@ import time
 import logging
 import json
 from pages.base_page import BasePage
+from utils.beacon_latency import ACTION_NAVIGATION
 from playwright.sync_api import Page, Locator, expect
 from utils.urls import product_url, cart_url, order_complete_url
 from typing import Optional
@@ -27,6 +28,7 @@ class OrderPage(BasePage):
             cart_num: 장바구니 번호
         """
         logger.debug("주문완료 페이지로 이동")
+        self._mark_action(ACTION_NAVIGATION, order_complete_url(cart_num))
         self.page.goto(order_complete_url(cart_num), wait_until="domcontentloaded", timeout=30000)
         logger.info("주문완료 페이지 이동 완료")
 
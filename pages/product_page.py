@@ -4,6 +4,7 @@
 from pages.base_page import BasePage
 from playwright.sync_api import Page, Locator, TimeoutError, expect
 from utils.urls import product_url
+from utils.beacon_latency import ACTION_CLICK, ACTION_NAVIGATION
 from typing import Optional
 import logging
 
@@ -31,6 +32,7 @@ class ProductPage(BasePage):
             goodscode: 상품번호
         """
         logger.debug(f'페이지 이동 시작: goodscode={goodscode}')
+        self._mark_action(ACTION_NAVIGATION, product_url(goodscode))
         self.page.goto(product_url(goodscode), wait_until="domcontentloaded")
         logger.info(f'페이지 이동 완료: goodscode={goodscode}')
 
@@ -79,6 +81,7 @@ class ProductPage(BasePage):
         logger.debug("구매하기 버튼이 화면에 보이도록 스크롤 완료")
         
         # 버튼 클릭
+        self._mark_action(ACTION_CLICK)
         buy_button.click(timeout=timeout)
         logger.debug("구매하기 버튼 클릭 완료")
 
@@ -107,6 +110,7 @@ class ProductPage(BasePage):
         logger.debug("그룹 옵션레이어 화면에 보이도록 스크롤 완료")
         
         # 그룹 옵션레이어 클릭
+        self._mark_action(ACTION_CLICK)
         group_product_layer.click(timeout=timeout)
         logger.debug("그룹 옵션레이어 클릭 완료")
 
@@ -122,9 +126,11 @@ class ProductPage(BasePage):
         logger.debug("n번쨰 그룹상품 화면에 보이도록 스크롤 완료")
         
         # n번쨰 그룹상품 클릭
+        self._mark_action(ACTION_CLICK)
         group_product.click(timeout=timeout)
 
         # 선택 버튼 클릭
+        self._mark_action(ACTION_CLICK)
         self.page.get_by_text("선택", exact=True).nth(0).click()
         logger.debug("n번쨰 그룹상품 선택택 완료")
 
@@ -135,6 +141,7 @@ class ProductPage(BasePage):
         """
 
         # 선택 버튼 클릭
+        self._mark_action(ACTION_CLICK)
         self.page.locator(".vip-detailoption_wrap").locator(".bt_select").click()
         logger.debug("연관상품 상세보기 선택 버튼 클릭 완료")
        
@@ -225,7 +232,7 @@ class ProductPage(BasePage):
             새 페이지 정보를 담은 컨텍스트 매니저
         """
         logger.debug("새 페이지 대기")
-        return self.page.context.expect_page()
+        return self.expect_new_page()
     
     def hover_product(self, product_locator: Locator) -> None:
         """
@@ -245,6 +252,7 @@ class ProductPage(BasePage):
             product_locator: 상품 Locator 객체
         """
         logger.debug("상품 클릭")
+        self._mark_action(ACTION_CLICK)
         product_locator.click()
 
     def click_product_and_wait_new_page(self, product_locator: Locator) -> Page:
@@ -261,7 +269,8 @@ class ProductPage(BasePage):
         logger.debug("상품 클릭 및 새 탭 대기")
 
         # 새 탭이 생성될 때까지 대기
-        with self.page.context.expect_page() as new_page_info:
+        with self.expect_new_page() as new_page_info:
+            self._mark_action(ACTION_CLICK)
             product_locator.click()
         
         new_page = new_page_info.value
@@ -274,7 +283,7 @@ class ProductPage(BasePage):
         # 새 탭이 실제로 로드되고 제어 가능한 상태가 될 때까지 대기
         # 1. domcontentloaded: DOM이 로드되면 완료 (가장 빠름)
         try:
-            new_page.wait_for_load_state("domcontentloaded", timeout=30000)
+            self.wait_for_new_page_load_state(new_page, "domcontentloaded")
             logger.debug("새 탭 DOM 로드 완료")
         except Exception as e:
             logger.warning(f"domcontentloaded 대기 실패: {e}")
@@ -436,6 +445,7 @@ class ProductPage(BasePage):
         logger.debug(f"셀렉트 박스 옵션 선택: {cnt}")
         option_box = locator.locator(f"#optOrderSelOptNo_{cnt}").locator("xpath=/..")
         option_selector = option_box.locator("li").nth(0)
+        self._mark_action(ACTION_CLICK)
         option_box.click()
         option_selector.click()
         logger.info("셀렉트 박스 옵션 선택 완료")
@@ -484,4 +494,5 @@ class ProductPage(BasePage):
         """
         timeout = timeout or self.timeout
         logger.debug(f"텍스트 기반 클릭: text={text}")
+        self._mark_action(ACTION_CLICK)
         self.get_by_text(text, exact=exact).nth(cnt).click(timeout=timeout)
\ No newline at end of file
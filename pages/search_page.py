@@ -4,6 +4,7 @@ import json
 from pages.base_page import BasePage
 from playwright.sync_api import Page, Locator, expect
 from utils.urls import item_base_url, search_url
+from utils.beacon_latency import ACTION_CLICK, ACTION_NAVIGATION
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,7 @@ class SearchPage(BasePage):
         """
         logger.debug(f'검색 시작: keyword={keyword}')
         self.page.fill("input[name='keyword']", keyword)
+        self._mark_action(ACTION_NAVIGATION)
         self.page.press("input[name='keyword']", "Enter")
         logger.info(f'검색 완료: keyword={keyword}')
 
@@ -186,20 +188,20 @@ class SearchPage(BasePage):
         """
         logger.debug(f'상품 클릭 시작: goodscode={goodscode}')
         element = self.page.locator(f'a[data-montelena-goodscode="{goodscode}"]').nth(0)
-        # 새 페이지 대기
-        time.sleep(5)
-        with self.page.context.expect_page() as new_page_info:
+        # 새 탭 대기 (click()이 요소가 클릭 가능해질 때까지 자동 대기하므로 고정 대기 없음)
+        with self.expect_new_page() as new_page_info:
+            self._mark_action(ACTION_CLICK)
             element.click()
         new_page = new_page_info.value
         
         # 새 페이지가 완전히 로드될 때까지 대기 (네트워크 요청이 완료될 때까지)
         try:
-            new_page.wait_for_load_state('networkidle', timeout=5000)
+            self.wait_for_new_page_load_state(new_page, 'networkidle', 5000)
             logger.debug(f'새 페이지 네트워크 로딩 완료: {goodscode}')
         except Exception as e:
             # networkidle이 타임아웃되면 load 상태만 확인
             logger.debug(f'networkidle 대기 실패, load 상태로 대기: {e}')
-            new_page.wait_for_load_state('load', timeout=30000)
+            self.wait_for_new_page_load_state(new_page, 'load')
             logger.debug(f'새 페이지 로딩 완료: {goodscode}')
         
         url = new_page.url
@@ -291,7 +293,7 @@ class SearchPage(BasePage):
         
         # 새 탭이 열리는지 확인
         try:
-            with self.page.context.expect_page(timeout=timeout) as new_page_info:
+            with self.expect_new_page(timeout) as new_page_info:
                 self.click(self.FIRST_PRODUCT, timeout=timeout)
             
             new_page = new_page_info.value
@@ -304,7 +306,7 @@ class SearchPage(BasePage):
                 
                 # 새 탭이 실제로 로드되고 제어 가능한 상태가 될 때까지 대기
                 try:
-                    new_page.wait_for_load_state("domcontentloaded", timeout=30000)
+                    self.wait_for_new_page_load_state(new_page, "domcontentloaded")
                     logger.debug("새 탭 DOM 로드 완료")
                 except Exception as e:
                     logger.warning(f"domcontentloaded 대기 실패: {e}")
@@ -407,6 +409,7 @@ class SearchPage(BasePage):
         toggle = self.page.locator(".button__toggle-sort").first
         toggle.scroll_into_view_if_needed()
         toggle.wait_for(state="visible", timeout=3000)
+        self._mark_action(ACTION_CLICK)
         toggle.click(force=True)
 
         # 드롭다운/레이어가 뜬 뒤 해당 텍스트 옵션을 선택
@@ -414,16 +417,18 @@ class SearchPage(BasePage):
         try:
             option.wait_for(state="visible", timeout=3000)
             option.scroll_into_view_if_needed()
+            self._mark_action(ACTION_CLICK)
             option.click(force=True)
         except Exception:
             # 마크업이 바뀌었거나 다른 클래스명을 사용하는 경우를 위한 fallback
             option_fallback = self.page.get_by_text(module_title, exact=True).first
             option_fallback.scroll_into_view_if_needed()
             option_fallback.wait_for(state="visible", timeout=3000)
+            self._mark_action(ACTION_CLICK)
             option_fallback.click(force=True)
 
-        # UI가 안정화될 시간을 짧게 부여 (대기/리렌더 타이밍 완충)
-        time.sleep(3)
+        # 정렬 변경 후 리렌더·노출 비콘 안정화 대기 (비콘이 멈추면 바로 진행, 최대 3초)
+        self.wait_for_tracking_idle(3)
 
     def get_product_in_module_type2(self, parent_locator: Locator) -> Locator:
         """
@@ -459,7 +464,7 @@ class SearchPage(BasePage):
             새 페이지 정보를 담은 컨텍스트 매니저
         """
         logger.debug("새 페이지 대기")
-        return self.page.context.expect_page()
+        return self.expect_new_page()
 
     def click_add_to_cart_button(self, module_locator: Locator, goodscode: str):
         """
@@ -468,6 +473,7 @@ class SearchPage(BasePage):
         Args:
             goodscode: 상품 번호
         """
+        self._mark_action(ACTION_CLICK)
         module_locator.locator(f'.button__cart[data-montelena-goodscode="{goodscode}"]').nth(0).click()
         logger.debug(f"장바구니 담기 클릭: {goodscode}")
         try:
@@ -531,7 +537,8 @@ class SearchPage(BasePage):
         
         # 일반 클릭 시도
         try:
-            with self.page.context.expect_page(timeout=5000) as new_page_info:
+            with self.expect_new_page(5000) as new_page_info:
+                self._mark_action(ACTION_CLICK)
                 product_locator.click(force=True, timeout=3000)
             
             new_page = new_page_info.value
@@ -548,7 +555,8 @@ class SearchPage(BasePage):
                         logger.warning(f"팝업 닫기 버튼 클릭 실패: {ep2}")
                     logger.debug("팝업 닫기 버튼 클릭 완료")
                     time.sleep(2)
-                with self.page.context.expect_page(timeout=10000) as new_page_info:
+                with self.expect_new_page(10000) as new_page_info:
+                    self._mark_action(ACTION_CLICK)
                     product_locator.click(force=True, timeout=3000)
                 new_page = new_page_info.value
                 logger.debug(f"팝업 닫기 후 새 탭 생성됨: {new_page.url}")
@@ -562,7 +570,7 @@ class SearchPage(BasePage):
         # 새 탭이 실제로 로드되고 제어 가능한 상태가 될 때까지 대기
         # 1. domcontentloaded: DOM이 로드되면 완료 (가장 빠름)
         try:
-            new_page.wait_for_load_state("domcontentloaded", timeout=30000)
+            self.wait_for_new_page_load_state(new_page, "domcontentloaded")
             logger.debug("새 탭 DOM 로드 완료")
         except Exception as e:
             logger.warning(f"domcontentloaded 대기 실패: {e}")
@@ -601,6 +609,7 @@ class SearchPage(BasePage):
             keyword: 검색어
         """
         top_search_module_url = search_url(keyword)+ f"&jaehuid=200018252&itemno={goodscode}"
+        self._mark_action(ACTION_NAVIGATION, top_search_module_url)
         self.page.goto(top_search_module_url, wait_until="domcontentloaded", timeout=30000)
 
     def check_ad_item_in_srp_lp_module(self, modulel_title: str) -> str:
@@ -695,8 +704,10 @@ class SearchPage(BasePage):
 
         filter_button.wait_for(state="visible", timeout=10000)
         filter_button.scroll_into_view_if_needed()
+        self._mark_action(ACTION_CLICK)
         filter_button.click()
-        time.sleep(3)
+        # 필터 적용 후 결과 리렌더·노출 비콘 안정화 대기 (최대 3초)
+        self.wait_for_tracking_idle(3)
 
     def close_popup(self):
         """
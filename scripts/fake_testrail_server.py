@@ -0,0 +1,266 @@
+"""
+로컬 TestRail 대체 서버
+테스트에서 사용하는 TestRail API만 메모리로 흉내 내어, TestRail 없이 리포터 동작 확인 및 성능 측정에 사용
+
+지원 엔드포인트 (index.php?/api/v2/...):
+- GET  get_sections/<project_id>&suite_id=
+- GET  get_cases/<project_id>&suite_id=&limit=&offset=&updated_after=
+- POST add_run/<project_id>
+- POST add_result_for_case/<run_id>/<case_id>
+- POST add_results_for_cases/<run_id>
+- POST add_attachment_to_result/<result_id>
+- POST close_run/<run_id>
+
+사용 예:
+    python scripts/fake_testrail_server.py --port 8765 --latency-ms 80
+    → config.json의 tr_url을 "http://127.0.0.1:8765"로 지정 (.env의 TESTRAIL_USERNAME/PASSWORD는 아무 값)
+
+    python scripts/fake_testrail_server.py --benchmark 200 --latency-ms 80
+    → 서버를 띄운 뒤 TestRailReporter로 결과 200건을 기록하고 소요 시간/요청 수 출력
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+API_PREFIX = '/api/v2/'
+
+
+class FakeTestRailState:
+    """대체 서버의 메모리 데이터 (섹션, 케이스, Run, 결과) 및 엔드포인트별 호출 수"""
+
+    def __init__(self, section_count: int = 20, cases_per_section: int = 30, root_section_id: int = 1):
+        self.lock = threading.Lock()
+        self.sections: List[Dict[str, Any]] = []
+        self.cases: List[Dict[str, Any]] = []
+        now = int(time.time())
+        for idx in range(section_count):
+            section_id = root_section_id + idx
+            parent_id = None if idx == 0 else root_section_id + (idx - 1) // 3
+            self.sections.append({'id': section_id, 'name': f"Section {section_id}", 'parent_id': parent_id})
+            for case_idx in range(cases_per_section):
+                case_id = section_id * 1000 + case_idx
+                self.cases.append({'id': case_id, 'section_id': section_id, 'title': f"Case {case_id}", 'updated_on': now})
+        self.runs: Dict[int, Dict[str, Any]] = {}
+        self.results: List[Dict[str, Any]] = []
+        self.attachments: List[Dict[str, Any]] = []
+        self.calls: Dict[str, int] = {}
+
+    def count(self, endpoint: str) -> None:
+        with self.lock:
+            self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+
+    def add_result(self, run_id: int, case_id: int, body: Dict[str, Any]) -> Tuple[int, Any]:
+        run = self.runs.get(run_id)
+        if run is None:
+            return 400, {'error': "Field :run_id is not a valid test run."}
+        if run['is_completed']:
+            return 400, {'error': "Field :run_id refers to a completed test run."}
+        if run['case_ids'] is not None and case_id not in run['case_ids']:
+            return 400, {'error': f"Field :case_id {case_id} is not part of the run."}
+        with self.lock:
+            result = dict(body, id=len(self.results) + 1, case_id=case_id, run_id=run_id, created_on=int(time.time()))
+            self.results.append(result)
+        return 200, result
+
+
+class FakeTestRailHandler(BaseHTTPRequestHandler):
+    """index.php?/api/v2/<endpoint>&<params> 형태 요청 처리"""
+
+    protocol_version = 'HTTP/1.1'  # keep-alive 지원
+    disable_nagle_algorithm = True
+    state: FakeTestRailState = None
+    latency_ms: float = 0.0
+
+    def log_message(self, format, *args):  # 요청 로그 출력 생략
+        pass
+
+    def _parse(self) -> Tuple[str, List[str], Dict[str, str]]:
+        query = self.path.split('?', 1)[1] if '?' in self.path else ''
+        parts = query.split('&')
+        path = parts[0]
+        params = dict(part.split('=', 1) for part in parts[1:] if '=' in part)
+        segments = path[len(API_PREFIX):].split('/') if path.startswith(API_PREFIX) else []
+        return (segments[0] if segments else ''), segments[1:], params
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _send(self, status: int, body: Any) -> None:
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _authorized(self) -> bool:
+        if not (self.headers.get('Authorization') or '').startswith('Basic '):
+            self._send(401, {'error': 'Authentication failed'})
+            return False
+        return True
+
+    def do_GET(self):
+        self._read_body()
+        endpoint, args, params = self._parse()
+        if not self._authorized():
+            return
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000.0)
+        self.state.count(endpoint)
+
+        if endpoint == 'get_sections':
+            self._send(200, self.state.sections)
+        elif endpoint == 'get_cases':
+            limit = int(params.get('limit', 250))
+            offset = int(params.get('offset', 0))
+            cases = self.state.cases
+            if 'updated_after' in params:
+                cases = [case for case in cases if case['updated_on'] > int(params['updated_after'])]
+            self._send(200, cases[offset:offset + limit])
+        else:
+            self._send(404, {'error': f"Unknown method '{endpoint}'"})
+
+    def do_POST(self):
+        body = self._read_body()
+        endpoint, args, params = self._parse()
+        if not self._authorized():
+            return
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000.0)
+        self.state.count(endpoint)
+
+        payload: Dict[str, Any] = {}
+        if body and 'json' in (self.headers.get('Content-Type') or ''):
+            try:
+                payload = json.loads(body)
+            except json.JSONDecodeError:
+                self._send(400, {'error': 'Invalid JSON'})
+                return
+
+        state = self.state
+        if endpoint == 'add_run':
+            with state.lock:
+                run_id = len(state.runs) + 1
+                case_ids = None if payload.get('include_all', True) else set(payload.get('case_ids') or [])
+                state.runs[run_id] = {'id': run_id, 'name': payload.get('name'), 'case_ids': case_ids, 'is_completed': False}
+            self._send(200, {'id': run_id, 'name': payload.get('name')})
+        elif endpoint == 'add_result_for_case' and len(args) == 2:
+            status, result = state.add_result(int(args[0]), int(args[1]), payload)
+            self._send(status, result)
+        elif endpoint == 'add_results_for_cases' and args:
+            run_id = int(args[0])
+            created = []
+            for entry in payload.get('results', []):
+                entry = dict(entry)
+                status, result = state.add_result(run_id, int(entry.pop('case_id', 0)), entry)
+                if status != 200:
+                    self._send(status, result)
+                    return
+                created.append(result)
+            self._send(200, created)
+        elif endpoint == 'add_attachment_to_result' and args:
+            with state.lock:
+                attachment_id = len(state.attachments) + 1
+                state.attachments.append({'id': attachment_id, 'result_id': int(args[0]), 'size': len(body)})
+            self._send(200, {'attachment_id': attachment_id})
+        elif endpoint == 'close_run' and args:
+            run = state.runs.get(int(args[0]))
+            if run is None:
+                self._send(400, {'error': 'Field :run_id is not a valid test run.'})
+                return
+            run['is_completed'] = True
+            self._send(200, {'id': run['id'], 'is_completed': True})
+        else:
+            self._send(404, {'error': f"Unknown method '{endpoint}'"})
+
+
+def start_fake_testrail_server(
+    port: int = 0,
+    latency_ms: float = 0.0,
+    state: Optional[FakeTestRailState] = None,
+) -> Tuple[ThreadingHTTPServer, FakeTestRailState]:
+    """
+    대체 서버를 백그라운드 스레드로 시작
+
+    Args:
+        port: 포트 (0이면 임의 포트)
+        latency_ms: 요청마다 추가할 지연 (ms, 실제 TestRail 응답 시간 흉내)
+        state: 사용할 메모리 데이터 (None이면 기본 데이터 생성)
+
+    Returns:
+        (서버, 상태) — 주소는 f"http://127.0.0.1:{server.server_port}", 종료는 server.shutdown()
+    """
+    state = state or FakeTestRailState()
+    handler = type('Handler', (FakeTestRailHandler,), {'state': state, 'latency_ms': latency_ms})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    threading.Thread(target=server.serve_forever, name='fake-testrail', daemon=True).start()
+    return server, state
+
+
+def run_benchmark(result_count: int, latency_ms: float, batch_size: int) -> None:
+    """대체 서버에 TestRailReporter로 결과를 기록하고 소요 시간과 요청 수 출력"""
+    from utils.testrail_client import TestRailClient
+    from utils.testrail_reporter import TestRailReporter
+
+    server, state = start_fake_testrail_server(latency_ms=latency_ms)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    try:
+        with TestRailClient(base_url, 'user', 'token') as client:
+            run_id = client.post('add_run/1', {'name': 'benchmark', 'include_all': True})['id']
+            case_ids = [case['id'] for case in state.cases[:result_count]]
+
+            reporter = TestRailReporter(client.post, batch_size=batch_size)
+            started_at = time.time()
+            for case_id in case_ids:
+                reporter.submit_result(run_id, case_id, {'status_id': 1, 'comment': 'benchmark'})
+            enqueue_seconds = time.time() - started_at
+            reporter.drain()
+            total_seconds = time.time() - started_at
+    finally:
+        server.shutdown()
+
+    print(f"결과 {len(case_ids)}건 (서버 지연 {latency_ms:g}ms, batch_size={batch_size})")
+    print(f"  큐 추가: {enqueue_seconds * 1000:.1f}ms, 전체 기록: {total_seconds:.2f}초")
+    print(f"  서버 호출 수: {state.calls}")
+    print(f"  리포터 통계: {reporter.stats}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='로컬 TestRail 대체 서버 (리포터 오프라인 확인·성능 측정용)'
+    )
+    parser.add_argument('--port', type=int, default=8765, help='포트 (기본: 8765)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='요청마다 추가할 지연 (ms)')
+    parser.add_argument('--sections', type=int, default=20, help='생성할 섹션 수 (기본: 20)')
+    parser.add_argument('--cases-per-section', type=int, default=30, help='섹션당 케이스 수 (기본: 30)')
+    parser.add_argument('--benchmark', type=int, metavar='N', help='서버를 띄우는 대신 결과 N건 기록 성능 측정')
+    parser.add_argument('--batch-size', type=int, default=50, help='--benchmark에서 사용할 묶음 크기 (1이면 건별 기록)')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.benchmark, args.latency_ms, args.batch_size)
+        return
+
+    state = FakeTestRailState(args.sections, args.cases_per_section)
+    server, _ = start_fake_testrail_server(args.port, args.latency_ms, state)
+    print(f"대체 TestRail 서버 실행 중: http://127.0.0.1:{server.server_port} (Ctrl+C로 종료)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+        print(f"종료 — 호출 수: {state.calls}")
+
+
+if __name__ == '__main__':
+    main()
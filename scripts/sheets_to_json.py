@@ -21,6 +21,8 @@ from utils.common_fields import (
     get_common_fields_for_event_type,
     EVENT_TYPE_TO_CONFIG_KEY,
 )
+from utils.schema_compiler import write_compiled_artifact
+from utils.event_constraints import CONSTRAINTS_KEY
 
 
 def create_config_json(
@@ -134,6 +136,23 @@ def merge_module_with_common(
     return merged_event_data_dict
 
 
+def preserve_constraints(output_path: Path, config_json: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    기존 JSON 파일에 직접 작성된 이벤트 제약(constraints)을 새 config에 유지
+    (시트에는 제약 항목이 없으므로 덮어쓰기 시 사라지지 않도록 함)
+    """
+    if not output_path.exists():
+        return config_json
+    try:
+        with open(output_path, 'r', encoding='utf-8') as f:
+            existing = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return config_json
+    if isinstance(existing, dict) and existing.get(CONSTRAINTS_KEY):
+        config_json[CONSTRAINTS_KEY] = existing[CONSTRAINTS_KEY]
+    return config_json
+
+
 def convert_module_to_json(
     sync: GoogleSheetsSync,
     worksheet: Any,
@@ -161,12 +180,14 @@ def convert_module_to_json(
         return False
 
     merged = merge_module_with_common(event_data_dict, common_fields_data)
-    config_json = create_config_json(merged)
+    config_json = preserve_constraints(output_path, create_config_json(merged))
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, 'w', encoding='utf-8') as f:
         json.dump(config_json, f, ensure_ascii=False, indent=2)
+    artifact_path = write_compiled_artifact(output_path, config_json)
     if verbose:
         print(f"  [OK] {output_path} (섹션: {list(config_json.keys())})")
+        print(f"       컴파일 산출물: {artifact_path}")
     return True
 
 
@@ -202,9 +223,19 @@ def main():
         action='store_true',
         help='기존 파일이 있으면 덮어쓰기 (기본값: False)'
     )
+    parser.add_argument(
+        '--compile-only',
+        action='store_true',
+        help='시트 접근 없이 tracking_schemas/{area}의 기존 JSON으로 컴파일 산출물(_compiled/)만 생성'
+    )
 
     args = parser.parse_args()
 
+    # 컴파일 전용 모드: 기존 스키마 JSON만 사용
+    if args.compile_only:
+        _run_compile_only_mode(args)
+        return
+
     # 시트 단위 변환 모드: --area만 필요
     if args.sheet:
         if args.output:
@@ -267,6 +298,31 @@ def _run_sheet_mode(args: Any) -> None:
     print(f"\n완료: {success}/{len(modules)}개 모듈 JSON 생성 -> {out_dir}")
 
 
+def _run_compile_only_mode(args: Any) -> None:
+    """기존 스키마 JSON 파일로 컴파일 산출물만 생성 (--module 지정 시 해당 모듈만)."""
+    area_dir = project_root / 'tracking_schemas' / args.area
+    if not area_dir.exists():
+        print(f"오류: 영역 디렉토리가 없습니다: {area_dir}")
+        sys.exit(1)
+
+    if args.module:
+        schema_paths = [area_dir / f"{args.module}.json"]
+    else:
+        schema_paths = sorted(area_dir.glob("*.json"))
+
+    success = 0
+    for schema_path in schema_paths:
+        if not schema_path.exists():
+            print(f"  [건너뜀] 파일 없음: {schema_path}")
+            continue
+        with open(schema_path, 'r', encoding='utf-8') as f:
+            config_json = json.load(f)
+        artifact_path = write_compiled_artifact(schema_path, config_json)
+        print(f"  [OK] {artifact_path}")
+        success += 1
+    print(f"\n완료: {success}/{len(schema_paths)}개 컴파일 산출물 생성 -> {area_dir / '_compiled'}")
+
+
 def _run_single_module_mode(args: Any) -> None:
     """기존처럼 단일 모듈만 변환."""
     SPREADSHEET_ID = "1Hmrpoz1EVACFY5lHW7r4v8bEtRRFu8eay7grCojRr3E"
@@ -320,13 +376,15 @@ def _run_single_module_mode(args: Any) -> None:
         print(f"  [{config_key}]: 공통 %s개 + 고유 %s개 = 총 %s개" % (common_count, len(module_fields), len(merged_flat)))
 
     print("\nconfig JSON 구조 생성 중...")
-    config_json = create_config_json(merged_event_data_dict)
+    config_json = preserve_constraints(output_path, create_config_json(merged_event_data_dict))
     output_path.parent.mkdir(parents=True, exist_ok=True)
     print(f"\nJSON 파일 저장 중: {output_path}")
     with open(output_path, 'w', encoding='utf-8') as f:
         json.dump(config_json, f, ensure_ascii=False, indent=2)
+    artifact_path = write_compiled_artifact(output_path, config_json)
     print("완료: config JSON 생성 -> %s" % output_path)
     print("생성된 섹션: %s" % list(config_json.keys()))
+    print("컴파일 산출물 생성 -> %s" % artifact_path)
 
 
 if __name__ == '__main__':
@@ -11,6 +11,8 @@ import time
 
 # 프론트 실패 처리 헬퍼 함수 import
 from utils.frontend_helpers import record_frontend_failure
+# 비콘 안정화 대기 (고정 sleep 대체)
+from utils.tracking_idle import wait_for_tracking_idle
 
 
 logger = logging.getLogger(__name__)
@@ -123,7 +125,7 @@ def product_page_is_opened(browser_session, bdd_context):
                 logger.debug("load 상태 대기 완료")
             except Exception as e2:
                 logger.warning(f"load 상태 대기도 실패: {e2}")
-        time.sleep(2)
+        wait_for_tracking_idle(bdd_context, 2)
         logger.info(f"상품 페이지 이동 확인 완료: {goodscode} (PDP PV 로그 수집 대기 완료)")
         
     except Exception as e:
@@ -233,7 +235,7 @@ def user_confirms_and_clicks_product_in_pdp_module(browser_session, module_title
         # 모듈로 이동
         module = product_page.get_module_by_title(module_title)
         product_page.scroll_module_into_view(module)
-        time.sleep(2)
+        wait_for_tracking_idle(bdd_context, 2, expect_type='Product Exposure')
         ad_check = product_page.check_ad_item_in_module(module_title)
         
   
@@ -281,7 +283,7 @@ def user_confirms_and_clicks_product_in_pdp_module(browser_session, module_title
                 # bdd context에 저장 (product_url)
                 bdd_context.store['product_url'] = browser_session.page.url
                 
-            time.sleep(2)
+            wait_for_tracking_idle(bdd_context, 2)
             # bdd context에 저장 (module_title, goodscode)        
             bdd_context.store['module_title'] = module_title
             bdd_context.store['is_ad'] = is_ad
@@ -320,7 +322,7 @@ def user_confirms_and_clicks_product_in_emart_pdp_module(browser_session, module
         # 모듈로 이동
         module = product_page.get_module_by_title(module_title)
         product_page.scroll_module_into_view_bottom(module)
-        time.sleep(2)
+        wait_for_tracking_idle(bdd_context, 2, expect_type='Product Exposure')
         ad_check = product_page.check_ad_item_in_module(module_title)
 
         # 모듈 내 상품 찾기
@@ -390,7 +392,7 @@ def user_confirms_and_clicks_product_in_pdp_related_module(browser_session, modu
         # 모듈로 이동
         module = product_page.get_module_by_title(module_title)
         product_page.scroll_module_into_view_bottom(module)
-        time.sleep(2)
+        wait_for_tracking_idle(bdd_context, 2, expect_type='Product Exposure')
         ad_check = product_page.check_ad_item_in_module(module_title)
 
         # 모듈 내 상품 찾기
@@ -424,7 +426,7 @@ def user_confirms_and_clicks_product_in_pdp_related_module(browser_session, modu
         try:
             # 상품 클릭
             product_page.click_product(product)
-            time.sleep(2)
+            wait_for_tracking_idle(bdd_context, 2)
             # bdd context에 저장 (product_url, module_title, goodscode)
             bdd_context.store['product_url'] = browser_session.page.url        
             bdd_context.store['module_title'] = module_title
@@ -464,7 +466,7 @@ def user_confirms_and_clicks_product_in_pdp_related_detail_module(browser_sessio
         # 모듈로 이동
         module = product_page.get_module_by_title(module_title)
         product_page.scroll_module_into_view(module)
-        time.sleep(2)
+        wait_for_tracking_idle(bdd_context, 2, expect_type='Product Exposure')
         # 모듈 내 상품 찾기
         product = product_page.get_product_in_related_module(module)
         product_page.scroll_product_into_view(product)
@@ -510,7 +512,7 @@ def user_confirms_and_clicks_product_in_pdp_related_module(browser_session, butt
         # 버튼으로 이동
         button = product_page.get_module_by_title(button_title)
         product_page.scroll_module_into_view(button)
-        time.sleep(2)    
+        wait_for_tracking_idle(bdd_context, 2, expect_type='Product Exposure')
         # 버튼 노출 확인 (실패 시 예외 발생)
         try:
             expect(button.first).to_be_visible()
@@ -541,7 +543,7 @@ def user_confirms_and_clicks_product_in_pdp_related_module(browser_session, butt
 
             # 버튼 클릭
             product_page.click_product(button)
-            time.sleep(2)
+            wait_for_tracking_idle(bdd_context, 2)
 
             logger.info(f"{button_title} 버튼 확인 및 클릭 완료: {goodscode}")
         except Exception as e:
@@ -584,7 +586,7 @@ def other_page_is_opened(browser_session, bdd_context, module_title):
             except Exception as e:
                 logger.warning(f"networkidle 대기 실패, load 상태로 대기: {e}")
                 browser_session.page.wait_for_load_state("load", timeout=30000)    
-        time.sleep(1)
+        wait_for_tracking_idle(bdd_context, 1)
         logger.info(f"페이지 이동 확인 완료: {module_title}")
         
     except Exception as e:
@@ -2,7 +2,6 @@
 BDD Step Definitions for SRP Tracking Tests
 """
 import logging
-import time
 from pytest_bdd import given, when, then, parsers
 from playwright.sync_api import expect
 from pages.search_page import SearchPage
@@ -11,6 +10,7 @@ from pages.list_page import ListPage
 
 # 프론트 실패 처리 헬퍼 함수 import
 from utils.frontend_helpers import record_frontend_failure
+from utils.tracking_idle import wait_for_tracking_idle
 
 logger = logging.getLogger(__name__)
 
@@ -605,7 +605,7 @@ def product_page_is_opened(browser_session, bdd_context):
                 logger.debug("load 상태 대기 완료")
             except Exception as e2:
                 logger.warning(f"load 상태 대기도 실패: {e2}")
-        time.sleep(2)
+        wait_for_tracking_idle(bdd_context, 2)
 
         # 검증 (실패 시 예외 발생) — 네비게이션 대기 후 현재 URL로 확인
         try:
@@ -2,10 +2,11 @@
 BDD Step Definitions for Network Tracking
 네트워크 트래킹 관련 공통 스텝 정의
 """
-import time
 import logging
 from pytest_bdd import given, when
 from utils.NetworkTracker import NetworkTracker
+from utils.schema_compiler import build_area_projection
+from utils.tracking_idle import wait_for_tracking_idle
 
 logger = logging.getLogger(__name__)
 
@@ -14,16 +15,20 @@ logger = logging.getLogger(__name__)
 def given_network_tracking_started(page, bdd_context):
     """네트워크 트래킹 시작"""
     logger.info("네트워크 트래킹 시작")
-    tracker = NetworkTracker(page)
+    # 모듈을 알기 전에는 영역 스키마에 등장하는 키만 중첩 JSON 디코딩 (영역을 모르면 전체 디코딩)
+    # module_title이 정해지면 conftest 스텝 훅에서 해당 모듈 스키마 키로 좁힘 (utils.tracker_projection)
+    area = bdd_context.get('area')
+    projection = build_area_projection(area) if area else None
+    tracker = NetworkTracker(page, projection=projection)
     tracker.start()
     bdd_context['tracker'] = tracker
 
 
 @when("네트워크 요청이 완료될 때까지 대기함")
-def when_wait_for_network_request_completion():
-    """네트워크 요청 완료 대기"""
+def when_wait_for_network_request_completion(bdd_context):
+    """네트워크 요청 완료 대기 (새 비콘이 멈출 때까지, 최대 2초)"""
     logger.info("네트워크 요청 완료 대기")
-    time.sleep(2)
+    wait_for_tracking_idle(bdd_context, 2)
 
 
 @when("네트워크 트래킹을 중지함")
@@ -5,7 +5,6 @@ BDD Step Definitions for Tracking Validation
 import logging
 import json
 from datetime import datetime
-from pathlib import Path
 from pytest_bdd import then, parsers
 from utils.validation_helpers import (
     validate_event_type_logs,
@@ -16,6 +15,12 @@ from utils.validation_helpers import (
     get_nth_for_tracking,
     normalize_nth,
 )
+from utils.validation_context import get_validation_context
+from utils.validation_report import ValidationReport
+from utils.exposure_geometry import extract_exposure_geometry, check_exposure_geometry
+from utils.event_constraints import check_event_constraints
+from utils.parallel import worker_artifact_path
+from pages.base_page import BasePage
 
 logger = logging.getLogger(__name__)
 
@@ -48,10 +53,10 @@ def _check_and_validate_event_logs(
         logger.warning(f"[TestRail TC: {tc_id}] Skip: {skip_reason}")
         return True
     
-    nth_val = get_nth_for_tracking(bdd_context)
-    # module_config 확인
-    module_config = load_module_config(area=area, module_title=module_title, nth=nth_val)
-    module_config_data = module_config if isinstance(module_config, dict) else {}
+    # module_config 확인 (시나리오 단위 검증 컨텍스트에서 한 번만 로드)
+    validation_context = get_validation_context(bdd_context)
+    module_config = validation_context.module_config
+    module_config_data = module_config
     
     if event_config_key not in module_config_data:
         logger.info(f"[TestRail TC: {tc_id}] 모듈 '{module_title}'에 {event_type}이 정의되어 있지 않아 검증을 스킵합니다.")
@@ -97,18 +102,27 @@ def _check_and_validate_event_logs(
         module_config=module_config
     )
     
+    # 스키마에 선언된 이벤트 순서·지연 제약 중 이 이벤트 대상 제약 검증 (필드 검증과 함께 리포트)
+    constraint_errors = check_event_constraints(
+        tracker, goodscode, module_config_data, event_type, constraints=validation_context.constraints
+    )
+    if constraint_errors:
+        success = False
+        errors = list(errors) + constraint_errors
+    
     # 통과한 필드 목록을 bdd_context에 저장 (TestRail 로그에 표시하기 위해)
     bdd_context['validation_passed_fields'] = passed_fields
     
     if not success:
         # 검증 실패 시 실패 처리 (프론트 실패 여부와 관계없이)
-        error_message = f"[TestRail TC: {tc_id}] {event_type} 로그 정합성 검증 실패:\n[필드값 정합성 오류]\n" + "\n".join(errors)
-        # 통과한 필드가 있으면 표시
-        if passed_fields and isinstance(passed_fields, dict):
-            error_message += f"\n\n[통과한 필드]\n"
-            for field, value in passed_fields.items():
-                error_message += f"{field}: {value}\n"
-        logger.error(error_message)
+        # 실패 리포트는 표시 시점에 렌더링 (요약은 TestRail 로그용, 전체 내용은 DEBUG)
+        error_message = ValidationReport(
+            f"[TestRail TC: {tc_id}] {event_type} 로그 정합성 검증 실패:\n[필드값 정합성 오류]",
+            errors,
+            passed_fields,
+        )
+        logger.error(error_message.summary())
+        logger.debug("%s", error_message)
         
         # TestRail 기록을 위해 실패 플래그 설정
         bdd_context['validation_failed'] = True
@@ -125,47 +139,13 @@ def _check_and_validate_event_logs(
 
 
 def _get_common_context(bdd_context):
-    """공통 context 값 확인 및 반환"""
-    from utils.validation_helpers import extract_price_info_from_pdp_pv
-    
-    tracker = bdd_context.get('tracker')
-    if not tracker:
-        raise ValueError("bdd_context에 'tracker'가 없습니다. 네트워크 트래킹을 시작해주세요.")
-    
-    goodscode = bdd_context.get('goodscode')
-    if not goodscode:
-        raise ValueError("bdd_context에 'goodscode'가 없습니다.")
-    
-    module_title = bdd_context.get('module_title')
-    if not module_title:
-        raise ValueError("bdd_context에 'module_title'가 없습니다.")
-    
-    area = bdd_context.get('area')
-    if not area:
-        raise ValueError("bdd_context에 'area'가 없습니다. Feature 파일 경로에서 영역을 추론하지 못했습니다.")
-    
-    keyword = bdd_context.get('keyword', '')
-    category_id = bdd_context.get('category_id', '')
-    
-    # is_ad 가져오기 (bdd_context.store 또는 bdd_context에서)
-    is_ad = None
-    if hasattr(bdd_context, 'store') and hasattr(bdd_context.store, 'get'):
-        is_ad = bdd_context.store.get('is_ad')
-    elif hasattr(bdd_context, 'get'):
-        is_ad = bdd_context.get('is_ad')
-    
-    # 🔥 PDP PV 로그에서 가격 정보 추출 (프론트엔드 대신)
-    price_info = extract_price_info_from_pdp_pv(tracker, goodscode)
-    
-    frontend_data = price_info.copy() if price_info else {}
-    if keyword:
-        frontend_data['keyword'] = keyword
-    if category_id:
-        frontend_data['category_id'] = category_id
-    if is_ad is not None:
-        frontend_data['is_ad'] = is_ad
-    
-    return tracker, goodscode, module_title, frontend_data if frontend_data else None, area
+    """
+    공통 context 값 확인 및 반환
+    시나리오 단위 검증 컨텍스트를 재사용하므로 가격 정보/frontend_data는
+    PDP PV·Product Minidetail 로그가 새로 수집된 경우에만 다시 계산됨
+    """
+    ctx = get_validation_context(bdd_context)
+    return ctx.tracker, ctx.goodscode, ctx.module_title, ctx.frontend_data, ctx.area
 
 
 @then("PV 로그가 정합성 검증을 통과해야 함")
@@ -173,10 +153,9 @@ def then_pv_logs_should_pass_validation(bdd_context):
     """PV 로그 정합성 검증 (module_config.json에 정의된 경우만)"""
     try:
         tracker, goodscode, module_title, frontend_data, area = _get_common_context(bdd_context)
-        nth_val = get_nth_for_tracking(bdd_context)
         # module_config.json에서 PV가 정의되어 있는지 확인
-        module_config = load_module_config(area=area, module_title=module_title, nth=nth_val)
-        module_config_data = module_config if isinstance(module_config, dict) else {}
+        module_config = get_validation_context(bdd_context).module_config
+        module_config_data = module_config
         event_config_key = 'pv'
         
         if event_config_key not in module_config_data:
@@ -197,13 +176,9 @@ def then_pv_logs_should_pass_validation(bdd_context):
         bdd_context['validation_passed_fields'] = passed_fields
         
         if not success:
-            error_message = "PV 로그 정합성 검증 실패:\n" + "\n".join(errors)
-            # 통과한 필드가 있으면 표시
-            if passed_fields and isinstance(passed_fields, dict):
-                error_message += f"\n\n[통과한 필드]\n"
-                for field, value in passed_fields.items():
-                    error_message += f"{field}: {value}\n"
-            logger.error(error_message)
+            error_message = ValidationReport("PV 로그 정합성 검증 실패:", errors, passed_fields)
+            logger.error(error_message.summary())
+            logger.debug("%s", error_message)
             # TestRail 기록을 위해 실패 플래그 설정 (TC 번호는 없지만)
             bdd_context['validation_failed'] = True
             bdd_context['validation_error_message'] = error_message
@@ -583,6 +558,96 @@ def then_pdp_rental_click_logs_should_pass_validation(tc_id, bdd_context):
         bdd_context['validation_error_message'] = error_message
 
 
+def _skip_geometry_validation(bdd_context, tc_id: str, message: str) -> None:
+    """노출 위치 검증 스킵 (이전 검증 스텝의 결과가 이 TC로 기록되지 않도록 상태 초기화)"""
+    logger.info(f"[TestRail TC: {tc_id}] {message}")
+    bdd_context['validation_failed'] = False
+    bdd_context['validation_error_message'] = None
+
+
+@then(parsers.parse('Product Exposure 노출 위치 정합성 검증을 통과해야 함 (TC: {tc_id})'))
+def then_product_exposure_geometry_should_match_screen(tc_id, browser_session, bdd_context):
+    """
+    Product Exposure 비콘의 _x/_y/_w/_h를 화면의 상품 위치와 비교
+    모듈 내 상품 위치는 한 번의 evaluate로 수집하고, 비콘이 있는 상품 전체를 한 번에 비교
+    상품 클릭으로 새 탭(PDP)으로 전환된 뒤에도 page stack에서 모듈이 있는 목록 페이지를 찾아 비교
+    _rate는 현재 화면이 아니라 비콘 전송 시점의 뷰포트 기준 노출 비율과 비교
+    같은 TC의 Product Exposure 필드 검증이 이미 실패했으면 통과로 덮어쓰지 않음
+    """
+    if not tc_id or tc_id.strip() == '':
+        logger.info("TC 번호가 비어있어 Product Exposure 노출 위치 검증을 건너뜁니다.")
+        return
+    
+    try:
+        tracker, goodscode, module_title, frontend_data, area = _get_common_context(bdd_context)
+        prior_error = None
+        if bdd_context.get('testrail_tc_id') == tc_id and bdd_context.get('validation_failed'):
+            prior_error = bdd_context.get('validation_error_message')
+        bdd_context['testrail_tc_id'] = tc_id
+        
+        skip_reason = bdd_context.get('skip_reason')
+        if skip_reason:
+            logger.warning(f"[TestRail TC: {tc_id}] Skip: {skip_reason}")
+            return
+        if prior_error is not None:
+            logger.info(f"[TestRail TC: {tc_id}] 같은 TC의 이전 검증 실패를 유지한 채 노출 위치 검증을 수행합니다.")
+        
+        module_config = get_validation_context(bdd_context).module_config
+        if 'product_exposure' not in module_config:
+            _skip_geometry_validation(bdd_context, tc_id, f"모듈 '{module_title}'에 Product Exposure가 정의되어 있지 않아 검증을 스킵합니다.")
+            return
+        
+        # 모듈 SPM의 spmc(세 번째 구간)로 화면의 모듈 요소 찾기
+        module_spm = _find_spm_recursive(module_config.get('module_exposure', {}))
+        spm_parts = module_spm.split('.') if module_spm else []
+        if len(spm_parts) < 3:
+            _skip_geometry_validation(bdd_context, tc_id, "모듈 SPM을 알 수 없어 노출 위치 검증을 스킵합니다.")
+            return
+        base_page = module = None
+        for candidate_page in browser_session.iter_pages():
+            candidate = BasePage(candidate_page)
+            candidate_module = candidate.get_module_by_spmc(spm_parts[2])
+            if candidate_module.count() > 0:
+                base_page, module = candidate, candidate_module
+                break
+        if module is None:
+            _skip_geometry_validation(bdd_context, tc_id, f"열린 페이지에서 모듈(spmc={spm_parts[2]})을 찾지 못해 노출 위치 검증을 스킵합니다.")
+            return
+        
+        product_spm = _find_spm_recursive(module_config['product_exposure'])
+        beacon_geometry = extract_exposure_geometry(tracker, tracker.get_logs('Product Exposure'), product_spm)
+        
+        base_page.scroll_module_into_view(module.first)
+        dom_boxes = base_page.get_product_bounding_boxes(module)
+        
+        # 화면에 남아 있는 상품 + 시나리오 상품은 반드시 비교
+        dom_codes = {str(box['goodscode']) for box in dom_boxes}
+        targets = [code for code in beacon_geometry if code in dom_codes]
+        if goodscode and str(goodscode) not in targets:
+            targets.append(str(goodscode))
+        
+        errors = check_exposure_geometry(dom_boxes, beacon_geometry, targets)
+        if errors:
+            error_message = ValidationReport(f"[TestRail TC: {tc_id}] Product Exposure 노출 위치 정합성 검증 실패:", errors)
+            logger.error(error_message.summary())
+            bdd_context['validation_failed'] = True
+            bdd_context['validation_error_message'] = (
+                f"{prior_error}\n\n{error_message}" if prior_error is not None else error_message
+            )
+        elif prior_error is not None:
+            logger.info(f"[TestRail TC: {tc_id}] Product Exposure 노출 위치 정합성 검증 통과 (이전 검증 실패 유지)")
+        else:
+            bdd_context['validation_failed'] = False
+            bdd_context['validation_error_message'] = None
+            logger.info(f"[TestRail TC: {tc_id}] Product Exposure 노출 위치 정합성 검증 통과 ({len(targets)}개 상품)")
+    except Exception as e:
+        error_message = f"[TestRail TC: {tc_id}] Product Exposure 노출 위치 검증 중 예외 발생: {str(e)}"
+        logger.error(error_message, exc_info=True)
+        bdd_context['testrail_tc_id'] = tc_id
+        bdd_context['validation_failed'] = True
+        bdd_context['validation_error_message'] = error_message
+
+
 @then("모든 트래킹 로그를 JSON 파일로 저장함")
 def then_save_all_tracking_logs_to_json(bdd_context):
     """모든 트래킹 로그를 JSON 파일로 저장"""
@@ -720,10 +785,13 @@ def _save_tracking_logs(bdd_context, tracker, goodscode, module_title):
         all_logs.extend(tracker.get_pdp_rental_click_logs_by_goodscode(goodscode))
         
         if len(all_logs) > 0:
+            # projection 디코딩으로 보류된 중첩 JSON까지 모두 디코딩해서 저장
+            all_logs = [tracker.get_fully_decoded_log(log) for log in all_logs]
             module_safe = module_title_to_filename(module_title)
             ns = normalize_nth(get_nth_for_tracking(bdd_context))
             suffix = f"({ns})" if ns else ""
-            all_filepath = Path(f'json/tracking_all_{module_safe}{suffix}.json')
+            # xdist 실행 시 워커별 폴더 (json/<워커 ID>/)
+            all_filepath = worker_artifact_path(f'json/tracking_all_{module_safe}{suffix}.json')
             all_filepath.parent.mkdir(parents=True, exist_ok=True)
             with open(all_filepath, 'w', encoding='utf-8') as f:
                 json.dump(all_logs, f, ensure_ascii=False, indent=2, default=str)
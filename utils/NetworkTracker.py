@@ -1,11 +1,23 @@
 import re
 import json
 import time
+import bisect
 import logging
 import copy
 from urllib.parse import unquote, urlparse, parse_qs
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterable, FrozenSet
 from playwright.sync_api import Page, Request, BrowserContext
+from utils.beacon_latency import get_latency_recorder, DEFAULT_ATTRIBUTION_WINDOW_MS
+from utils.validation_report import (
+    FieldFailure,
+    PayloadValidationError,
+    find_key_path,
+    REASON_MISSING,
+    REASON_MANDATORY_EMPTY,
+    MATCH_EMPTY,
+    MATCH_ONE_OF,
+    MATCH_CONTAINS,
+)
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -14,6 +26,86 @@ logger = logging.getLogger(__name__)
 _GOODSCODE_PARAM_KEYS = ('goodscode', 'goodsCode', 'goods_code', 'goodscd', 'goodsCd')
 # PDP 클릭 이벤트 타입 (goodscode 없을 때 fallback 포함용)
 _PDP_CLICK_TYPES = ('PDP Buynow Click', 'PDP ATC Click', 'PDP Gift Click', 'PDP Join Click', 'PDP Rental Click')
+# projection 디코딩 시에도 항상 찾을 수 있어야 하는 라우팅 키 (goodscode/spm 필터링, 가격 정보 추출용)
+_ROUTING_KEYS = ('_p_prod', 'x_object_id', 'spm', 'gmkt_area_code', 'origin_price', 'promotion_price', 'coupon_price') + _GOODSCODE_PARAM_KEYS
+# 중첩 JSON 값에서 라우팅 키를 찾을 때 쓰는 JSON 키 형태 ("spm"이 "spmb" 값 등에 부분 일치하지 않도록)
+_ROUTING_JSON_KEYS = tuple(f'"{key}"' for key in _ROUTING_KEYS)
+# wait_idle 기본값 (ms): 비콘 없이 지나야 하는 시간 / 최대 대기 시간
+DEFAULT_IDLE_QUIET_MS = 800
+DEFAULT_IDLE_MAX_MS = 5000
+
+# 컨텍스트별 트래킹 중인 NetworkTracker (페이지 객체가 실제 클릭/이동 직전에 동작 시각을 기록할 때 조회)
+_active_trackers: Dict[int, 'NetworkTracker'] = {}
+
+
+# 비콘 시점 뷰포트 기록 (Product Exposure _rate 검증용)
+# 페이지의 스크롤/리사이즈마다 [scrollX, scrollY, innerWidth, innerHeight, Date.now()]를 바인딩으로 전달
+# (시각은 브라우저 시계라 payload ts와 바로 비교 가능, sync API의 이벤트 전달 지연과 무관)
+VIEWPORT_BINDING_NAME = '__trackerViewport'
+_VIEWPORT_INIT_SCRIPT = """
+(() => {
+    if (window.top !== window || window.__trackerViewportHooked) return;
+    window.__trackerViewportHooked = true;
+    let timer = null;
+    let sample = null;
+    const take = () => [window.scrollX, window.scrollY, window.innerWidth, window.innerHeight, Date.now()];
+    const report = () => {
+        const current = sample || take();
+        sample = null;
+        try { window.%s(current); } catch (e) {}
+    };
+    const onChange = () => {
+        sample = take();
+        clearTimeout(timer);
+        timer = setTimeout(report, 50);
+    };
+    window.addEventListener('scroll', onChange, {passive: true});
+    window.addEventListener('resize', onChange);
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', report);
+    } else {
+        report();
+    }
+})();
+""" % VIEWPORT_BINDING_NAME
+
+
+def _on_viewport_binding(source: Dict[str, Any], viewport: Any) -> None:
+    """뷰포트 바인딩 콜백: 해당 컨텍스트에서 트래킹 중인 tracker에 전달"""
+    tracker = _active_trackers.get(id(source.get('context')))
+    if tracker is not None:
+        tracker.record_viewport(viewport)
+
+
+def get_page_tracker(page: Page) -> Optional['NetworkTracker']:
+    """
+    page의 컨텍스트에서 트래킹 중인 NetworkTracker (없으면 None)
+
+    Args:
+        page: Playwright Page
+    """
+    try:
+        context = page.context
+    except Exception:
+        return None
+    tracker = _active_trackers.get(id(context))
+    if tracker is not None and tracker.context is context and tracker.is_tracking:
+        return tracker
+    return None
+
+
+def mark_page_action(page: Page, kind: str, label: Optional[str] = None) -> None:
+    """
+    page의 컨텍스트에서 트래킹 중인 NetworkTracker에 사용자 동작 시각 기록 (트래커가 없으면 무시)
+
+    Args:
+        page: 동작을 수행할 Playwright Page
+        kind: 동작 종류 ('click', 'navigation', 'scroll')
+        label: 동작 설명 (선택자, URL 등, 디버그 로그용)
+    """
+    tracker = get_page_tracker(page)
+    if tracker is not None:
+        tracker.mark_action(kind, label)
 
 
 class NetworkTracker:
@@ -21,18 +113,44 @@ class NetworkTracker:
     aplus.gmarket 도메인의 POST 요청을 실시간으로 감지하고 분류하는 클래스
     """
     
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, projection: Optional[Iterable[str]] = None):
         """
         NetworkTracker 초기화
         
         Args:
             page: Playwright Page 객체
+            projection: 중첩 JSON 디코딩 대상 키 집합 (None이면 전체 디코딩, set_projection 참고)
         """
         self.page = page
         self.context = page.context
         self.tracked_pages: List[Page] = [page]  # 추적 중인 페이지 목록
         self.logs: List[Dict[str, Any]] = []
         self.is_tracking = False
+        # 타입별 수신 건수 및 clear_logs 세대 (캐시 무효화 판단용)
+        self._type_counts: Dict[str, int] = {}
+        self._log_generation = 0
+        self._projection: Optional[FrozenSet[str]] = None
+        self.set_projection(projection)
+        # 시나리오 단위 보존 필터 (utils.retention_filter 참고, None이면 모든 로그 보관)
+        self.retention_filter: Optional[Any] = None
+        # 필터 밖으로 제외된 타입별 건수, raw 모드에서 원본 형태로만 보관한 로그
+        self.retention_stats: Dict[str, int] = {}
+        self.raw_logs: List[Dict[str, Any]] = []
+        # 로그 식별 번호 및 검증 결과 캐시 ((log_id, 이벤트 타입, goodscode, 기대값 해시) → 결과)
+        self._log_seq = 0
+        self.validation_cache: Dict[Tuple[Any, ...], Any] = {}
+        # 마지막 사용자 동작 (mark_action) 및 그 이후 지연을 기록한 이벤트 타입 (비콘 지연 측정용)
+        self._last_action: Optional[Dict[str, Any]] = None
+        self._action_seen_types: set = set()
+        # 전송 시각(payload ts)이 없는 비콘: 요청 완료 시 request.timing으로 지연 계산 {Request: (동작, 이벤트 타입)}
+        self._pending_latency: Dict[Any, Tuple[Dict[str, Any], str]] = {}
+        # 마지막 aplus 비콘 수신 시각 (보존 필터와 무관, wait_idle 판단용)
+        self._last_beacon_at: Optional[float] = None
+        # 뷰포트 기록 (브라우저 시각 ms 오름차순, viewport_at 조회용)
+        self._viewport_times: List[float] = []
+        self._viewports: List[Tuple[float, float, float, float]] = []
+        # 이벤트 타입별 마지막 비콘 수신 시각 (wait_idle expect_type 판단용)
+        self._last_beacon_at_by_type: Dict[str, float] = {}
         
         # 타겟 도메인 패턴
         self.domain_pattern = re.compile(r'aplus\.gmarket\.co(\.kr|m)')
@@ -142,6 +260,74 @@ class NetworkTracker:
         
         return 'Unknown'
     
+    def set_projection(self, projection: Optional[Iterable[str]]) -> None:
+        """
+        중첩 JSON 디코딩 대상 키 집합 설정 (이후 수집되는 로그부터 적용)
+        
+        - gokey 파라미터 중 JSON 형태 값(clk_itm_info, utparam-url 등): 키가 projection에 있거나
+          값에 라우팅 키(_p_prod, x_object_id 등)가 JSON 키로 포함된 경우에만 디코딩, 나머지는 원본 문자열로 둠
+        - utLogMap: 키가 projection에 있거나 같은 params에 _p_prod가 없을 때만 디코딩
+        - expdata/params-exp/params-clk는 라우팅에 필요하므로 항상 디코딩
+        전체 디코딩이 필요하면 get_fully_decoded_log 사용.
+        
+        Args:
+            projection: 스키마에 등장하는 키 이름 집합 (None이면 전체 디코딩)
+        """
+        self._projection = frozenset(projection) if projection else None
+    
+    @property
+    def projection(self) -> Optional[FrozenSet[str]]:
+        """현재 중첩 JSON 디코딩 대상 키 집합 (None이면 전체 디코딩)"""
+        return self._projection
+    
+    def set_retention_filter(self, retention_filter: Optional[Any]) -> None:
+        """
+        보존 필터 설정 (이미 수집된 로그에도 적용)
+        
+        Args:
+            retention_filter: accepts(tracker, log)와 mode 속성을 가진 필터 (None이면 해제)
+        """
+        self.retention_filter = retention_filter
+        if retention_filter is None:
+            return
+        
+        kept = []
+        for log in self.logs:
+            if retention_filter.accepts(self, log):
+                kept.append(log)
+            else:
+                self._retain_rejected(log)
+        if len(kept) != len(self.logs):
+            self.logs[:] = kept
+            self._type_counts.clear()
+            for log in kept:
+                self._type_counts[log['type']] = self._type_counts.get(log['type'], 0) + 1
+            self._log_generation += 1
+        logger.debug(f'보존 필터 적용: 보관 {len(kept)}건, 제외 누적 {self.retention_stats}')
+    
+    def _retain_rejected(self, log: Dict[str, Any]) -> None:
+        """보존 필터 밖 로그 처리 (건수 집계, raw 모드면 디코딩 결과를 뺀 원본만 보관)"""
+        request_type = log.get('type')
+        self.retention_stats[request_type] = self.retention_stats.get(request_type, 0) + 1
+        if getattr(self.retention_filter, 'mode', None) != 'raw':
+            return
+        payload = log.get('payload')
+        if isinstance(payload, dict):
+            payload = {k: v for k, v in payload.items() if k != 'decoded_gokey'}
+        self.raw_logs.append({
+            'type': request_type,
+            'url': log.get('url'),
+            'timestamp': log.get('timestamp'),
+            'method': log.get('method'),
+            'raw': json.dumps(payload, ensure_ascii=False, default=str),
+        })
+    
+    def _should_decode_nested(self, key: str, raw_value: str) -> bool:
+        """projection 기준으로 중첩 JSON 값을 지금 디코딩할지 판단"""
+        if self._projection is None or key in self._projection:
+            return True
+        return any(routing_key in raw_value for routing_key in _ROUTING_JSON_KEYS)
+    
     def _decode_utlogmap(self, utlogmap_str: str) -> Optional[Dict[str, Any]]:
         """
         utLogMap 문자열을 디코딩하고 JSON 파싱
@@ -197,8 +383,12 @@ class NetworkTracker:
                     decoded_value = unquote(value)
                     
                     # utLogMap은 별도로 JSON 파싱
+                    # projection 밖이면 원본만 보관 (_p_prod가 없으면 x_object_id로 라우팅해야 하므로 디코딩)
                     if decoded_key == 'utLogMap':
-                        parsed_utlogmap = self._decode_utlogmap(decoded_value)
+                        if self._projection is None or decoded_key in self._projection or '_p_prod=' not in decoded:
+                            parsed_utlogmap = self._decode_utlogmap(decoded_value)
+                        else:
+                            parsed_utlogmap = None
                         decoded_params[decoded_key] = {
                             'raw': decoded_value,
                             'parsed': parsed_utlogmap
@@ -348,7 +538,12 @@ class NetworkTracker:
                             'parsed': decoded_params
                         }
                     # 그 외: JSON 형태로 보이는 문자열은 범용 파싱 → 재귀 탐색(_find_value_recursive)이 _p_prod/x_object_id 등 자동 발견
-                    elif isinstance(decoded_value, str) and self._looks_like_json_string(decoded_value):
+                    # (projection 밖의 키는 원본 문자열로 두고 get_fully_decoded_log에서 디코딩)
+                    elif (
+                        isinstance(decoded_value, str)
+                        and self._looks_like_json_string(decoded_value)
+                        and self._should_decode_nested(decoded_key, decoded_value)
+                    ):
                         parsed_any = self._parse_json_param(decoded_value)
                         params[decoded_key] = {'raw': decoded_value, 'parsed': parsed_any} if parsed_any is not None else decoded_value
                     else:
@@ -492,21 +687,147 @@ class NetworkTracker:
                 logger.debug(f'Exposure/Module 관련 URL 감지: {url}, 분류: {request_type}')
             
             # 로그 저장
+            self._log_seq += 1
             log_entry = {
                 'type': request_type,
                 'url': url,
                 'payload': parsed_payload,
                 'timestamp': time.time(),
-                'method': method
+                'method': method,
+                'log_id': self._log_seq
             }
             
+            if self._projection is not None:
+                log_entry['projected'] = True
+            
+            self._last_beacon_at = log_entry['timestamp']
+            self._last_beacon_at_by_type[request_type] = log_entry['timestamp']
+            self._attribute_action_latency(request, request_type, parsed_payload)
+            
+            if self.retention_filter is not None and not self.retention_filter.accepts(self, log_entry):
+                self._retain_rejected(log_entry)
+                logger.debug(f'{request_type} 요청 보존 제외: {url}')
+                return
+            
             self.logs.append(log_entry)
+            self._type_counts[request_type] = self._type_counts.get(request_type, 0) + 1
             logger.info(f'{request_type} 요청 감지: {url}')
             
         except Exception as e:
             # 에러 발생 시에도 트래킹은 계속 진행
             logger.error(f'요청 처리 중 오류 발생: {e}', exc_info=True)
     
+    def mark_action(self, kind: str, label: Optional[str] = None) -> None:
+        """
+        사용자 동작 시각 기록 (이후 이벤트 타입별 첫 비콘까지의 지연을 측정)
+        페이지 객체가 실제 click()/goto() 직전에 호출 (mark_page_action, BasePage._mark_action)
+        
+        Args:
+            kind: 동작 종류 ('click', 'navigation', 'scroll')
+            label: 동작 설명 (선택자, URL 등, 디버그 로그용)
+        """
+        self._last_action = {'kind': kind, 'label': label, 'time': time.time()}
+        self._action_seen_types = set()
+        logger.debug(f'사용자 동작 기록: {kind} ({label})')
+    
+    @staticmethod
+    def _payload_sent_at(payload: Any) -> Optional[float]:
+        """비콘 payload의 ts (브라우저 전송 시각, ms) → 초, 없으면 None"""
+        if not isinstance(payload, dict):
+            return None
+        try:
+            sent_at = float(str(payload.get('ts')).strip())
+        except (TypeError, ValueError):
+            return None
+        return sent_at / 1000.0 if sent_at > 1e12 else sent_at
+    
+    def _attribute_action_latency(self, request: Request, request_type: str, payload: Any) -> None:
+        """
+        마지막 동작 이후 해당 타입의 첫 비콘이면 지연 기록
+        도착 시각은 핸들러 실행 시각이 아니라 비콘 자체의 전송 시각 사용
+        (sync API는 Playwright 호출 중에만 이벤트를 전달하므로 핸들러 시각은 time.sleep 등만큼 늦어짐)
+        - payload ts가 있으면 그 값
+        - 없으면 요청 완료(requestfinished/requestfailed) 시 request.timing의 startTime
+        """
+        action = self._last_action
+        if action is None or request_type in self._action_seen_types:
+            return
+        self._action_seen_types.add(request_type)
+        sent_at = self._payload_sent_at(payload)
+        if sent_at is not None:
+            self._record_action_latency(action, request_type, sent_at)
+        else:
+            self._pending_latency[request] = (action, request_type)
+    
+    def _on_request_done(self, request: Request) -> None:
+        """requestfinished/requestfailed 콜백: 전송 시각을 기다리던 비콘의 지연 기록"""
+        pending = self._pending_latency.pop(request, None)
+        if pending is None:
+            return
+        try:
+            start_ms = float(request.timing.get('startTime') or 0)
+        except Exception:
+            start_ms = 0.0
+        if start_ms > 0:
+            self._record_action_latency(pending[0], pending[1], start_ms / 1000.0)
+    
+    def _record_action_latency(self, action: Dict[str, Any], request_type: str, sent_at: float) -> None:
+        """동작 시각 → 비콘 전송 시각 지연을 실행 단위 집계에 추가"""
+        latency_ms = (sent_at - action['time']) * 1000.0
+        if 0 <= latency_ms <= DEFAULT_ATTRIBUTION_WINDOW_MS:
+            get_latency_recorder().record(request_type, latency_ms, action['kind'])
+    
+    def wait_idle(
+        self,
+        quiet_ms: int = DEFAULT_IDLE_QUIET_MS,
+        max_ms: int = DEFAULT_IDLE_MAX_MS,
+        poll_ms: int = 100,
+        expect_type: Optional[str] = None,
+    ) -> bool:
+        """
+        새 aplus 비콘이 quiet_ms 동안 들어오지 않을 때까지 대기 (최대 max_ms)
+        호출 시점부터 최소 quiet_ms는 기다리므로, 동작 직후 아직 비콘이 나가지 않은 경우도 포함
+        expect_type을 주면 호출 이후 그 타입 비콘이 한 건 이상 들어온 뒤에만 유휴로 판단
+        (스크롤 후 일정 시간 머물러야 나가는 노출 비콘처럼 quiet_ms보다 늦게 나가는 비콘용)
+        
+        Args:
+            quiet_ms: 비콘 없이 지나야 하는 시간 (ms)
+            max_ms: 최대 대기 시간 (ms)
+            poll_ms: 확인 간격 (ms)
+            expect_type: 기다릴 이벤트 타입 (예: 'Product Exposure')
+        
+        Returns:
+            조용해져서 반환하면 True, max_ms에 도달하면 False
+        """
+        started_at = time.time()
+        deadline = started_at + max_ms / 1000.0
+        while True:
+            now = time.time()
+            last_activity = max(started_at, self._last_beacon_at or 0.0)
+            expected_seen = expect_type is None or self._last_beacon_at_by_type.get(expect_type, 0.0) >= started_at
+            if expected_seen and (now - last_activity) * 1000.0 >= quiet_ms:
+                logger.debug(f'비콘 유휴 확인: {(now - started_at) * 1000.0:.0f}ms 대기')
+                return True
+            if now >= deadline:
+                logger.debug(f'비콘 유휴 대기 시간 초과: {max_ms}ms')
+                return False
+            self._pump_events(min(poll_ms, max(int((deadline - now) * 1000.0), 1)))
+    
+    def _pump_events(self, ms: int) -> None:
+        """
+        ms 동안 대기하면서 Playwright 이벤트 처리
+        (sync API는 Playwright 호출 중에만 request 이벤트를 전달하므로 time.sleep 대신 page.wait_for_timeout 사용)
+        """
+        for page in reversed(self.tracked_pages):
+            try:
+                if page.is_closed():
+                    continue
+                page.wait_for_timeout(ms)
+                return
+            except Exception:
+                continue
+        time.sleep(ms / 1000.0)
+    
     def start(self):
         """
         네트워크 트래킹 시작
@@ -525,6 +846,11 @@ class NetworkTracker:
         
         # Context에 새 페이지 이벤트 리스너 추가 (새 탭이 열릴 때마다 추적)
         self.context.on('page', self._on_new_page)
+        # 전송 시각(payload ts)이 없는 비콘의 지연 계산용
+        self.context.on('requestfinished', self._on_request_done)
+        self.context.on('requestfailed', self._on_request_done)
+        _active_trackers[id(self.context)] = self
+        self._install_viewport_hook()
         
         # 기존 페이지 목록 추적 (Page 레벨 리스너는 추가하지 않음 - Context 레벨 리스너가 모든 요청을 감지하므로)
         for page in self.context.pages:
@@ -533,6 +859,55 @@ class NetworkTracker:
         
         logger.info(f'네트워크 트래킹 시작 (페이지 수: {len(self.tracked_pages)})')
     
+    def _install_viewport_hook(self) -> None:
+        """
+        스크롤/리사이즈 시 뷰포트를 기록하는 스크립트 설치 (컨텍스트당 한 번, 이미 열린 페이지에도 적용)
+        바인딩은 해제할 수 없으므로 컨텍스트 풀로 재사용되는 컨텍스트에는 다시 등록하지 않음
+        """
+        try:
+            if not getattr(self.context, '_tracker_viewport_hooked', False):
+                self.context.expose_binding(VIEWPORT_BINDING_NAME, _on_viewport_binding)
+                self.context.add_init_script(_VIEWPORT_INIT_SCRIPT)
+                self.context._tracker_viewport_hooked = True
+            for page in self.context.pages:
+                if not page.is_closed():
+                    page.evaluate(_VIEWPORT_INIT_SCRIPT)
+        except Exception as e:
+            logger.debug(f'뷰포트 기록 스크립트 설치 실패 (노출 비율 검증 생략): {e}')
+    
+    def record_viewport(self, viewport: Any) -> None:
+        """
+        뷰포트 기록 추가
+        
+        Args:
+            viewport: [scrollX, scrollY, innerWidth, innerHeight, 브라우저 시각(ms)]
+        """
+        try:
+            scroll_x, scroll_y, width, height, at_ms = (float(value) for value in viewport)
+        except (TypeError, ValueError):
+            return
+        idx = bisect.bisect_right(self._viewport_times, at_ms)
+        self._viewport_times.insert(idx, at_ms)
+        self._viewports.insert(idx, (scroll_x, scroll_y, width, height))
+    
+    def viewport_at(self, at: float) -> Optional[Tuple[float, float, float, float]]:
+        """
+        해당 시각에 유효했던 뷰포트 (scrollX, scrollY, width, height)
+        
+        Args:
+            at: 브라우저 시각 (초, payload ts 기준)
+        
+        Returns:
+            그 시각 이전의 마지막 기록 또는 None (기록 없음)
+        """
+        idx = bisect.bisect_right(self._viewport_times, at * 1000.0)
+        return self._viewports[idx - 1] if idx > 0 else None
+    
+    def get_log_viewport(self, log: Dict[str, Any]) -> Optional[Tuple[float, float, float, float]]:
+        """비콘 전송 시각(payload ts)의 뷰포트 (ts가 없거나 기록이 없으면 None)"""
+        sent_at = self._payload_sent_at(log.get('payload'))
+        return self.viewport_at(sent_at) if sent_at is not None else None
+    
     def _on_new_page(self, page: Page):
         """
         새 페이지(새 탭)가 열릴 때 호출되는 콜백
@@ -561,11 +936,16 @@ class NetworkTracker:
             return
         
         self.is_tracking = False
+        self._pending_latency.clear()
+        if _active_trackers.get(id(self.context)) is self:
+            del _active_trackers[id(self.context)]
         
         # Context 리스너 제거 (Context 레벨 리스너만 사용하므로 이것만 제거)
         try:
             self.context.off('request', self._on_request)
             self.context.off('page', self._on_new_page)
+            self.context.off('requestfinished', self._on_request_done)
+            self.context.off('requestfailed', self._on_request_done)
         except Exception as e:
             logger.warning(f'Context 리스너 제거 중 오류 (무시됨): {e}')
         
@@ -586,6 +966,21 @@ class NetworkTracker:
             return [log for log in self.logs if log['type'] == request_type]
         return self.logs.copy()
     
+    def get_log_revision(self, *request_types: str) -> Tuple[int, ...]:
+        """
+        지정한 타입 로그의 변경 여부를 판단하기 위한 리비전 값 반환
+        
+        로그가 추가되거나 clear_logs가 호출되면 값이 달라지므로,
+        이전 리비전과 비교하여 캐시 재계산 여부를 결정할 수 있다.
+        
+        Args:
+            request_types: 확인할 로그 타입 ('PDP PV', 'Product Minidetail' 등)
+        
+        Returns:
+            (clear 세대, 타입별 수신 건수...) 튜플
+        """
+        return (self._log_generation,) + tuple(self._type_counts.get(t, 0) for t in request_types)
+    
     def get_pv_logs(self) -> List[Dict[str, Any]]:
         """
         PV 타입 로그만 반환 (PDP PV 제외)
@@ -1048,7 +1443,7 @@ class NetworkTracker:
                     pass
         return 0.0
     
-    def get_module_exposure_logs_by_spm(self, spm: str) -> List[Dict[str, Any]]:
+    def get_module_exposure_logs_by_spm(self, spm: str, latest_only: bool = True) -> List[Dict[str, Any]]:
         """
         spm 기준으로 Module Exposure 로그만 반환
         
@@ -1057,9 +1452,10 @@ class NetworkTracker:
         
         Args:
             spm: SPM 값 (예: "gmktpc.searchlist.cpc")
+            latest_only: False면 매칭되는 로그 전체 반환 (이벤트 순서·지연 제약 검증용)
         
         Returns:
-            해당 spm의 Module Exposure 로그 리스트 (최대 1건)
+            해당 spm의 Module Exposure 로그 리스트 (latest_only면 최대 1건)
         """
         filtered_logs = []
         
@@ -1078,7 +1474,7 @@ class NetworkTracker:
             else:
                 logger.debug(f"SPM 추출 실패: 로그에서 spm을 찾을 수 없음")
         
-        if len(filtered_logs) > 1:
+        if latest_only and len(filtered_logs) > 1:
             filtered_logs.sort(key=lambda lg: self._get_log_collection_timestamp(lg))
             latest = filtered_logs[-1]
             t_latest = self._get_log_collection_timestamp(latest)
@@ -1115,7 +1511,41 @@ class NetworkTracker:
         # 없으면 재귀적으로 탐색 (Module Exposure와 동일한 방식)
         return self._find_spm_recursive(item)
     
-    def get_product_exposure_logs_by_goodscode(self, goodscode: str, spm: Optional[str] = None) -> List[Dict[str, Any]]:
+    def _extract_goodscode_from_product_exposure_item(self, item: Dict[str, Any]) -> Optional[str]:
+        """
+        Product Exposure의 expdata.parsed 배열 항목에서 goodscode 추출
+        exargs.params-exp.parsed의 _p_prod 우선, 없으면 utLogMap.x_object_id
+        
+        Args:
+            item: expdata.parsed 배열의 항목
+        
+        Returns:
+            추출된 goodscode 또는 None
+        """
+        if not isinstance(item, dict) or 'exargs' not in item:
+            return None
+        exargs = item.get('exargs', {})
+        if not isinstance(exargs, dict) or 'params-exp' not in exargs:
+            return None
+        params_exp = exargs.get('params-exp', {})
+        if not isinstance(params_exp, dict) or 'parsed' not in params_exp:
+            return None
+        parsed = params_exp.get('parsed', {})
+        if not isinstance(parsed, dict):
+            return None
+        # _p_prod 우선 확인
+        if '_p_prod' in parsed:
+            return str(parsed['_p_prod'])
+        # 없으면 utLogMap.x_object_id 확인
+        if 'utLogMap' in parsed:
+            utlogmap = parsed.get('utLogMap', {})
+            if isinstance(utlogmap, dict) and 'parsed' in utlogmap:
+                utlogmap_parsed = utlogmap.get('parsed', {})
+                if isinstance(utlogmap_parsed, dict) and 'x_object_id' in utlogmap_parsed:
+                    return str(utlogmap_parsed['x_object_id'])
+        return None
+    
+    def get_product_exposure_logs_by_goodscode(self, goodscode: str, spm: Optional[str] = None, latest_only: bool = True) -> List[Dict[str, Any]]:
         """
         goodscode 기준으로 Product Exposure 로그만 반환
         spm이 제공되면 추가로 필터링
@@ -1125,15 +1555,16 @@ class NetworkTracker:
         Args:
             goodscode: 상품 번호
             spm: SPM 값 (선택적, 예: "gmktpc.searchlist.cpc")
+            latest_only: False면 매칭되는 로그 전체 반환 (이벤트 순서·지연 제약 검증용)
         
         Returns:
-            해당 goodscode의 Product Exposure 로그 리스트 (최대 1건)
+            해당 goodscode의 Product Exposure 로그 리스트 (latest_only면 최대 1건)
         """
         logs = self.get_logs_by_goodscode(goodscode, 'Product Exposure')
         
         # spm 필터링이 없으면 바로 반환 (동일 goodscode 다건이면 최신 수집 1건만)
         if not spm:
-            if len(logs) > 1:
+            if latest_only and len(logs) > 1:
                 n = len(logs)
                 logs_sorted = sorted(logs, key=lambda lg: self._get_log_collection_timestamp(lg))
                 latest = logs_sorted[-1]
@@ -1167,24 +1598,7 @@ class NetworkTracker:
                         total_items += 1
                         
                         # 항목에서 goodscode 추출
-                        item_goodscode = None
-                        if isinstance(item, dict) and 'exargs' in item:
-                            exargs = item.get('exargs', {})
-                            if isinstance(exargs, dict) and 'params-exp' in exargs:
-                                params_exp = exargs.get('params-exp', {})
-                                if isinstance(params_exp, dict) and 'parsed' in params_exp:
-                                    parsed = params_exp.get('parsed', {})
-                                    if isinstance(parsed, dict):
-                                        # _p_prod 우선 확인
-                                        if '_p_prod' in parsed:
-                                            item_goodscode = str(parsed['_p_prod'])
-                                        # 없으면 utLogMap.x_object_id 확인
-                                        elif 'utLogMap' in parsed:
-                                            utlogmap = parsed.get('utLogMap', {})
-                                            if isinstance(utlogmap, dict) and 'parsed' in utlogmap:
-                                                utlogmap_parsed = utlogmap.get('parsed', {})
-                                                if isinstance(utlogmap_parsed, dict) and 'x_object_id' in utlogmap_parsed:
-                                                    item_goodscode = str(utlogmap_parsed['x_object_id'])
+                        item_goodscode = self._extract_goodscode_from_product_exposure_item(item)
                         
                         # goodscode가 일치하는지 확인
                         if item_goodscode != goodscode:
@@ -1209,7 +1623,7 @@ class NetworkTracker:
             else:
                 logger.debug(f"Product Exposure 로그 필터링 제외: goodscode={goodscode}, spm={spm}와 매칭되는 항목 없음")
         
-        if len(filtered_logs) > 1:
+        if latest_only and len(filtered_logs) > 1:
             n = len(filtered_logs)
             filtered_logs.sort(key=lambda lg: self._get_log_collection_timestamp(lg))
             latest = filtered_logs[-1]
@@ -1224,6 +1638,143 @@ class NetworkTracker:
         
         return filtered_logs
     
+    def _get_expdata_list(self, log: Dict[str, Any]) -> Optional[List[Any]]:
+        """Product Exposure 로그의 expdata.parsed 배열 반환 (배열이 없으면 None)"""
+        payload = log.get('payload', {})
+        decoded_gokey = payload.get('decoded_gokey', {}) if isinstance(payload, dict) else {}
+        params = decoded_gokey.get('params', {}) if isinstance(decoded_gokey, dict) else {}
+        expdata = params.get('expdata', {}) if isinstance(params, dict) else {}
+        if isinstance(expdata, dict) and isinstance(expdata.get('parsed'), list):
+            return expdata['parsed']
+        return None
+    
+    def _get_expdata_items(self, log: Dict[str, Any]) -> List[Any]:
+        """Product Exposure 로그의 expdata.parsed 배열 반환 (없으면 빈 리스트)"""
+        return self._get_expdata_list(log) or []
+    
+    def _copy_log_with_expdata_items(self, log: Dict[str, Any], items: List[Any]) -> Dict[str, Any]:
+        """
+        expdata.parsed만 주어진 항목으로 교체한 로그 사본 반환
+        경로상의 딕셔너리만 복사하고 나머지는 원본을 공유 (deepcopy 대비 비용 절감, 원본 로그는 수정하지 않음)
+        """
+        filtered_log = dict(log)
+        payload = dict(log['payload'])
+        decoded_gokey = dict(payload['decoded_gokey'])
+        params = dict(decoded_gokey['params'])
+        expdata = dict(params['expdata'])
+        expdata['parsed'] = items
+        params['expdata'] = expdata
+        decoded_gokey['params'] = params
+        payload['decoded_gokey'] = decoded_gokey
+        filtered_log['payload'] = payload
+        return filtered_log
+    
+    def _select_latest_log(self, logs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """수집 시각이 가장 늦은 1건만 리스트로 반환 (빈 리스트면 그대로)"""
+        if len(logs) <= 1:
+            return logs
+        # 수집 시각이 같으면 나중에 수집된 로그 우선 (단건 조회의 정렬 후 마지막 선택과 동일)
+        latest = logs[0]
+        for log in logs[1:]:
+            if self._get_log_collection_timestamp(log) >= self._get_log_collection_timestamp(latest):
+                latest = log
+        return [latest]
+    
+    def get_logs_by_goodscodes(self, goodscodes: List[str], request_type: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        여러 goodscode 기준으로 로그를 한 번의 순회로 분류 (get_logs_by_goodscode의 다건 버전)
+        
+        Args:
+            goodscodes: 상품 번호 리스트
+            request_type: 필터링할 타입. None이면 모든 타입
+        
+        Returns:
+            {goodscode: 해당 goodscode와 일치하는 로그 리스트} 딕셔너리 (요청한 모든 goodscode 키 포함)
+        """
+        buckets: Dict[str, List[Dict[str, Any]]] = {str(code): [] for code in goodscodes}
+        
+        for log in self.logs:
+            if request_type and log.get('type') != request_type:
+                continue
+            
+            # Product Exposure: expdata.parsed 항목별 goodscode로 분류 (한 로그가 여러 goodscode에 속할 수 있음)
+            # expdata 배열이 없는 로그는 단건 조회와 같이 아래 로그 단위 goodscode 추출로 분류
+            expdata_items = self._get_expdata_list(log) if request_type == 'Product Exposure' else None
+            if expdata_items is not None:
+                matched = set()
+                for item in expdata_items:
+                    item_goodscode = self._find_value_recursive(item, ['_p_prod'])
+                    if not item_goodscode:
+                        item_goodscode = self._find_value_recursive(item, ['x_object_id'])
+                    if item_goodscode:
+                        item_goodscode = str(item_goodscode)
+                        if item_goodscode in buckets and item_goodscode not in matched:
+                            matched.add(item_goodscode)
+                            buckets[item_goodscode].append(log)
+                continue
+            
+            log_goodscode = self._extract_goodscode_from_log(log)
+            if log_goodscode and str(log_goodscode) in buckets:
+                buckets[str(log_goodscode)].append(log)
+            # PDP 클릭 이벤트는 goodscode가 없을 수 있음 (단건 조회와 동일하게 모든 goodscode에 포함)
+            elif request_type in _PDP_CLICK_TYPES and log_goodscode is None:
+                for bucket in buckets.values():
+                    bucket.append(log)
+        
+        return buckets
+    
+    def get_product_exposure_logs_by_goodscodes(self, goodscodes: List[str], spm: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        여러 goodscode의 Product Exposure 로그를 한 번의 순회로 반환
+        (get_product_exposure_logs_by_goodscode의 다건 버전, goodscode별 결과는 단건 조회와 동일)
+        
+        Args:
+            goodscodes: 상품 번호 리스트
+            spm: SPM 값 (선택적, 예: "gmktpc.searchlist.cpc")
+        
+        Returns:
+            {goodscode: Product Exposure 로그 리스트 (최대 1건)} 딕셔너리
+        """
+        if not spm:
+            buckets = self.get_logs_by_goodscodes(goodscodes, 'Product Exposure')
+            return {code: self._select_latest_log(logs) for code, logs in buckets.items()}
+        
+        # goodscode별로 (원본 로그, 매칭된 항목 리스트) 누적
+        matched: Dict[str, List[Tuple[Dict[str, Any], List[Any]]]] = {str(code): [] for code in goodscodes}
+        total_items = 0
+        matched_items = 0
+        
+        for log in self.get_logs('Product Exposure'):
+            items_by_code: Dict[str, List[Any]] = {}
+            for item in self._get_expdata_items(log):
+                total_items += 1
+                item_goodscode = self._extract_goodscode_from_product_exposure_item(item)
+                if item_goodscode not in matched:
+                    continue
+                item_spm = self._extract_spm_from_product_exposure_item(item)
+                if item_spm and self._check_spm_match(item_spm, spm):
+                    items_by_code.setdefault(item_goodscode, []).append(item)
+                    matched_items += 1
+            for code, items in items_by_code.items():
+                matched[code].append((log, items))
+        
+        result: Dict[str, List[Dict[str, Any]]] = {}
+        for code, entries in matched.items():
+            if not entries:
+                result[code] = []
+                continue
+            latest_log, items = entries[0]
+            for log, log_items in entries[1:]:
+                if self._get_log_collection_timestamp(log) >= self._get_log_collection_timestamp(latest_log):
+                    latest_log, items = log, log_items
+            result[code] = [self._copy_log_with_expdata_items(latest_log, items)]
+        
+        logger.info(
+            f"SPM '{spm}'로 필터링된 Product Exposure 로그: goodscode {sum(1 for v in result.values() if v)}/{len(result)}개 "
+            f"(매칭된 항목: {matched_items}/{total_items}개)"
+        )
+        return result
+    
     def get_product_click_logs_by_goodscode(self, goodscode: str) -> List[Dict[str, Any]]:
         """
         goodscode 기준으로 Product Click 로그만 반환
@@ -1280,6 +1831,53 @@ class NetworkTracker:
         """goodscode 기준으로 PDP Rental Click 로그만 반환"""
         return self.get_logs_by_goodscode(goodscode, 'PDP Rental Click')
     
+    def _complete_params_decoding(self, params_entry: Any) -> None:
+        """{'raw', 'parsed'} 형태의 params-exp/clk 항목에서 보류된 utLogMap 디코딩 (제자리 수정)"""
+        if not isinstance(params_entry, dict) or not isinstance(params_entry.get('parsed'), dict):
+            return
+        utlogmap = params_entry['parsed'].get('utLogMap')
+        if isinstance(utlogmap, dict) and utlogmap.get('parsed') is None and utlogmap.get('raw'):
+            utlogmap['parsed'] = self._decode_utlogmap(utlogmap['raw'])
+    
+    def get_fully_decoded_log(self, log: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        projection 디코딩으로 보류된 중첩 JSON 값까지 모두 디코딩한 로그 사본 반환
+        (projection 없이 수집된 로그는 그대로 반환, 원본 로그는 수정하지 않음)
+        
+        Args:
+            log: 로그 딕셔너리
+        
+        Returns:
+            전체 디코딩된 로그
+        """
+        if not log.get('projected'):
+            return log
+        
+        full_log = copy.deepcopy(log)
+        full_log.pop('projected', None)
+        payload = full_log.get('payload')
+        decoded_gokey = payload.get('decoded_gokey') if isinstance(payload, dict) else None
+        params = decoded_gokey.get('params') if isinstance(decoded_gokey, dict) else None
+        if not isinstance(params, dict):
+            return full_log
+        
+        for key, value in params.items():
+            if key == 'expdata':
+                items = value.get('parsed') if isinstance(value, dict) else None
+                for item in items or []:
+                    exargs = item.get('exargs') if isinstance(item, dict) else None
+                    if isinstance(exargs, dict):
+                        self._complete_params_decoding(exargs.get('params-exp'))
+                        self._complete_params_decoding(exargs.get('params-clk'))
+            elif key in ('params-clk', 'params-exp'):
+                self._complete_params_decoding(value)
+            elif isinstance(value, str) and self._looks_like_json_string(value):
+                parsed_any = self._parse_json_param(value)
+                if parsed_any is not None:
+                    params[key] = {'raw': value, 'parsed': parsed_any}
+        
+        return full_log
+    
     def get_decoded_gokey_params(self, log: Dict[str, Any], param_key: Optional[str] = None) -> Dict[str, Any]:
         """
         로그에서 디코딩된 gokey 파라미터 조회
@@ -1304,7 +1902,7 @@ class NetworkTracker:
         
         return params
     
-    def validate_payload(self, log: Dict[str, Any], expected_data: Dict[str, Any], goodscode: Optional[str] = None, event_type: Optional[str] = None) -> Tuple[bool, Dict[str, Any]]:
+    def validate_payload(self, log: Dict[str, Any], expected_data: Dict[str, Any], goodscode: Optional[str] = None, event_type: Optional[str] = None, fail_fast: bool = False) -> Tuple[bool, Dict[str, Any]]:
         """
         로그의 payload 정합성 검증 (재귀적 탐색 방식)
         
@@ -1315,6 +1913,7 @@ class NetworkTracker:
                           - validate_payload에서 재귀적으로 찾음
             goodscode: 상품 번호 (Product Exposure의 경우 expdata.parsed 배열에서 필터링용)
             event_type: 이벤트 타입 ('Product Exposure', 'Product Click' 등)
+            fail_fast: True이면 첫 번째 불일치 필드에서 검증 중단
         
         Returns:
             (검증 성공 여부, 통과한 필드와 기대값 딕셔너리) 튜플
@@ -1430,8 +2029,14 @@ class NetworkTracker:
                                         matched_expdata_item = parsed
                                         break
         
+        # 실패 필드 경로는 메시지 렌더링 시에만 계산
+        if event_type == 'PDP PV':
+            path_resolver = lambda field: field if field in payload else None
+        else:
+            path_resolver = lambda field: find_key_path(payload, field)
+        
         # 기대 데이터 검증 (재귀적 탐색 사용)
-        errors = []
+        errors: List[FieldFailure] = []
         passed_fields = {}  # 통과한 필드와 기대값 딕셔너리 {필드명: 기대값}
         for key, expected_value in expected_data.items():
             actual_value = None
@@ -1455,12 +2060,9 @@ class NetworkTracker:
                     field_passed = True
                 else:
                     # actual_value가 있으면 실패 (빈 값이어야 하는데 값이 있음)
-                    errors.append(
-                        f"키 '{key}'의 값이 일치하지 않습니다. "
-                        f"기대값 (빈 문자열): \"\", 실제값: {actual_value}"
-                    )
+                    errors.append(FieldFailure(key, expected_value, actual_value, match_mode=MATCH_EMPTY, path_resolver=path_resolver))
             elif actual_value is None:
-                errors.append(f"키 '{key}'에 해당하는 값이 없습니다.")
+                errors.append(FieldFailure(key, expected_value, None, reason=REASON_MISSING))
             elif isinstance(expected_value, str) and expected_value == "__SKIP__":
                 # skip 필드: 어떤 값이든 통과 (검증 스킵)
                 passed_fields[key] = expected_value  # skip 필드도 통과한 것으로 간주 (기대값 저장)
@@ -1469,16 +2071,13 @@ class NetworkTracker:
                 # mandatory 필드: 빈 값만 아니면 통과
                 # 빈 값 체크: None, 빈 문자열, 공백만 있는 문자열
                 if actual_value is None or (isinstance(actual_value, str) and actual_value.strip() == ""):
-                    errors.append(f"키 '{key}'는 mandatory 필드이지만 값이 비어있습니다.")
+                    errors.append(FieldFailure(key, expected_value, actual_value, reason=REASON_MANDATORY_EMPTY, path_resolver=path_resolver))
                 else:
                     field_passed = True  # 빈 값이 아니면 통과
             elif isinstance(expected_value, list):
                 # expected_value가 리스트인 경우: actual_value가 리스트에 포함되어 있으면 통과
                 if actual_value not in expected_value:
-                    errors.append(
-                        f"키 '{key}'의 값이 일치하지 않습니다. "
-                        f"기대값 (리스트 중 하나): {expected_value}, 실제값: {actual_value}"
-                    )
+                    errors.append(FieldFailure(key, expected_value, actual_value, match_mode=MATCH_ONE_OF, path_resolver=path_resolver))
                 else:
                     field_passed = True
             else:
@@ -1511,50 +2110,35 @@ class NetworkTracker:
                         field_passed = True
                         # 포함 매칭 성공, 다음 필드로 (값 저장은 아래에서)
                     else:
-                        errors.append(
-                            f"키 '{key}'의 값이 일치하지 않습니다. "
-                            f"기대값 (포함 여부): {expected_value}, 실제값: {actual_value}"
-                        )
+                        errors.append(FieldFailure(key, expected_value, actual_value, match_mode=MATCH_CONTAINS, path_resolver=path_resolver))
                 elif key == 'ab_buckets' and isinstance(expected_value, str) and isinstance(actual_value, str):
                     if expected_value in actual_value:
                         field_passed = True
                     else:
-                        errors.append(
-                            f"키 '{key}'의 값이 일치하지 않습니다. "
-                            f"기대값 (포함 여부): {expected_value}, 실제값: {actual_value}"
-                        )
+                        errors.append(FieldFailure(key, expected_value, actual_value, match_mode=MATCH_CONTAINS, path_resolver=path_resolver))
                 elif key in {'query'} and isinstance(expected_value, str) and isinstance(actual_value, str):
                     # query 등: 대소문자 구분 없이 비교
                     if str(expected_value).strip().lower() == str(actual_value).strip().lower():
                         field_passed = True
                     else:
-                        errors.append(
-                            f"키 '{key}'의 값이 일치하지 않습니다. "
-                            f"기대값: {expected_value}, 실제값: {actual_value}"
-                        )
+                        errors.append(FieldFailure(key, expected_value, actual_value, path_resolver=path_resolver))
                 elif str(expected_value) == str(actual_value):
                     # 타입만 다르고 값이 동일한 경우 통과 (예: 기대 "0" vs 실제 0)
                     field_passed = True
                 elif actual_value != expected_value:
-                    errors.append(
-                        f"키 '{key}'의 값이 일치하지 않습니다. "
-                        f"기대값: {expected_value}, 실제값: {actual_value}"
-                    )
+                    errors.append(FieldFailure(key, expected_value, actual_value, path_resolver=path_resolver))
                 else:
                     field_passed = True
             
             # 필드가 통과했으면 딕셔너리에 추가 (필드명: 기대값)
             if field_passed:
                 passed_fields[key] = expected_value
+            elif fail_fast and errors:
+                break
         
         if errors:
-            error_msg = "\n".join(errors)
-            # 디코딩된 payload 정보 포함
-            decoded_info = payload.get('decoded_gokey', {})
-            raise AssertionError(
-                f"Payload 검증 실패:\n{error_msg}\n"
-                f"디코딩된 gokey 파라미터: {json.dumps(decoded_info.get('params', {}), ensure_ascii=False, indent=2)}"
-            )
+            # 메시지(디코딩된 gokey 덤프 포함)는 예외가 표시될 때 렌더링
+            raise PayloadValidationError(errors, log, event_type)
         
         return True, passed_fields
     
@@ -1563,6 +2147,11 @@ class NetworkTracker:
         수집된 모든 로그 초기화
         """
         self.logs.clear()
+        self._type_counts.clear()
+        self.retention_stats.clear()
+        self.raw_logs.clear()
+        self.validation_cache.clear()
+        self._log_generation += 1
         logger.info('로그 초기화 완료')
     
     def __enter__(self):
@@ -0,0 +1,279 @@
+"""
+aplus 비콘 도착 지연 측정
+페이지 객체가 실제 click()/goto()/스크롤 직전에 NetworkTracker에 동작 시각을 기록하고,
+이후 이벤트 타입별 첫 비콘의 전송 시각(payload ts, 없으면 request timing)까지의 지연(ms)을 실행 단위로 집계
+새 탭 지연(클릭 → 새 탭 생성, 새 탭 → load state)도 같은 리포트에 별도 타입으로 집계 (BasePage.expect_new_page 등)
+실행 종료 시 p50/p95/p99와 히스토그램을 JSON 리포트로 저장하여 대기 로직이 참고할 수 있도록 함
+"""
+import json
+import logging
+import math
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+from utils.schema_registry import get_schema_registry
+from utils.parallel import file_lock
+
+logger = logging.getLogger(__name__)
+
+# 리포트 기본 경로
+DEFAULT_LATENCY_REPORT_PATH = Path(__file__).parent.parent / 'json' / 'beacon_latency.json'
+
+# 동작 종류
+ACTION_CLICK = 'click'
+ACTION_NAVIGATION = 'navigation'
+ACTION_SCROLL = 'scroll'
+
+# 새 탭 지연 타입 (비콘 이벤트 타입과 같은 리포트에 집계)
+TAB_OPEN_LATENCY = 'New Tab Open'          # 클릭 → context page 이벤트
+TAB_LOAD_LATENCY_PREFIX = 'New Tab Load'   # 새 탭 → load state (state별로 집계)
+
+# 동작 이후 이 시간 안에 도착한 비콘만 지연으로 집계 (ms)
+DEFAULT_ATTRIBUTION_WINDOW_MS = 30000
+
+# 이벤트 타입별로 보관할 최대 샘플 수 (이전 실행 샘플 포함, 오래된 것부터 버림)
+MAX_SAMPLES_PER_EVENT_TYPE = 500
+
+# 히스토그램 구간 상한 (ms), 마지막 구간은 상한 없음
+HISTOGRAM_BUCKETS_MS = (100, 250, 500, 1000, 2000, 3000, 5000, 10000, 15000, 30000)
+
+# 리포트 포맷 버전
+LATENCY_REPORT_VERSION = 1
+
+# 적응형 타임아웃 (p99 + 여유 시간)
+# config.json: adaptive_timeout ("Y"/"N", 기본 Y), adaptive_timeout_margin_ms (기본 1000)
+DEFAULT_ADAPTIVE_MARGIN_MS = 1000
+# 이 수보다 샘플이 적으면 호출 측 기본 타임아웃 사용
+MIN_ADAPTIVE_SAMPLES = 20
+# 적응형 타임아웃 하한/상한 (ms)
+MIN_ADAPTIVE_TIMEOUT_MS = 2000
+MAX_ADAPTIVE_TIMEOUT_MS = 60000
+
+CONFIG_PATH = Path(__file__).parent.parent / 'config.json'
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """
+    정렬된 값 목록의 백분위수 (nearest-rank)
+
+    Args:
+        sorted_values: 오름차순 정렬된 값
+        pct: 백분위 (0~100)
+
+    Returns:
+        백분위수 또는 None (값 없음)
+    """
+    if not sorted_values:
+        return None
+    rank = max(int(math.ceil(pct / 100.0 * len(sorted_values))), 1)
+    return sorted_values[rank - 1]
+
+
+def tab_load_latency_type(state: str) -> str:
+    """새 탭 load state 대기 지연 타입 (예: 'New Tab Load domcontentloaded')"""
+    return f"{TAB_LOAD_LATENCY_PREFIX} {state}"
+
+
+def _histogram(sorted_values: List[float]) -> Dict[str, int]:
+    buckets: Dict[str, int] = {}
+    lower = 0
+    idx = 0
+    for upper in HISTOGRAM_BUCKETS_MS:
+        count = 0
+        while idx < len(sorted_values) and sorted_values[idx] <= upper:
+            count += 1
+            idx += 1
+        buckets[f"{lower}-{upper}"] = count
+        lower = upper
+    buckets[f"{lower}+"] = len(sorted_values) - idx
+    return buckets
+
+
+class BeaconLatencyRecorder:
+    """
+    실행 단위 비콘 지연 샘플 집계
+
+    - record: 이벤트 타입별 지연(ms) 샘플 추가 (여러 tracker에서 동시에 호출 가능)
+    - summary: 이벤트 타입별 count/p50/p95/p99/max/히스토그램
+    - write_report: 이전 리포트 샘플과 합쳐 JSON 파일로 저장
+    """
+
+    def __init__(self):
+        self._samples: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, event_type: str, latency_ms: float, action_kind: Optional[str] = None) -> None:
+        """
+        지연 샘플 추가
+
+        Args:
+            event_type: 이벤트 타입
+            latency_ms: 동작 → 비콘 도착 지연 (ms)
+            action_kind: 동작 종류 (click, navigation, scroll, 디버그 로그용)
+        """
+        with self._lock:
+            self._samples.setdefault(event_type, []).append(round(float(latency_ms), 1))
+        logger.debug(f"비콘 지연 기록: {event_type} {latency_ms:.0f}ms (동작: {action_kind})")
+
+    def samples(self) -> Dict[str, List[float]]:
+        """이벤트 타입별 샘플 사본"""
+        with self._lock:
+            return {event_type: list(values) for event_type, values in self._samples.items()}
+
+    @staticmethod
+    def summarize(samples: Dict[str, List[float]]) -> Dict[str, Dict[str, Any]]:
+        """샘플 딕셔너리를 이벤트 타입별 통계로 변환"""
+        summary = {}
+        for event_type, values in samples.items():
+            ordered = sorted(values)
+            if not ordered:
+                continue
+            summary[event_type] = {
+                'count': len(ordered),
+                'p50': percentile(ordered, 50),
+                'p95': percentile(ordered, 95),
+                'p99': percentile(ordered, 99),
+                'max': ordered[-1],
+                'histogram': _histogram(ordered),
+            }
+        return summary
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """현재 실행의 이벤트 타입별 통계"""
+        return self.summarize(self.samples())
+
+    def write_report(self, path: Optional[Path] = None) -> Optional[Path]:
+        """
+        이전 리포트의 샘플과 현재 실행 샘플을 합쳐 리포트 저장
+        (이벤트 타입별 최근 MAX_SAMPLES_PER_EVENT_TYPE개만 유지)
+
+        Args:
+            path: 리포트 경로 (기본: json/beacon_latency.json)
+
+        Returns:
+            저장한 경로 또는 None (현재 실행 샘플 없음)
+        """
+        current = self.samples()
+        if not current:
+            return None
+
+        path = Path(path) if path else DEFAULT_LATENCY_REPORT_PATH
+        # xdist 워커들이 동시에 병합·저장하지 않도록 잠금
+        with file_lock(path.with_name(f"{path.name}.lock")):
+            return self._merge_and_write(path, current)
+
+    def _merge_and_write(self, path: Path, current: Dict[str, List[float]]) -> Path:
+        previous = load_latency_report(path) or {}
+        merged: Dict[str, List[float]] = {
+            event_type: list(entry.get('samples', []))
+            for event_type, entry in previous.get('event_types', {}).items()
+        }
+        for event_type, values in current.items():
+            merged.setdefault(event_type, []).extend(values)
+        merged = {event_type: values[-MAX_SAMPLES_PER_EVENT_TYPE:] for event_type, values in merged.items()}
+
+        summary = self.summarize(merged)
+        report = {
+            'version': LATENCY_REPORT_VERSION,
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+            'event_types': {
+                event_type: dict(stats, samples=merged[event_type], run_count=len(current.get(event_type, [])))
+                for event_type, stats in summary.items()
+            },
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return path
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+def load_latency_report(path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """
+    저장된 지연 리포트 로드
+
+    Args:
+        path: 리포트 경로 (기본: json/beacon_latency.json)
+
+    Returns:
+        리포트 딕셔너리 또는 None (없거나 형식 불일치)
+    """
+    path = Path(path) if path else DEFAULT_LATENCY_REPORT_PATH
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"비콘 지연 리포트 로드 실패: {path} ({e})")
+        return None
+    if not isinstance(report, dict) or report.get('version') != LATENCY_REPORT_VERSION:
+        return None
+    return report
+
+
+def _adaptive_config() -> Dict[str, Any]:
+    try:
+        return get_schema_registry().load_json(CONFIG_PATH)
+    except FileNotFoundError:
+        return {}
+
+
+def adaptive_timeout_ms(event_type: str, default_ms: int, path: Optional[Path] = None) -> int:
+    """
+    저장된 지연 리포트의 p99 + 여유 시간으로 이벤트 타입별 대기 타임아웃 계산
+
+    Args:
+        event_type: 기다리는 비콘의 이벤트 타입 (예: 'PDP PV')
+        default_ms: 리포트가 없거나 샘플이 부족할 때, 또는 기능을 끈 경우 사용할 타임아웃
+        path: 리포트 경로 (기본: json/beacon_latency.json)
+
+    Returns:
+        타임아웃 (ms, MIN_ADAPTIVE_TIMEOUT_MS ~ MAX_ADAPTIVE_TIMEOUT_MS)
+    """
+    config = _adaptive_config()
+    if str(config.get('adaptive_timeout', 'Y')).upper() != 'Y':
+        return default_ms
+
+    path = Path(path) if path else DEFAULT_LATENCY_REPORT_PATH
+    if not path.exists():
+        return default_ms
+    try:
+        # 레지스트리 캐시 사용 (리포트 파일이 바뀐 경우에만 다시 읽음)
+        report = get_schema_registry().load_json(path)
+    except (OSError, json.JSONDecodeError):
+        return default_ms
+    if not isinstance(report, dict) or report.get('version') != LATENCY_REPORT_VERSION:
+        return default_ms
+
+    stats = report.get('event_types', {}).get(event_type)
+    if not stats or stats.get('count', 0) < MIN_ADAPTIVE_SAMPLES or stats.get('p99') is None:
+        return default_ms
+
+    margin_ms = config.get('adaptive_timeout_margin_ms', DEFAULT_ADAPTIVE_MARGIN_MS)
+    try:
+        margin_ms = float(margin_ms)
+    except (TypeError, ValueError):
+        margin_ms = DEFAULT_ADAPTIVE_MARGIN_MS
+    timeout = int(min(max(stats['p99'] + margin_ms, MIN_ADAPTIVE_TIMEOUT_MS), MAX_ADAPTIVE_TIMEOUT_MS))
+    logger.debug(f"적응형 타임아웃: {event_type} p99={stats['p99']:.0f}ms → {timeout}ms (기본 {default_ms}ms)")
+    return timeout
+
+
+_recorder: Optional[BeaconLatencyRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def get_latency_recorder() -> BeaconLatencyRecorder:
+    """프로세스 단위 BeaconLatencyRecorder 인스턴스 반환"""
+    global _recorder
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                _recorder = BeaconLatencyRecorder()
+    return _recorder
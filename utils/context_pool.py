@@ -0,0 +1,283 @@
+"""
+브라우저 컨텍스트 풀
+시나리오마다 browser.new_context(storage_state=...)로 새로 만드는 대신, 만들어 둔 컨텍스트를 초기화해서 재사용
+(storage state 파싱 생략, HTTP 캐시 유지)
+
+반납 시 초기화:
+- 열린 페이지 모두 닫기
+- 쿠키를 저장된 로그인 state의 쿠키로 되돌림 (시나리오 중 생긴 쿠키 제거, 인증 쿠키 유지)
+- 시나리오 중 생긴 origin의 localStorage/sessionStorage 비우고 로그인 state의 localStorage 복원
+- 같은 origin의 IndexedDB, CacheStorage 삭제 및 서비스 워커 등록 해제
+- 권한, 라우트 해제
+트래커 리스너 해제는 반납 전에 호출 측(conftest context fixture)에서 tracker.stop()으로 수행
+config.json context_pool_size가 0(기본)이거나 fresh_context 마커/태그가 있으면 시나리오마다 새 컨텍스트 사용
+
+PersistentProfileContext: config.json persistent_profile이 Y이면 전용 프로필 폴더로 launch_persistent_context를 띄워
+디스크 HTTP 캐시(JS/CSS 번들 등)를 시나리오·실행 간에 유지하고, 시나리오마다 같은 방식으로 쿠키/storage만 초기화
+(aplus cna 등 이전 시나리오·실행의 트래킹 쿠키는 남지 않고 새 컨텍스트와 같은 로그인 state 값으로 시작)
+"""
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from utils.parallel import get_worker_id
+from utils.validation_helpers import _load_config
+
+logger = logging.getLogger(__name__)
+
+# config.json 키 (풀에 보관할 유휴 컨텍스트 수, 0이면 풀 사용 안 함, 기본 0)
+CONTEXT_POOL_SIZE_CONFIG_KEY = 'context_pool_size'
+DEFAULT_CONTEXT_POOL_SIZE = 0
+
+# 시나리오마다 새 컨텍스트를 쓰도록 지정하는 마커 (Feature/Scenario 태그 @fresh_context)
+FRESH_CONTEXT_MARKER = 'fresh_context'
+
+# config.json 키 (영구 프로필 모드 Y/N, 기본 N / 프로필 폴더, 기본 .browser_profile)
+PERSISTENT_PROFILE_CONFIG_KEY = 'persistent_profile'
+PERSISTENT_PROFILE_DIR_CONFIG_KEY = 'persistent_profile_dir'
+DEFAULT_PERSISTENT_PROFILE_DIR = Path(__file__).parent.parent / '.browser_profile'
+
+# storage 초기화용 빈 문서 경로 (route로 응답, 실제 서버 요청 없음)
+_RESET_PATH = '/__context_pool_reset__'
+_BLANK_HTML = '<!doctype html><html><head></head><body></body></html>'
+
+
+def get_context_pool_size() -> int:
+    """config.json의 context_pool_size (기본 0, 0이면 풀 사용 안 함)"""
+    try:
+        return max(0, int(_load_config().get(CONTEXT_POOL_SIZE_CONFIG_KEY, DEFAULT_CONTEXT_POOL_SIZE)))
+    except (TypeError, ValueError):
+        return DEFAULT_CONTEXT_POOL_SIZE
+
+
+def is_persistent_profile_enabled() -> bool:
+    """config.json의 persistent_profile 값 (Y/N, 기본 N)"""
+    return str(_load_config().get(PERSISTENT_PROFILE_CONFIG_KEY, 'N')).strip().upper() == 'Y'
+
+
+def get_persistent_profile_dir() -> Path:
+    """
+    영구 프로필 폴더 (xdist 워커면 워커 ID 하위 폴더, Chromium 프로필은 여러 프로세스가 동시에 쓸 수 없음)
+
+    Returns:
+        config.json persistent_profile_dir (상대 경로는 프로젝트 루트 기준, 기본 .browser_profile)
+    """
+    configured = _load_config().get(PERSISTENT_PROFILE_DIR_CONFIG_KEY)
+    profile_dir = Path(configured) if configured else DEFAULT_PERSISTENT_PROFILE_DIR
+    if not profile_dir.is_absolute():
+        profile_dir = Path(__file__).parent.parent / profile_dir
+    worker_id = get_worker_id()
+    return profile_dir / worker_id if worker_id else profile_dir
+
+
+def _load_state(state_path: str) -> Dict[str, Any]:
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"로그인 state 로드 실패: {state_path} ({e})")
+        return {}
+
+
+class BrowserContextPool:
+    """
+    로그인 state 파일별 유휴 컨텍스트 풀
+
+    - acquire(state_path): 같은 state의 유휴 컨텍스트가 있으면 반환, 없으면 새로 생성
+    - release(context): 초기화 후 유휴 목록에 보관 (가득 찼거나 초기화 실패 시 종료)
+    - close(): 유휴 컨텍스트 모두 종료 (세션 종료 시)
+    """
+
+    def __init__(self, browser: Any, size: int = DEFAULT_CONTEXT_POOL_SIZE):
+        """
+        BrowserContextPool 초기화
+
+        Args:
+            browser: Playwright Browser
+            size: 보관할 유휴 컨텍스트 최대 수
+        """
+        self._browser = browser
+        self.size = size
+        self._idle: List[Tuple[str, Any]] = []
+        self._state_paths: Dict[int, str] = {}
+        # 초기화 기준 state 캐시 {state_path: (mtime, state)}, 재로그인으로 파일이 바뀌면 다시 읽음
+        self._states: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self.stats = {'created': 0, 'reused': 0, 'reset_failed': 0}
+
+    def _baseline(self, state_path: str) -> Dict[str, Any]:
+        try:
+            mtime = os.path.getmtime(state_path)
+        except OSError:
+            mtime = 0.0
+        cached = self._states.get(state_path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, _load_state(state_path))
+            self._states[state_path] = cached
+        return cached[1]
+
+    def acquire(self, state_path: str) -> Any:
+        """
+        state_path 로그인 상태의 컨텍스트
+
+        Args:
+            state_path: 로그인 state 파일 경로
+
+        Returns:
+            BrowserContext (열린 페이지 없음)
+        """
+        for idx, (idle_state_path, context) in enumerate(self._idle):
+            if idle_state_path == state_path:
+                del self._idle[idx]
+                self.stats['reused'] += 1
+                return context
+        context = self._browser.new_context(storage_state=state_path)
+        self._state_paths[id(context)] = state_path
+        self.stats['created'] += 1
+        return context
+
+    def release(self, context: Any) -> None:
+        """
+        컨텍스트 반납 (초기화 후 보관, 보관할 수 없으면 종료)
+
+        Args:
+            context: acquire로 받은 BrowserContext
+        """
+        state_path = self._state_paths.get(id(context))
+        if state_path is None or len(self._idle) >= self.size:
+            self._close(context)
+            return
+        try:
+            self.reset(context, state_path)
+        except Exception as e:
+            self.stats['reset_failed'] += 1
+            logger.warning(f"컨텍스트 초기화 실패, 종료 후 다음 시나리오에서 새로 생성: {e}")
+            self._close(context)
+            return
+        self._idle.append((state_path, context))
+
+    def reset(self, context: Any, state_path: str) -> None:
+        """
+        컨텍스트를 state_path로 새로 만든 것과 같은 상태로 초기화 (HTTP 캐시는 유지)
+
+        Args:
+            context: BrowserContext
+            state_path: 로그인 state 파일 경로
+        """
+        for page in list(context.pages):
+            page.close()
+
+        baseline = self._baseline(state_path)
+        baseline_storage = {
+            origin['origin']: origin.get('localStorage', [])
+            for origin in baseline.get('origins', [])
+            if origin.get('origin')
+        }
+        current_origins = [
+            origin['origin'] for origin in context.storage_state().get('origins', []) if origin.get('origin')
+        ]
+        origins = list(dict.fromkeys(current_origins + list(baseline_storage)))
+        if origins:
+            self._reset_storage(context, origins, baseline_storage)
+
+        context.clear_cookies()
+        if baseline.get('cookies'):
+            context.add_cookies(baseline['cookies'])
+        context.clear_permissions()
+        if hasattr(context, 'unroute_all'):
+            context.unroute_all()
+
+    def _reset_storage(self, context: Any, origins: List[str], baseline_storage: Dict[str, List[Dict[str, str]]]) -> None:
+        """
+        origin별 빈 문서를 route로 띄워 localStorage/sessionStorage/IndexedDB/CacheStorage를 비우고
+        서비스 워커 등록을 해제한 뒤 로그인 state의 localStorage 항목 복원
+        """
+        page = context.new_page()
+        try:
+            page.route(f"**{_RESET_PATH}", lambda route: route.fulfill(status=200, content_type='text/html', body=_BLANK_HTML))
+            for origin in origins:
+                page.goto(f"{origin}{_RESET_PATH}")
+                page.evaluate(
+                    """async (items) => {
+                        localStorage.clear();
+                        sessionStorage.clear();
+                        for (const item of items) localStorage.setItem(item.name, item.value);
+                        if (indexedDB.databases) {
+                            const databases = await indexedDB.databases();
+                            await Promise.all(databases.map((db) => new Promise((resolve) => {
+                                const request = indexedDB.deleteDatabase(db.name);
+                                request.onsuccess = request.onerror = request.onblocked = () => resolve();
+                            })));
+                        }
+                        if (self.caches) {
+                            const names = await caches.keys();
+                            await Promise.all(names.map((name) => caches.delete(name)));
+                        }
+                        if (navigator.serviceWorker) {
+                            const registrations = await navigator.serviceWorker.getRegistrations();
+                            await Promise.all(registrations.map((registration) => registration.unregister()));
+                        }
+                    }""",
+                    baseline_storage.get(origin, []),
+                )
+        finally:
+            page.close()
+
+    def _close(self, context: Any) -> None:
+        self._state_paths.pop(id(context), None)
+        try:
+            context.close()
+        except Exception as e:
+            logger.debug(f"컨텍스트 종료 중 오류 (무시됨): {e}")
+
+    def close(self) -> None:
+        """유휴 컨텍스트 모두 종료"""
+        while self._idle:
+            _, context = self._idle.pop()
+            self._close(context)
+        logger.info(f"컨텍스트 풀 종료: {self.stats}")
+
+
+class PersistentProfileContext(BrowserContextPool):
+    """
+    전용 프로필 폴더의 영구 컨텍스트 하나를 모든 시나리오가 공유 (BrowserContextPool과 같은 acquire/release/close)
+
+    - acquire(state_path): 이전 시나리오·이전 실행이 남긴 페이지/쿠키/storage를 state_path 기준으로 초기화 후 반환
+      (회원 종류가 바뀌어도 쿠키만 교체하면 되므로 같은 컨텍스트 사용)
+    - release(context): 열린 페이지만 닫음 (초기화는 다음 acquire에서)
+    - close(): 컨텍스트 종료 (프로필 폴더와 HTTP 캐시는 남음)
+    """
+
+    def __init__(self, pw: Any, profile_dir: Path, **launch_options: Any):
+        """
+        PersistentProfileContext 초기화 (launch_persistent_context 실행)
+
+        Args:
+            pw: Playwright 인스턴스
+            profile_dir: 프로필 폴더
+            launch_options: launch_persistent_context 추가 옵션 (기본 headless=False)
+        """
+        super().__init__(browser=None, size=1)
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        launch_options.setdefault('headless', False)
+        self.profile_dir = profile_dir
+        self._context = pw.chromium.launch_persistent_context(str(profile_dir), **launch_options)
+        self.stats['created'] += 1
+        logger.info(f"영구 프로필 컨텍스트 시작: {profile_dir}")
+
+    def acquire(self, state_path: str) -> Any:
+        self.reset(self._context, state_path)
+        self.stats['reused'] += 1
+        return self._context
+
+    def release(self, context: Any) -> None:
+        for page in list(context.pages):
+            page.close()
+
+    def close(self) -> None:
+        try:
+            self._context.close()
+        except Exception as e:
+            logger.debug(f"영구 프로필 컨텍스트 종료 중 오류 (무시됨): {e}")
+        logger.info(f"영구 프로필 컨텍스트 종료: {self.stats}")
@@ -0,0 +1,237 @@
+"""
+이벤트 순서·지연 제약 검증
+모듈 스키마의 "constraints" 항목에 선언한 이벤트 간 순서/시간 제약을 트래커 로그로 검증
+
+스키마 선언 예시 (tracking_schemas/<AREA>/<module>.json):
+{
+    "product_exposure": {...},
+    "product_click": {...},
+    "constraints": [
+        "product_exposure precedes product_click",
+        "pdp_pv within 3s of product_click",
+        {"type": "within", "event": "pdp_pv", "anchor": "product_click", "max_ms": 3000}
+    ]
+}
+
+- A precedes B: 모든 B 로그 이전에 A 로그가 하나 이상 있어야 함
+- A within Ns of B: 모든 B 로그 이후 N초(ms) 이내에 A 로그가 있어야 함
+
+각 제약은 수집 시각 순으로 정렬한 두 로그 목록을 한 번씩만 훑는 병합 방식으로 검증
+"""
+import logging
+import re
+from typing import Dict, List, Optional, Any, Union
+
+from utils.validation_helpers import EVENT_TYPE_CONFIG_KEY_MAP, get_event_logs
+
+logger = logging.getLogger(__name__)
+
+# 모듈 스키마 내 제약 목록 키
+CONSTRAINTS_KEY = 'constraints'
+
+# 제약 종류
+CONSTRAINT_PRECEDES = 'precedes'
+CONSTRAINT_WITHIN = 'within'
+
+_PRECEDES_PATTERN = re.compile(r'^\s*(?P<first>[\w ]+?)\s+precedes\s+(?P<second>[\w ]+?)\s*$', re.IGNORECASE)
+_WITHIN_PATTERN = re.compile(
+    r'^\s*(?P<event>[\w ]+?)\s+within\s+(?P<amount>\d+(?:\.\d+)?)\s*(?P<unit>ms|s)\s+of\s+(?P<anchor>[\w ]+?)\s*$',
+    re.IGNORECASE,
+)
+
+# config 키 → 이벤트 타입 (예: product_click → Product Click)
+_CONFIG_KEY_EVENT_TYPE_MAP = {config_key: event_type for event_type, config_key in EVENT_TYPE_CONFIG_KEY_MAP.items()}
+
+
+def _to_event_type(name: str) -> str:
+    """config 키(product_click) 또는 이벤트 타입(Product Click)을 이벤트 타입으로 변환"""
+    name = name.strip()
+    if name in EVENT_TYPE_CONFIG_KEY_MAP:
+        return name
+    event_type = _CONFIG_KEY_EVENT_TYPE_MAP.get(name.lower())
+    if event_type is None:
+        raise ValueError(f"알 수 없는 이벤트: {name}")
+    return event_type
+
+
+class EventConstraint:
+    """
+    이벤트 간 제약 하나
+
+    - kind == precedes: first 로그가 모든 second 로그보다 먼저 수집되어야 함
+    - kind == within: first 로그가 모든 second(anchor) 로그 이후 max_ms 이내에 수집되어야 함
+    """
+
+    def __init__(self, kind: str, first: str, second: str, max_ms: Optional[float] = None, source: Optional[str] = None):
+        """
+        EventConstraint 초기화
+
+        Args:
+            kind: CONSTRAINT_PRECEDES 또는 CONSTRAINT_WITHIN
+            first: 먼저 와야 하는 이벤트(precedes) / 기다리는 이벤트(within)
+            second: 나중에 오는 이벤트(precedes) / 기준 이벤트(within)
+            max_ms: within 허용 지연 (밀리초)
+            source: 스키마에 선언된 원문 (리포트 표시용)
+        """
+        self.kind = kind
+        self.first = first
+        self.second = second
+        self.max_ms = max_ms
+        self.source = source or self.describe()
+
+    @property
+    def subject(self) -> str:
+        """이 제약을 리포트할 이벤트 타입 (precedes는 나중 이벤트, within은 기다리는 이벤트)"""
+        return self.second if self.kind == CONSTRAINT_PRECEDES else self.first
+
+    def describe(self) -> str:
+        if self.kind == CONSTRAINT_PRECEDES:
+            return f"{self.first} precedes {self.second}"
+        return f"{self.first} within {self.max_ms:g}ms of {self.second}"
+
+    def check(self, first_times: List[float], second_times: List[float]) -> List[str]:
+        """
+        정렬된 수집 시각(초) 목록으로 제약 검증 (두 목록을 한 번씩만 순회)
+
+        Args:
+            first_times: first 이벤트 로그 수집 시각 (오름차순)
+            second_times: second 이벤트 로그 수집 시각 (오름차순)
+
+        Returns:
+            위반 메시지 리스트
+        """
+        violations: List[str] = []
+        i = 0
+        if self.kind == CONSTRAINT_PRECEDES:
+            # second 각각에 대해 그 이전(같은 시각 포함)에 first가 하나라도 있는지 확인
+            for t in second_times:
+                while i < len(first_times) and first_times[i] <= t:
+                    i += 1
+                if i == 0:
+                    violations.append(
+                        f"이벤트 순서 제약 위반 ({self.source}): {self.second} 로그 이전에 {self.first} 로그가 없습니다."
+                    )
+            return violations
+
+        # within: second 각각에 대해 그 이후 첫 first까지의 지연 확인
+        for t in second_times:
+            while i < len(first_times) and first_times[i] < t:
+                i += 1
+            if i == len(first_times):
+                violations.append(
+                    f"이벤트 지연 제약 위반 ({self.source}): {self.second} 이후 {self.first} 로그가 수집되지 않았습니다."
+                )
+                continue
+            latency_ms = (first_times[i] - t) * 1000.0
+            if latency_ms > self.max_ms:
+                violations.append(
+                    f"이벤트 지연 제약 위반 ({self.source}): {self.second} 이후 {self.first}까지 "
+                    f"{latency_ms:.0f}ms (허용 {self.max_ms:g}ms)"
+                )
+        return violations
+
+    def __repr__(self) -> str:
+        return f"EventConstraint({self.describe()!r})"
+
+
+def parse_constraint(spec: Union[str, Dict[str, Any]]) -> EventConstraint:
+    """
+    스키마의 제약 선언 하나를 EventConstraint로 변환
+
+    Args:
+        spec: "A precedes B", "A within 3s of B" 형태 문자열 또는
+              {"type": "precedes", "before": A, "after": B} /
+              {"type": "within", "event": A, "anchor": B, "max_ms": 3000} 딕셔너리
+
+    Returns:
+        EventConstraint
+
+    Raises:
+        ValueError: 형식이 올바르지 않거나 알 수 없는 이벤트
+    """
+    if isinstance(spec, str):
+        match = _PRECEDES_PATTERN.match(spec)
+        if match:
+            return EventConstraint(
+                CONSTRAINT_PRECEDES, _to_event_type(match.group('first')), _to_event_type(match.group('second')), source=spec.strip()
+            )
+        match = _WITHIN_PATTERN.match(spec)
+        if match:
+            amount = float(match.group('amount'))
+            max_ms = amount * 1000.0 if match.group('unit').lower() == 's' else amount
+            return EventConstraint(
+                CONSTRAINT_WITHIN, _to_event_type(match.group('event')), _to_event_type(match.group('anchor')), max_ms, source=spec.strip()
+            )
+        raise ValueError(f"제약 형식을 해석할 수 없습니다: {spec}")
+
+    if isinstance(spec, dict):
+        kind = str(spec.get('type', '')).lower()
+        if kind == CONSTRAINT_PRECEDES:
+            return EventConstraint(kind, _to_event_type(spec['before']), _to_event_type(spec['after']))
+        if kind == CONSTRAINT_WITHIN:
+            return EventConstraint(kind, _to_event_type(spec['event']), _to_event_type(spec['anchor']), float(spec['max_ms']))
+    raise ValueError(f"제약 형식을 해석할 수 없습니다: {spec}")
+
+
+def load_constraints(module_config: Dict[str, Any]) -> List[EventConstraint]:
+    """
+    모듈 스키마의 제약 목록 로드 (형식이 잘못된 항목은 경고 후 무시)
+
+    Args:
+        module_config: 모듈 스키마 딕셔너리
+
+    Returns:
+        EventConstraint 리스트
+    """
+    specs = module_config.get(CONSTRAINTS_KEY) if isinstance(module_config, dict) else None
+    if not specs:
+        return []
+    constraints = []
+    for spec in specs:
+        try:
+            constraints.append(parse_constraint(spec))
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"이벤트 제약 무시: {spec} ({e})")
+    return constraints
+
+
+def check_event_constraints(
+    tracker: Any,
+    goodscode: str,
+    module_config: Dict[str, Any],
+    event_type: Optional[str] = None,
+    constraints: Optional[List[EventConstraint]] = None,
+) -> List[str]:
+    """
+    모듈 스키마에 선언된 이벤트 제약 검증
+    수집 시각은 최신 1건이 아닌 매칭 로그 전체 기준 (클릭 이후 다시 발생한 노출 로그로 순서가 뒤집히지 않도록)
+
+    Args:
+        tracker: NetworkTracker 인스턴스
+        goodscode: 상품 번호
+        module_config: 모듈 스키마 딕셔너리
+        event_type: 지정하면 이 이벤트 타입을 대상으로 하는 제약만 검증 (해당 이벤트 검증 스텝에서 함께 리포트)
+        constraints: 미리 해석한 제약 목록 (None이면 module_config에서 해석, ScenarioValidationContext.constraints 참고)
+
+    Returns:
+        위반 메시지 리스트
+    """
+    if constraints is None:
+        constraints = load_constraints(module_config)
+    constraints = [c for c in constraints if event_type is None or c.subject == event_type]
+    if not constraints:
+        return []
+
+    # 이벤트 타입별 수집 시각 목록은 한 번만 만들어 제약 간에 공유
+    times_by_type: Dict[str, List[float]] = {}
+
+    def times(target_type: str) -> List[float]:
+        if target_type not in times_by_type:
+            logs = get_event_logs(tracker, target_type, goodscode, module_config, latest_only=False)
+            times_by_type[target_type] = sorted(tracker._get_log_collection_timestamp(log) for log in logs)
+        return times_by_type[target_type]
+
+    violations: List[str] = []
+    for constraint in constraints:
+        violations.extend(constraint.check(times(constraint.first), times(constraint.second)))
+    return violations
@@ -0,0 +1,162 @@
+"""
+Product Exposure 노출 위치 검증
+Exposure 비콘의 _x, _y, _w, _h 값을 화면(DOM)의 상품 위치와 비교하고,
+_rate는 비콘 자신의 _x/_y/_w/_h와 비콘 전송 시점의 뷰포트(NetworkTracker.get_log_viewport)로 계산한 노출 비율과 비교
+모듈 내 전체 상품의 위치는 BasePage.get_product_bounding_boxes로 한 번에 수집하고,
+비교는 상품 전체를 numpy 배열 단위로 수행
+"""
+import logging
+import math
+from typing import Dict, List, Optional, Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 위치(_x, _y) 허용 오차 (px)
+DEFAULT_OFFSET_TOLERANCE = 5.0
+# 크기(_w, _h) 허용 오차 (px)
+DEFAULT_SIZE_TOLERANCE = 2.0
+# 노출 비율(_rate) 허용 오차
+DEFAULT_RATE_TOLERANCE = 0.05
+
+# 비교 대상 비콘 필드 (exargs 내)
+GEOMETRY_FIELDS = ('_x', '_y', '_w', '_h', '_rate')
+# 비콘 전송 시점 뷰포트 (scrollX, scrollY, 너비, 높이), 기록이 없으면 NaN
+VIEWPORT_FIELDS = ('viewport_x', 'viewport_y', 'viewport_w', 'viewport_h')
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _normalize_rate(rate: float) -> float:
+    """_rate를 0~1 비율로 정규화 (퍼센트로 오는 경우 대비)"""
+    return rate / 100.0 if rate > 1 else rate
+
+
+def extract_exposure_geometry(tracker: Any, logs: List[Dict[str, Any]], spm: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Product Exposure 로그에서 상품별 노출 위치 추출 (같은 상품은 최신 로그 우선)
+
+    Args:
+        tracker: NetworkTracker 인스턴스
+        logs: Product Exposure 로그 리스트
+        spm: 모듈 SPM (있으면 SPM이 일치하는 항목만)
+
+    Returns:
+        {goodscode: {"_x", "_y", "_w", "_h", "_rate", "viewport_x", "viewport_y", "viewport_w", "viewport_h"}}
+        딕셔너리 (_x~_rate를 모두 읽을 수 있는 항목만, 비콘 시점 뷰포트 기록이 없으면 viewport_* 는 NaN)
+    """
+    geometry: Dict[str, Dict[str, float]] = {}
+    for log in sorted(logs, key=tracker._get_log_collection_timestamp):
+        viewport = tracker.get_log_viewport(log) or (math.nan,) * len(VIEWPORT_FIELDS)
+        for item in tracker._get_expdata_items(log):
+            if not isinstance(item, dict) or not isinstance(item.get('exargs'), dict):
+                continue
+            if spm:
+                item_spm = tracker._extract_spm_from_product_exposure_item(item)
+                if not item_spm or not tracker._check_spm_match(item_spm, spm):
+                    continue
+            goodscode = tracker._extract_goodscode_from_product_exposure_item(item)
+            if not goodscode:
+                continue
+            values = {field: _to_float(item['exargs'].get(field)) for field in GEOMETRY_FIELDS}
+            if any(value is None for value in values.values()):
+                continue
+            values['_rate'] = _normalize_rate(values['_rate'])
+            values.update(zip(VIEWPORT_FIELDS, viewport))
+            geometry[str(goodscode)] = values
+    return geometry
+
+
+def beacon_visible_ratio(beacon: np.ndarray) -> np.ndarray:
+    """
+    비콘의 _x/_y/_w/_h 상자가 비콘 시점 뷰포트에 보이는 면적 비율 (행 단위, 뷰포트를 모르면 NaN)
+
+    Args:
+        beacon: [_x, _y, _w, _h, _rate, viewport_x, viewport_y, viewport_w, viewport_h] 행 배열
+    """
+    x, y, w, h = beacon[:, 0], beacon[:, 1], beacon[:, 2], beacon[:, 3]
+    vx, vy, vw, vh = beacon[:, 5], beacon[:, 6], beacon[:, 7], beacon[:, 8]
+    visible_w = np.clip(np.minimum(x + w, vx + vw) - np.maximum(x, vx), 0, None)
+    visible_h = np.clip(np.minimum(y + h, vy + vh) - np.maximum(y, vy), 0, None)
+    area = w * h
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(area > 0, visible_w * visible_h / area, 0.0)
+
+
+def _compare(beacon: np.ndarray, dom: np.ndarray, offset_tolerance: float, size_tolerance: float, rate_tolerance: float, check_rate: bool):
+    diff = np.abs(beacon[:, :4] - dom[:, :4])
+    offset_bad = (diff[:, 0] > offset_tolerance) | (diff[:, 1] > offset_tolerance)
+    size_bad = (diff[:, 2] > size_tolerance) | (diff[:, 3] > size_tolerance)
+    ratio = beacon_visible_ratio(beacon)
+    if check_rate:
+        # 비콘 시점 뷰포트 기록이 없는 상품(NaN)은 비교하지 않음
+        rate_bad = ~np.isnan(ratio) & (ratio + rate_tolerance < beacon[:, 4])
+    else:
+        rate_bad = np.zeros(len(beacon), dtype=bool)
+    return offset_bad, size_bad, rate_bad, ratio
+
+
+def check_exposure_geometry(
+    dom_boxes: List[Dict[str, Any]],
+    beacon_geometry: Dict[str, Dict[str, float]],
+    goodscodes: Optional[List[str]] = None,
+    offset_tolerance: float = DEFAULT_OFFSET_TOLERANCE,
+    size_tolerance: float = DEFAULT_SIZE_TOLERANCE,
+    rate_tolerance: float = DEFAULT_RATE_TOLERANCE,
+    check_rate: bool = True,
+) -> List[str]:
+    """
+    비콘 위치 정보와 DOM 위치 정보를 상품 전체에 대해 한 번에 비교
+
+    Args:
+        dom_boxes: BasePage.get_product_bounding_boxes 결과
+        beacon_geometry: extract_exposure_geometry 결과
+        goodscodes: 검증할 상품 번호 (None이면 비콘이 있는 모든 상품)
+        offset_tolerance: _x, _y 허용 오차 (px)
+        size_tolerance: _w, _h 허용 오차 (px)
+        rate_tolerance: _rate 허용 오차
+        check_rate: 비콘 자신의 _x/_y/_w/_h와 비콘 전송 시점 뷰포트로 계산한 노출 비율이 _rate보다 작으면 실패 처리
+                    (현재 화면이 아니라 비콘 시점 기준이라 이후 스크롤/캐러셀 이동과 무관)
+
+    Returns:
+        실패 메시지 리스트 (비어 있으면 통과)
+    """
+    dom_by_code = {str(box['goodscode']): box for box in dom_boxes}
+    codes = [str(code) for code in goodscodes] if goodscodes else list(beacon_geometry)
+
+    errors: List[str] = []
+    matched: List[str] = []
+    for code in codes:
+        if code not in beacon_geometry:
+            errors.append(f"상품 '{code}'의 Exposure 위치 정보(_x/_y/_w/_h/_rate)가 없습니다.")
+        elif code not in dom_by_code:
+            errors.append(f"상품 '{code}'가 화면의 모듈 내에 없습니다.")
+        else:
+            matched.append(code)
+    if not matched:
+        return errors
+
+    beacon_rows = np.array(
+        [[beacon_geometry[code].get(field, math.nan) for field in GEOMETRY_FIELDS + VIEWPORT_FIELDS] for code in matched],
+        dtype=float,
+    )
+    dom_rows = np.array([[float(dom_by_code[code][key]) for key in ('x', 'y', 'w', 'h')] for code in matched], dtype=float)
+    offset_bad, size_bad, rate_bad, ratio = _compare(beacon_rows, dom_rows, offset_tolerance, size_tolerance, rate_tolerance, check_rate)
+
+    for idx, code in enumerate(matched):
+        b, d = beacon_rows[idx], dom_rows[idx]
+        if offset_bad[idx]:
+            errors.append(f"상품 '{code}' 노출 위치 불일치: 비콘 (_x={b[0]:g}, _y={b[1]:g}), 화면 (x={d[0]:g}, y={d[1]:g})")
+        if size_bad[idx]:
+            errors.append(f"상품 '{code}' 노출 크기 불일치: 비콘 (_w={b[2]:g}, _h={b[3]:g}), 화면 (w={d[2]:g}, h={d[3]:g})")
+        if rate_bad[idx]:
+            errors.append(f"상품 '{code}' 노출 비율 불일치: 비콘 _rate={b[4]:g}, 비콘 시점 뷰포트 기준 노출 비율={ratio[idx]:.2f}")
+
+    logger.debug(f"Exposure 위치 검증: 비교 {len(matched)}개, 실패 {len(errors)}건")
+    return errors
@@ -0,0 +1,98 @@
+"""
+수집된 시나리오에서 TestRail 케이스 ID 추출
+pytest-bdd 시나리오 항목의 스텝 문구와 Examples 행 값에서 TC 번호(C\\d+)를 찾아,
+-k 나 개별 test_*.py로 선택한 시나리오가 참조하는 케이스만으로 Run을 만들 수 있도록 함
+"""
+import logging
+import re
+from typing import Any, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# TC 번호 (예: C1166922)
+TC_ID_PATTERN = re.compile(r'(?<![A-Za-z0-9_])C(\d+)\b')
+
+# pytest-bdd가 Scenario Outline 행 값을 넘기는 파라미터 이름
+_EXAMPLE_PARAM = '_pytest_bdd_example'
+
+
+def extract_case_ids(text: str) -> List[int]:
+    """문자열에서 TC 번호 추출 (C 접두사 제외한 숫자)"""
+    return [int(match) for match in TC_ID_PATTERN.findall(text or '')]
+
+
+def _scenario_steps(scenario: Any) -> List[Any]:
+    for attr in ('templated_steps', 'steps', '_steps'):
+        steps = getattr(scenario, attr, None)
+        if steps:
+            return list(steps)
+    return []
+
+
+def _item_scenario(item: Any) -> Optional[Any]:
+    """pytest 항목의 pytest-bdd 시나리오 템플릿 (pytest-bdd 6~7: __scenario__, 8 이상: 레지스트리)"""
+    func = getattr(item, 'obj', None)
+    scenario = getattr(func, '__scenario__', None)
+    if scenario is not None:
+        return scenario
+    try:
+        from pytest_bdd.scenario import scenario_wrapper_template_registry
+    except ImportError:
+        return None
+    try:
+        return scenario_wrapper_template_registry.get(func)
+    except TypeError:
+        return None
+
+
+def collect_item_case_ids(item: Any) -> Optional[Set[int]]:
+    """
+    pytest 항목 하나가 참조하는 TC 번호
+
+    Args:
+        item: 수집된 pytest 항목
+
+    Returns:
+        TC 번호 집합, pytest-bdd 시나리오가 아니면 None (참조 케이스를 알 수 없음)
+    """
+    scenario = _item_scenario(item)
+    if scenario is None:
+        return None
+
+    texts = [getattr(step, 'name', '') for step in _scenario_steps(scenario)]
+    background = getattr(getattr(scenario, 'feature', None), 'background', None)
+    if background is not None:
+        texts.extend(getattr(step, 'name', '') for step in _scenario_steps(background))
+    callspec = getattr(item, 'callspec', None)
+    example = callspec.params.get(_EXAMPLE_PARAM) if callspec is not None else None
+    if isinstance(example, dict):
+        texts.extend(str(value) for value in example.values())
+
+    case_ids: Set[int] = set()
+    for text in texts:
+        case_ids.update(extract_case_ids(text))
+    return case_ids
+
+
+def collect_case_ids(items: Iterable[Any]) -> Optional[List[int]]:
+    """
+    수집된 전체 항목이 참조하는 TC 번호 (수집 순서 유지, 중복 제거)
+
+    Args:
+        items: session.items
+
+    Returns:
+        TC 번호 리스트, 참조 케이스를 알 수 없는 항목이 하나라도 있으면 None
+    """
+    ordered: List[int] = []
+    seen: Set[int] = set()
+    for item in items:
+        item_case_ids = collect_item_case_ids(item)
+        if item_case_ids is None:
+            logger.debug(f"pytest-bdd 시나리오가 아닌 항목: {getattr(item, 'nodeid', item)}")
+            return None
+        for case_id in sorted(item_case_ids):
+            if case_id not in seen:
+                seen.add(case_id)
+                ordered.append(case_id)
+    return ordered
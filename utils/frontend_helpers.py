@@ -4,6 +4,7 @@
 import os
 import logging
 from datetime import datetime
+from utils.parallel import worker_artifact_path
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +31,7 @@ def capture_frontend_failure_screenshot(browser_session, bdd_context, error_mess
                 if not step_name:
                     step_name = bdd_context.get('failed_step_name', 'unknown_step') if hasattr(bdd_context, 'get') else 'unknown_step'
                 safe_step_name = step_name.replace(' ', '_').replace('/', '_').replace('\\', '_')[:50]  # 파일명에 사용 불가능한 문자 제거
-                screenshot_path = f"screenshots/frontend_fail_{safe_step_name}_{timestamp}.png"
+                screenshot_path = str(worker_artifact_path(f"screenshots/frontend_fail_{safe_step_name}_{timestamp}.png"))
                 os.makedirs(os.path.dirname(screenshot_path), exist_ok=True)
                 page.screenshot(path=screenshot_path, timeout=2000)
                 print(f"[TestRail] 프론트 실패 시점 스크린샷 저장: {screenshot_path}")
@@ -0,0 +1,315 @@
+"""
+로그인 상태(storage state) 재사용
+환경(dev/stg/prod)·회원 종류별 state 파일을 저장해 두고, 유효한 동안은 UI 로그인 없이 재사용
+- 파일 검사: 생성 후 경과 시간 (login_state_max_age_hours), 쿠키 만료
+- 확인 요청: 저장된 쿠키로 홈을 요청해 로그인 표시 문구(기본 "로그아웃")가 있는지 확인 (login_state_probe)
+- 둘 중 하나라도 실패하면 UI 로그인 후 다시 저장
+파일 잠금으로 xdist 워커/동시 실행 간에 한 프로세스만 로그인하고, 나머지는 저장된 파일을 사용
+LoginStateCache: 세션 안에서 회원 종류별 state를 처음 필요할 때 확보하고, 만료 전까지 재사용
+"""
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from utils.credentials import MemberType, get_credentials
+from utils.feature_case_ids import _item_scenario
+from utils.parallel import file_lock, get_worker_id, read_shared_json, write_shared_json
+from utils.urls import _get_environment
+from utils.validation_helpers import _load_config
+
+logger = logging.getLogger(__name__)
+
+project_root = Path(__file__).parent.parent
+
+# state 파일 이름 형식 (프로젝트 루트 기준)
+STATE_FILE_FORMAT = "state_{environment}_{member_type}.json"
+
+# config.json 키
+LOGIN_STATE_REUSE_CONFIG_KEY = 'login_state_reuse'  # Y/N (기본 Y), N이면 매 세션 새로 로그인
+LOGIN_STATE_PROBE_CONFIG_KEY = 'login_state_probe'  # Y/N (기본 Y), 확인 요청 여부
+LOGIN_STATE_MAX_AGE_CONFIG_KEY = 'login_state_max_age_hours'
+
+# 시나리오 회원 종류 지정: @pytest.mark.member_type("club") 또는 Feature/Scenario 태그 @member_club
+MEMBER_TYPE_MARKER = 'member_type'
+MEMBER_TAG_PREFIX = 'member_'
+MEMBER_TYPES = (MemberType.NORMAL, MemberType.CLUB, MemberType.BUSINESS)
+
+DEFAULT_LOGIN_STATE_MAX_AGE_HOURS = 12
+# 로그인 상태 표시 문구 (홈 상단, 로그인 시에만 노출)
+LOGIN_PROBE_TEXT = "로그아웃"
+PROBE_TIMEOUT_MS = 10000
+LOGIN_TIMEOUT_MS = 15000
+
+
+def _config_flag(key: str, default: str = 'Y') -> bool:
+    return str(_load_config().get(key, default)).strip().upper() == 'Y'
+
+
+def state_path_for(member_type: str = MemberType.NORMAL, environment: Optional[str] = None) -> Path:
+    """
+    환경·회원 종류별 state 파일 경로
+
+    Args:
+        member_type: 회원 종류 (normal/club/business)
+        environment: 환경 (None이면 config.json environment)
+
+    Returns:
+        프로젝트 루트의 state_<환경>_<회원 종류>.json (예: state_prod_normal.json)
+    """
+    environment = environment or _get_environment()
+    return project_root / STATE_FILE_FORMAT.format(environment=environment, member_type=member_type)
+
+
+def resolve_member_type(request: Any) -> str:
+    """
+    시나리오에 사용할 회원 종류
+
+    우선순위: member_type fixture 간접 파라미터 (indirect=True) → member_type 마커
+    → Scenario 태그 member_<회원 종류> → Feature 태그 → 일반회원
+
+    Args:
+        request: pytest request (member_type fixture)
+
+    Returns:
+        회원 종류 (normal/club/business)
+
+    Raises:
+        ValueError: 지원하지 않는 회원 종류
+    """
+    member_type = getattr(request, 'param', None)
+    if member_type is None:
+        marker = request.node.get_closest_marker(MEMBER_TYPE_MARKER)
+        if marker is not None and marker.args:
+            member_type = marker.args[0]
+    if member_type is None:
+        # Scenario 태그가 Feature 태그보다 우선 (pytest-bdd는 두 태그를 구분 없이 마커로 붙임)
+        scenario = _item_scenario(request.node)
+        scenario_tags = set(getattr(scenario, 'tags', None) or ())
+        for candidate in MEMBER_TYPES:
+            if f"{MEMBER_TAG_PREFIX}{candidate}" in scenario_tags:
+                member_type = candidate
+                break
+    if member_type is None:
+        for candidate in MEMBER_TYPES:
+            if request.node.get_closest_marker(f"{MEMBER_TAG_PREFIX}{candidate}") is not None:
+                member_type = candidate
+                break
+    member_type = member_type or MemberType.NORMAL
+    if member_type not in MEMBER_TYPES:
+        raise ValueError(f"지원하지 않는 회원 종류입니다: {member_type}. (normal/club/business)")
+    return member_type
+
+
+def is_state_valid(state_path: Any, max_age_hours: Optional[float] = None) -> bool:
+    """
+    state 파일이 재사용 가능한지 확인 (파일 경과 시간, 쿠키 기반)
+
+    Args:
+        state_path: state 파일 경로
+        max_age_hours: 파일 생성 후 허용 시간 (None이면 config.json login_state_max_age_hours)
+
+    Returns:
+        경과 시간 이내이고 만료되지 않은 쿠키가 있으면 True
+    """
+    if not os.path.exists(state_path):
+        return False
+    if max_age_hours is None:
+        max_age_hours = float(_load_config().get(LOGIN_STATE_MAX_AGE_CONFIG_KEY, DEFAULT_LOGIN_STATE_MAX_AGE_HOURS))
+    try:
+        if time.time() - os.path.getmtime(state_path) > max_age_hours * 3600:
+            return False
+        with open(state_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        cookies = data.get("cookies", [])
+        now = time.time()
+        # 세션 쿠키(expires -1)는 제외, 쿠키 하나라도 만료되지 않았으면 로그인 유지 가능
+        if any("expires" in c and c["expires"] and c["expires"] > now for c in cookies):
+            return True
+        return False
+    except Exception as e:
+        print(f"[WARN] state 파일 검증 오류 ({state_path}): {e}")
+        return False
+
+
+def probe_login_state(pw: Any, state_path: Any) -> bool:
+    """
+    저장된 state로 홈을 요청해 로그인 상태인지 확인 (브라우저 없이 API 요청 컨텍스트 사용)
+
+    Args:
+        pw: Playwright 인스턴스
+        state_path: state 파일 경로
+
+    Returns:
+        응답 본문에 로그인 표시 문구가 있으면 True (요청 실패 시 False)
+    """
+    from utils.urls import base_url
+
+    request_context = None
+    try:
+        request_context = pw.request.new_context(storage_state=str(state_path))
+        response = request_context.get(base_url(), timeout=PROBE_TIMEOUT_MS)
+        logged_in = response.ok and LOGIN_PROBE_TEXT in response.text()
+        logger.debug(f"로그인 상태 확인 요청: {base_url()} status={response.status} logged_in={logged_in}")
+        return logged_in
+    except Exception as e:
+        logger.warning(f"로그인 상태 확인 요청 실패: {e}")
+        return False
+    finally:
+        if request_context is not None:
+            request_context.dispose()
+
+
+def create_login_state(pw: Any, member_type: str = MemberType.NORMAL, state_path: Any = None) -> Path:
+    """
+    로그인 수행 후 state 파일 저장
+
+    Args:
+        pw: Playwright 인스턴스
+        member_type: 회원 종류 (normal/club/business)
+        state_path: 저장 경로 (None이면 state_path_for(member_type))
+
+    Returns:
+        저장한 state 파일 경로
+    """
+    from utils.urls import base_url
+
+    state_path = Path(state_path or state_path_for(member_type))
+    print(f"[INFO] 로그인 절차 시작 ({member_type})")
+    credentials = get_credentials(member_type)
+    username = credentials["username"]
+    password = credentials["password"]
+
+    browser = pw.chromium.launch(headless=False)  # 화면 확인용
+    try:
+        context = browser.new_context()
+        page = context.new_page()
+        page.goto(base_url())
+        # 로그인 페이지 이동 및 입력
+        page.click("text=로그인")
+        page.fill("#typeMemberInputId", username)
+        page.fill("#typeMemberInputPassword", password)
+        page.click("#btn_memberLogin")
+        # 로그인 완료 대기
+        page.wait_for_selector("text=로그아웃", timeout=LOGIN_TIMEOUT_MS)
+        # 로그인 상태 저장 (임시 파일 후 교체, 다른 워커가 중간 상태를 읽지 않도록)
+        tmp_path = state_path.with_name(f"{state_path.name}.{os.getpid()}.tmp")
+        context.storage_state(path=str(tmp_path))
+        os.replace(tmp_path, state_path)
+    finally:
+        browser.close()
+
+    with open(state_path, 'r', encoding='utf-8') as f:
+        state = json.load(f)
+    cookies_count = len(state.get('cookies', []))
+    origins_count = len(state.get('origins', []))
+    logger.debug(f"저장된 쿠키 수: {cookies_count}")
+    logger.debug(f"저장된 origins 수: {origins_count}")
+    if origins_count > 0:
+        for origin in state.get('origins', []):
+            logger.debug(f"Origin: {origin.get('origin', 'N/A')}")
+            print(f"  - localStorage: {len(origin.get('localStorage', []))}개 항목")
+            print(f"  - sessionStorage: {len(origin.get('sessionStorage', []))}개 항목")
+    else:
+        print("[WARNING] origins가 저장되지 않았습니다. localStorage/sessionStorage가 복원되지 않을 수 있습니다.")
+
+    print(f"[INFO] 로그인 완료 및 {state_path.name} 저장됨")
+    return state_path
+
+
+def ensure_member_login_state(
+    pw: Any,
+    member_type: str = MemberType.NORMAL,
+    shared_dir: Optional[Path] = None,
+    environment: Optional[str] = None,
+) -> str:
+    """
+    회원 종류별 로그인 state 파일 확보 (유효하면 재사용, 아니면 로그인)
+
+    state 파일 옆 잠금 파일로 한 프로세스만 확인/로그인하며, xdist 실행 시 공유 폴더에 확인 기록을 남겨
+    같은 실행의 다른 워커는 확인 요청 없이 바로 사용 (state 파일이 만료되었으면 다시 로그인하고 기록 갱신)
+
+    Args:
+        pw: Playwright 인스턴스
+        member_type: 회원 종류 (normal/club/business)
+        shared_dir: xdist 공유 폴더 (없으면 None)
+        environment: 환경 (None이면 config.json environment)
+
+    Returns:
+        state 파일 경로 (browser.new_context(storage_state=...)에 전달)
+    """
+    state_path = state_path_for(member_type, environment)
+    marker_path = shared_dir / f"login_{state_path.name}" if shared_dir is not None else None
+
+    with file_lock(state_path.with_name(f"{state_path.name}.lock")):
+        if marker_path is not None:
+            marker = read_shared_json(marker_path)
+            # 확인 기록이 있어도 그 사이 state가 만료되었으면 아래에서 다시 로그인하고 기록을 갱신
+            if marker and is_state_valid(state_path):
+                print(f"[INFO] {marker.get('checked_by')}가 이번 실행에서 확인한 {state_path.name} 사용")
+                return str(state_path)
+            if marker:
+                print(f"[INFO] {marker.get('checked_by')}가 확인한 {state_path.name} 만료 → 새로 로그인 수행")
+                create_login_state(pw, member_type, state_path)
+                write_shared_json(marker_path, {"checked_by": get_worker_id(), "path": str(state_path)})
+                return str(state_path)
+
+        if not _config_flag(LOGIN_STATE_REUSE_CONFIG_KEY):
+            print("[INFO] 세션 시작 → 새로 로그인 수행 (login_state_reuse=N)")
+            create_login_state(pw, member_type, state_path)
+        elif not is_state_valid(state_path):
+            print(f"[INFO] {state_path.name} 없음 또는 만료 → 새로 로그인 수행")
+            create_login_state(pw, member_type, state_path)
+        elif _config_flag(LOGIN_STATE_PROBE_CONFIG_KEY) and not probe_login_state(pw, state_path):
+            print(f"[INFO] {state_path.name} 로그아웃 상태 확인 → 새로 로그인 수행")
+            create_login_state(pw, member_type, state_path)
+        else:
+            print(f"[INFO] 유효한 {state_path.name} 재사용 (로그인 생략)")
+
+        if marker_path is not None:
+            write_shared_json(marker_path, {"checked_by": get_worker_id(), "path": str(state_path)})
+    return str(state_path)
+
+
+class LoginStateCache:
+    """
+    세션 단위 로그인 state 캐시 ((환경, 회원 종류) 키)
+
+    - get(member_type): 처음 요청 시 ensure_member_login_state로 확보 (재사용 또는 로그인), 이후에는 파일 검사만
+    - state가 만료되면(is_state_valid 실패) 다음 get에서 다시 확보
+    회원 종류 전환은 browser.new_context(storage_state=cache.get(...)) 한 번으로 끝남
+    """
+
+    def __init__(self, pw: Any, shared_dir: Optional[Path] = None):
+        """
+        LoginStateCache 초기화
+
+        Args:
+            pw: Playwright 인스턴스
+            shared_dir: xdist 공유 폴더 (없으면 None)
+        """
+        self._pw = pw
+        self._shared_dir = shared_dir
+        self._paths: Dict[Tuple[str, str], str] = {}
+
+    def get(self, member_type: str = MemberType.NORMAL) -> str:
+        """
+        회원 종류별 state 파일 경로 (현재 config.json 환경 기준)
+
+        Args:
+            member_type: 회원 종류 (normal/club/business)
+
+        Returns:
+            state 파일 경로
+        """
+        key = (_get_environment(), member_type)
+        path = self._paths.get(key)
+        if path is not None and is_state_valid(path):
+            return path
+        if path is not None:
+            logger.info(f"로그인 state 만료, 다시 확보: {path}")
+        path = ensure_member_login_state(self._pw, member_type, self._shared_dir, key[0])
+        self._paths[key] = path
+        return path
@@ -0,0 +1,138 @@
+"""
+pytest-xdist 병렬 실행 지원
+- 워커 식별 (PYTEST_XDIST_WORKER) 및 워커별 산출물 경로
+- 프로세스 간 파일 잠금 (로그인 상태 생성, 리포트 병합 등 한 번에 하나의 프로세스만 수행)
+- 컨트롤러와 워커가 공유하는 폴더의 JSON 읽기/쓰기 (TestRail Run ID, 수집된 TC 번호 등)
+xdist 없이 실행하면 워커 ID는 None이고 경로는 그대로 사용
+"""
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# 컨트롤러가 워커에 넘기는 공유 폴더 키 (config.workerinput)
+SHARED_DIR_KEY = 'tracking_shared_dir'
+
+# 잠금 파일이 이 시간보다 오래되면 비정상 종료로 남은 것으로 보고 제거 (초)
+DEFAULT_LOCK_STALE_SECONDS = 600.0
+DEFAULT_LOCK_TIMEOUT_SECONDS = 900.0
+
+
+def get_worker_id() -> Optional[str]:
+    """xdist 워커 ID (gw0, gw1, ...), 워커가 아니면 None"""
+    return os.environ.get('PYTEST_XDIST_WORKER') or None
+
+
+def is_xdist_worker(config: Any = None) -> bool:
+    """xdist 워커 프로세스인지 여부"""
+    if config is not None:
+        return hasattr(config, 'workerinput')
+    return get_worker_id() is not None
+
+
+def is_xdist_controller(config: Any) -> bool:
+    """xdist로 워커를 띄운 컨트롤러 프로세스인지 여부 (-n 0이나 xdist 미설치면 False)"""
+    if is_xdist_worker(config):
+        return False
+    option = getattr(config, 'option', None)
+    return bool(getattr(option, 'numprocesses', None)) and getattr(option, 'dist', 'no') != 'no'
+
+
+def worker_artifact_path(path: Union[str, Path]) -> Path:
+    """
+    워커별 산출물 경로 (xdist 워커면 상위 폴더 아래 워커 ID 폴더로 분리)
+
+    예: json/tracking_all_X.json → json/gw0/tracking_all_X.json
+
+    Args:
+        path: 단일 프로세스 실행 시 경로
+
+    Returns:
+        워커별 경로 (워커가 아니면 그대로)
+    """
+    path = Path(path)
+    worker_id = get_worker_id()
+    if not worker_id:
+        return path
+    return path.parent / worker_id / path.name
+
+
+def get_shared_dir(config: Any) -> Optional[Path]:
+    """컨트롤러/워커 공유 폴더 (xdist 실행이 아니면 None)"""
+    workerinput = getattr(config, 'workerinput', None)
+    if workerinput is not None:
+        shared = workerinput.get(SHARED_DIR_KEY)
+    else:
+        shared = getattr(config, '_tracking_shared_dir', None)
+    return Path(shared) if shared else None
+
+
+def write_shared_json(path: Path, data: Any) -> None:
+    """공유 JSON 파일 쓰기 (임시 파일 후 교체, 읽는 쪽이 중간 상태를 보지 않도록)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def read_shared_json(path: Path, default: Any = None) -> Any:
+    """공유 JSON 파일 읽기 (없거나 읽을 수 없으면 default)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return default
+
+
+@contextmanager
+def file_lock(
+    path: Union[str, Path],
+    timeout: float = DEFAULT_LOCK_TIMEOUT_SECONDS,
+    stale_seconds: float = DEFAULT_LOCK_STALE_SECONDS,
+    poll_seconds: float = 0.2,
+) -> Iterator[None]:
+    """
+    프로세스 간 파일 잠금 (O_EXCL로 잠금 파일 생성, 운영체제 공통)
+
+    Args:
+        path: 잠금 파일 경로 (예: state.json.lock)
+        timeout: 최대 대기 시간 (초)
+        stale_seconds: 이 시간보다 오래된 잠금 파일은 제거 후 재시도
+        poll_seconds: 재시도 간격 (초)
+
+    Raises:
+        TimeoutError: timeout 안에 잠금을 얻지 못함
+    """
+    lock_path = Path(path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.time() + timeout
+    while True:
+        try:
+            fd = os.open(str(lock_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > stale_seconds:
+                    logger.warning(f"오래된 잠금 파일 제거: {lock_path}")
+                    lock_path.unlink()
+                    continue
+            except FileNotFoundError:
+                continue
+            if time.time() >= deadline:
+                raise TimeoutError(f"잠금 대기 시간 초과: {lock_path}")
+            time.sleep(poll_seconds)
+    try:
+        os.write(fd, f"{os.getpid()} {get_worker_id() or 'main'}".encode('utf-8'))
+        os.close(fd)
+        yield
+    finally:
+        try:
+            lock_path.unlink()
+        except FileNotFoundError:
+            pass
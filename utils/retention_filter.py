@@ -0,0 +1,216 @@
+"""
+시나리오 단위 로그 보존 필터
+검증 대상 모듈의 스키마(이벤트 타입, SPM)와 goodscode 기준으로 NetworkTracker가 보관할 로그를 제한
+필터 밖의 로그는 건수만 집계하고 버리거나(drop), 원본 형태로만 별도 보관(raw)
+"""
+import logging
+from typing import Dict, Optional, Any, Iterable, Set
+
+from utils.validation_helpers import (
+    EVENT_TYPE_CONFIG_KEY_MAP,
+    load_module_config,
+    get_nth_for_tracking,
+    _find_spm_recursive,
+    _load_config,
+)
+from utils.validation_context import PRICE_SOURCE_EVENT_TYPES, _get_from_context
+from utils.event_constraints import load_constraints
+
+logger = logging.getLogger(__name__)
+
+# 보존 모드
+RETENTION_OFF = 'off'    # 필터 미사용 (모든 로그 보관)
+RETENTION_DROP = 'drop'  # 필터 밖 로그는 건수만 집계하고 버림
+RETENTION_RAW = 'raw'    # 필터 밖 로그는 원본 형태로만 별도 보관
+RETENTION_MODES = (RETENTION_OFF, RETENTION_DROP, RETENTION_RAW)
+
+# config.json 키 (기본값: off)
+RETENTION_CONFIG_KEY = 'tracker_retention'
+
+# SPM으로 필터링하는 이벤트 타입 (get_event_logs와 동일)
+SPM_FILTERED_EVENT_TYPES = ('Module Exposure', 'Product Exposure')
+
+# goodscode와 무관하게 보관하는 이벤트 타입
+GOODSCODE_INDEPENDENT_EVENT_TYPES = ('PV', 'Module Exposure')
+
+
+class RetentionFilter:
+    """
+    NetworkTracker 로그 보존 조건
+
+    - event_types: 보관할 이벤트 타입 (스키마에 정의된 타입 + 가격 정보용 PDP PV/Product Minidetail)
+    - spms: 이벤트 타입별 SPM (Module Exposure, Product Exposure는 SPM이 매칭되는 로그만 보관)
+    - goodscodes: 상품 번호 (None이면 goodscode 조건 미적용, goodscode가 없는 로그는 보관)
+    """
+
+    def __init__(
+        self,
+        event_types: Iterable[str],
+        spms: Optional[Dict[str, str]] = None,
+        goodscodes: Optional[Iterable[str]] = None,
+        mode: str = RETENTION_DROP,
+    ):
+        """
+        RetentionFilter 초기화
+
+        Args:
+            event_types: 보관할 이벤트 타입
+            spms: {이벤트 타입: SPM} 딕셔너리
+            goodscodes: 보관할 상품 번호 (None이면 조건 미적용)
+            mode: RETENTION_DROP 또는 RETENTION_RAW
+        """
+        self.event_types: Set[str] = set(event_types)
+        self.spms: Dict[str, str] = dict(spms or {})
+        self.goodscodes: Optional[Set[str]] = {str(code) for code in goodscodes} if goodscodes else None
+        self.mode = mode
+
+    @property
+    def identity(self) -> tuple:
+        """필터 조건 비교용 값 (같으면 다시 적용할 필요 없음)"""
+        return (
+            frozenset(self.event_types),
+            frozenset(self.spms.items()),
+            frozenset(self.goodscodes) if self.goodscodes else None,
+            self.mode,
+        )
+
+    def _goodscode_matches(self, tracker: Any, log: Dict[str, Any]) -> bool:
+        if self.goodscodes is None:
+            return True
+        log_goodscode = tracker._extract_goodscode_from_log(log)
+        # goodscode를 알 수 없는 로그는 보수적으로 보관 (PDP 클릭 이벤트 등)
+        return log_goodscode is None or str(log_goodscode) in self.goodscodes
+
+    def _product_exposure_matches(self, tracker: Any, log: Dict[str, Any]) -> bool:
+        spm = self.spms.get('Product Exposure')
+        items = tracker._get_expdata_items(log)
+        if not items:
+            return True
+        for item in items:
+            if spm:
+                item_spm = tracker._extract_spm_from_product_exposure_item(item)
+                if not item_spm or not tracker._check_spm_match(item_spm, spm):
+                    continue
+            if self.goodscodes is None:
+                return True
+            item_goodscode = tracker._extract_goodscode_from_product_exposure_item(item)
+            if item_goodscode is None or str(item_goodscode) in self.goodscodes:
+                return True
+        return False
+
+    def accepts(self, tracker: Any, log: Dict[str, Any]) -> bool:
+        """
+        로그를 보관할지 판단
+
+        Args:
+            tracker: NetworkTracker 인스턴스 (spm/goodscode 추출 메서드 사용)
+            log: 로그 딕셔너리
+
+        Returns:
+            보관 대상이면 True
+        """
+        request_type = log.get('type')
+        if request_type not in self.event_types:
+            return False
+
+        if request_type == 'Module Exposure':
+            spm = self.spms.get(request_type)
+            if not spm:
+                return True
+            log_spm = tracker._extract_spm_from_log(log)
+            # spm을 추출하지 못한 로그는 보수적으로 보관
+            return log_spm is None or tracker._check_spm_match(log_spm, spm)
+
+        if request_type == 'Product Exposure':
+            return self._product_exposure_matches(tracker, log)
+
+        if request_type in GOODSCODE_INDEPENDENT_EVENT_TYPES:
+            return True
+
+        return self._goodscode_matches(tracker, log)
+
+
+def build_retention_filter(
+    module_config: Dict[str, Any],
+    goodscodes: Optional[Iterable[str]] = None,
+    mode: str = RETENTION_DROP,
+) -> Optional[RetentionFilter]:
+    """
+    모듈 스키마로 보존 필터 생성
+
+    Args:
+        module_config: 모듈 스키마 딕셔너리
+        goodscodes: 상품 번호 (아직 모르면 None)
+        mode: RETENTION_DROP 또는 RETENTION_RAW
+
+    Returns:
+        RetentionFilter 또는 None (스키마에 이벤트 섹션이 없으면 필터 미적용)
+    """
+    event_types = [
+        event_type for event_type, config_key in EVENT_TYPE_CONFIG_KEY_MAP.items()
+        if config_key in module_config
+    ]
+    if not event_types:
+        return None
+
+    spms = {}
+    for event_type in SPM_FILTERED_EVENT_TYPES:
+        section = module_config.get(EVENT_TYPE_CONFIG_KEY_MAP[event_type])
+        if isinstance(section, dict):
+            spm = _find_spm_recursive(section)
+            if spm:
+                spms[event_type] = spm
+
+    # 이벤트 제약(constraints)에 등장하는 이벤트도 보관
+    for constraint in load_constraints(module_config):
+        event_types.extend((constraint.first, constraint.second))
+
+    # 가격 정보 추출에 쓰는 로그는 스키마와 무관하게 보관
+    return RetentionFilter(set(event_types) | set(PRICE_SOURCE_EVENT_TYPES), spms, goodscodes, mode)
+
+
+def get_retention_mode() -> str:
+    """config.json의 tracker_retention 값 (off/drop/raw, 기본 off)"""
+    mode = str(_load_config().get(RETENTION_CONFIG_KEY) or RETENTION_OFF).strip().lower()
+    if mode not in RETENTION_MODES:
+        logger.warning(f"알 수 없는 {RETENTION_CONFIG_KEY} 값 '{mode}', 필터를 사용하지 않습니다.")
+        return RETENTION_OFF
+    return mode
+
+
+def update_tracker_retention(bdd_context: Any) -> Optional[RetentionFilter]:
+    """
+    bdd_context의 tracker/area/module_title/goodscode로 보존 필터를 만들어 tracker에 적용
+    (스텝마다 호출해도 조건이 바뀐 경우에만 다시 적용)
+
+    Args:
+        bdd_context: BDD context 객체
+
+    Returns:
+        적용된 RetentionFilter 또는 None
+    """
+    mode = get_retention_mode()
+    if mode == RETENTION_OFF:
+        return None
+
+    tracker = _get_from_context(bdd_context, 'tracker')
+    area = _get_from_context(bdd_context, 'area')
+    module_title = _get_from_context(bdd_context, 'module_title')
+    if not tracker or not area or not module_title:
+        return None
+
+    module_config = load_module_config(area=area, module_title=module_title, nth=get_nth_for_tracking(bdd_context))
+    if not isinstance(module_config, dict) or not module_config:
+        return None
+
+    goodscode = _get_from_context(bdd_context, 'goodscode')
+    retention_filter = build_retention_filter(module_config, [goodscode] if goodscode else None, mode)
+    if retention_filter is None:
+        return None
+
+    current = tracker.retention_filter
+    if current is not None and current.identity == retention_filter.identity:
+        return current
+
+    tracker.set_retention_filter(retention_filter)
+    return retention_filter
@@ -0,0 +1,291 @@
+"""
+트래킹 스키마 컴파일러
+모듈 스키마(중첩 JSON)를 이벤트 타입별 평면 기대값 목록으로 미리 변환
+검증 시 _process_config_section의 재귀 탐색 없이 기대값을 바로 구성할 수 있도록 함
+
+컴파일 산출물 구조 (tracking_schemas/<AREA>/_compiled/<module>.json):
+{
+    "version": 1,
+    "source_hash": "<모듈 스키마 sha1>",
+    "events": {
+        "<config_key>": [
+            {"field": "spm", "path": ["payload", "decoded_gokey", "params"], "kind": "literal", "value": "..."},
+            {"field": "_p_prod", "path": [...], "kind": "template", "value": "<상품번호>", "placeholders": ["<상품번호>"]},
+            ...
+        ]
+    }
+}
+"""
+import hashlib
+import json
+import logging
+import re
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Set, Tuple
+
+from utils.schema_registry import get_schema_registry
+
+logger = logging.getLogger(__name__)
+
+# 컴파일 산출물 포맷 버전 (구조가 바뀌면 올려서 기존 산출물 무효화)
+COMPILED_SCHEMA_VERSION = 1
+
+# 영역 디렉토리 하위의 컴파일 산출물 디렉토리명
+COMPILED_DIR_NAME = '_compiled'
+
+# 기대값 종류
+KIND_LITERAL = 'literal'      # 그대로 사용
+KIND_TEMPLATE = 'template'    # placeholder 치환 필요
+KIND_MANDATORY = 'mandatory'  # "__MANDATORY__"
+KIND_SKIP = 'skip'            # "__SKIP__"
+
+# is_ad가 "Y"일 때만 검증하는 필드
+AD_ONLY_FIELDS = ('adProduct', 'adSubProduct')
+
+# 스키마 값에서 placeholder 위치를 찾는 패턴 (<상품번호>, <environment>, {goodscode} 등)
+_PLACEHOLDER_PATTERN = re.compile(r'<[^<>]+>|\{goodscode\}')
+
+
+# 파싱해 둘 템플릿 문자열 최대 개수 (스키마 리프 값 종류 수보다 충분히 크게)
+_TEMPLATE_CACHE_SIZE = 4096
+
+
+class PlaceholderTemplate:
+    """
+    placeholder가 포함된 스키마 값을 한 번 파싱한 템플릿
+    리터럴 조각과 placeholder 조각 목록을 보관하고, render 시 한 번의 join으로 치환
+    """
+
+    __slots__ = ('source', 'placeholders', '_parts')
+
+    def __init__(self, source: str):
+        """
+        PlaceholderTemplate 초기화
+
+        Args:
+            source: 원본 스키마 값 (예: "<상품번호>_<trafficType>")
+        """
+        self.source = source
+        # (is_placeholder, text) 조각 목록
+        parts: List[Tuple[bool, str]] = []
+        pos = 0
+        for match in _PLACEHOLDER_PATTERN.finditer(source):
+            if match.start() > pos:
+                parts.append((False, source[pos:match.start()]))
+            parts.append((True, match.group(0)))
+            pos = match.end()
+        if pos < len(source):
+            parts.append((False, source[pos:]))
+        self._parts = tuple(parts)
+        self.placeholders = frozenset(text for is_placeholder, text in parts if is_placeholder)
+
+    def render(self, bindings: Dict[str, str]) -> str:
+        """
+        placeholder를 bindings 값으로 치환 (bindings에 없는 placeholder는 원문 유지)
+
+        Args:
+            bindings: {placeholder: 치환값} 딕셔너리
+
+        Returns:
+            치환된 문자열
+        """
+        if not self.placeholders:
+            return self.source
+        return ''.join(bindings.get(text, text) if is_placeholder else text for is_placeholder, text in self._parts)
+
+    def __repr__(self) -> str:
+        return f"PlaceholderTemplate({self.source!r})"
+
+
+@lru_cache(maxsize=_TEMPLATE_CACHE_SIZE)
+def compile_template(value: str) -> PlaceholderTemplate:
+    """스키마 값 문자열을 PlaceholderTemplate으로 파싱 (같은 문자열은 한 번만 파싱)"""
+    return PlaceholderTemplate(value)
+
+
+def schema_source_hash(module_config: Dict[str, Any]) -> str:
+    """모듈 스키마 내용의 sha1 (산출물 최신 여부 판단용)"""
+    canonical = json.dumps(module_config, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+
+def _compile_leaf(field: str, path: List[str], value: Any) -> Dict[str, Any]:
+    """리프 값 하나를 컴파일 항목으로 변환"""
+    entry: Dict[str, Any] = {'field': field, 'path': path, 'kind': KIND_LITERAL, 'value': value}
+    if isinstance(value, str):
+        if value.strip() == 'mandatory':
+            entry['kind'] = KIND_MANDATORY
+        elif value.strip() == 'skip':
+            entry['kind'] = KIND_SKIP
+        else:
+            placeholders = _PLACEHOLDER_PATTERN.findall(value)
+            if placeholders:
+                entry['kind'] = KIND_TEMPLATE
+                entry['placeholders'] = placeholders
+    if field in AD_ONLY_FIELDS:
+        entry['ad_only'] = True
+    return entry
+
+
+def compile_event_section(config_section: Dict[str, Any], parent_path: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    이벤트 타입 섹션을 평면 기대값 목록으로 변환 (_process_config_section과 같은 순회 순서)
+
+    Args:
+        config_section: 이벤트 타입별 config 섹션 (예: module_config['product_exposure'])
+        parent_path: 상위 키 경로
+
+    Returns:
+        컴파일 항목 리스트
+    """
+    entries: List[Dict[str, Any]] = []
+    if not isinstance(config_section, dict):
+        return entries
+
+    parent_path = parent_path or []
+    for key, value in config_section.items():
+        if isinstance(value, dict):
+            entries.extend(compile_event_section(value, parent_path + [key]))
+        else:
+            entries.append(_compile_leaf(key, parent_path, value))
+    return entries
+
+
+def compile_module_schema(module_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    모듈 스키마 전체를 컴파일 산출물로 변환
+
+    Args:
+        module_config: 모듈 스키마 딕셔너리 (공통 필드가 이미 병합된 sheets_to_json 결과)
+
+    Returns:
+        컴파일 산출물 딕셔너리
+    """
+    events = {}
+    for config_key, section in module_config.items():
+        if isinstance(section, dict):
+            events[config_key] = compile_event_section(section)
+    return {
+        'version': COMPILED_SCHEMA_VERSION,
+        'source_hash': schema_source_hash(module_config),
+        'events': events,
+    }
+
+
+def compiled_artifact_path(schema_path: Path) -> Path:
+    """모듈 스키마 파일에 대응하는 컴파일 산출물 경로"""
+    schema_path = Path(schema_path)
+    return schema_path.parent / COMPILED_DIR_NAME / schema_path.name
+
+
+def write_compiled_artifact(schema_path: Path, module_config: Dict[str, Any]) -> Path:
+    """
+    모듈 스키마의 컴파일 산출물을 파일로 저장
+
+    Args:
+        schema_path: 모듈 스키마 파일 경로
+        module_config: 모듈 스키마 딕셔너리
+
+    Returns:
+        저장한 산출물 경로
+    """
+    artifact_path = compiled_artifact_path(schema_path)
+    artifact_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(artifact_path, 'w', encoding='utf-8') as f:
+        json.dump(compile_module_schema(module_config), f, ensure_ascii=False, indent=2)
+    return artifact_path
+
+
+def collect_schema_keys(module_config: Dict[str, Any]) -> Set[str]:
+    """
+    모듈 스키마에 등장하는 모든 키 이름 (필드명 + 상위 경로 키)
+
+    Args:
+        module_config: 모듈 스키마 딕셔너리
+
+    Returns:
+        키 이름 집합
+    """
+    compiled = get_compiled_schema(module_config) or compile_module_schema(module_config)
+    keys: Set[str] = set()
+    for entries in compiled['events'].values():
+        for entry in entries:
+            keys.add(entry['field'])
+            keys.update(entry['path'])
+    return keys
+
+
+def build_area_projection(area: str) -> Optional[Set[str]]:
+    """
+    영역의 모든 모듈 스키마 키를 합친 NetworkTracker projection 생성
+
+    Args:
+        area: 영역명 (SRP, PDP 등)
+
+    Returns:
+        키 이름 집합 또는 None (영역 스키마가 없으면 전체 디코딩)
+    """
+    schemas = get_schema_registry().get_area(area)
+    if not schemas:
+        return None
+    projection: Set[str] = set()
+    for module_config in schemas.values():
+        if isinstance(module_config, dict):
+            projection |= collect_schema_keys(module_config)
+    return projection
+
+
+# id(module_config) → (module_config, 컴파일 결과)
+# 레지스트리에서 읽은 스키마만 캐시 (참조를 함께 보관해 id 재사용을 방지)
+_compiled_cache: Dict[int, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+_compiled_cache_lock = threading.Lock()
+
+
+def _load_artifact(source_path: Path, module_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """스키마 파일에 대응하는 최신 산출물 로드 (없거나 오래됐으면 None)"""
+    artifact_path = compiled_artifact_path(source_path)
+    if not artifact_path.exists():
+        return None
+    try:
+        artifact = get_schema_registry().load_json(artifact_path)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning("컴파일 산출물 로드 실패: %s (%s)", artifact_path, e)
+        return None
+    if (
+        not isinstance(artifact, dict)
+        or artifact.get('version') != COMPILED_SCHEMA_VERSION
+        or artifact.get('source_hash') != schema_source_hash(module_config)
+    ):
+        logger.info("컴파일 산출물이 스키마와 다름, 메모리에서 다시 컴파일: %s", artifact_path)
+        return None
+    return artifact
+
+
+def get_compiled_schema(module_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    레지스트리에서 읽은 모듈 스키마의 컴파일 결과 반환
+    sheets_to_json이 만든 산출물이 최신이면 그대로 사용하고, 없으면 메모리에서 한 번 컴파일하여 캐시
+
+    Args:
+        module_config: 모듈 스키마 딕셔너리
+
+    Returns:
+        컴파일 산출물 딕셔너리 또는 None (레지스트리에서 읽은 스키마가 아님)
+    """
+    source_path = get_schema_registry().source_path(module_config)
+    if source_path is None:
+        return None
+
+    key = id(module_config)
+    with _compiled_cache_lock:
+        cached = _compiled_cache.get(key)
+        if cached is not None and cached[0] is module_config:
+            return cached[1]
+
+    compiled = _load_artifact(source_path, module_config) or compile_module_schema(module_config)
+
+    with _compiled_cache_lock:
+        _compiled_cache[key] = (module_config, compiled)
+    return compiled
@@ -0,0 +1,207 @@
+"""
+트래킹 스키마 레지스트리
+tracking_schemas/<AREA>/<module>(nth).json 파일을 프로세스 단위로 한 번만 읽어 두고
+(area, module, nth) 기준으로 제공. 파일 mtime이 바뀐 경우에만 다시 읽음
+"""
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기본 스키마 루트 디렉토리
+DEFAULT_SCHEMA_ROOT = Path(__file__).parent.parent / 'tracking_schemas'
+
+# 워밍업 시 동시에 읽을 최대 파일 수
+DEFAULT_WARM_UP_WORKERS = 8
+
+
+class SchemaRegistry:
+    """
+    JSON 스키마 파일 캐시
+
+    - 파일별로 (mtime, 파싱 결과)를 보관하고, mtime이 같으면 디스크를 다시 읽지 않음
+    - 반환하는 딕셔너리는 캐시와 공유되므로 호출 측에서 수정하지 않아야 함
+    - hits/misses 카운터로 캐시 효율 확인 가능
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        """
+        SchemaRegistry 초기화
+
+        Args:
+            root: 스키마 루트 디렉토리 (기본: tracking_schemas)
+        """
+        self.root = Path(root) if root else DEFAULT_SCHEMA_ROOT
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        # id(파싱 결과) → 파일 경로 (캐시된 객체가 어느 파일에서 왔는지 역조회용)
+        self._source_paths: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load_json(self, path: Path) -> Any:
+        """
+        JSON 파일을 캐시에서 반환 (없거나 mtime이 바뀌었으면 다시 읽음)
+
+        Args:
+            path: JSON 파일 경로
+
+        Returns:
+            파싱된 JSON 객체
+
+        Raises:
+            FileNotFoundError: 파일이 없을 때
+        """
+        key = str(Path(path).resolve())
+        mtime = os.stat(key).st_mtime
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == mtime:
+                self.hits += 1
+                return entry[1]
+
+        with open(key, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        with self._lock:
+            self.misses += 1
+            if entry is not None:
+                logger.info("스키마 파일 변경 감지, 다시 로드: %s", key)
+                self._source_paths.pop(id(entry[1]), None)
+            self._entries[key] = (mtime, data)
+            self._source_paths[id(data)] = key
+        return data
+
+    def source_path(self, data: Any) -> Optional[Path]:
+        """
+        캐시된 파싱 결과 객체가 로드된 파일 경로 반환
+
+        Args:
+            data: load_json이 반환한 객체
+
+        Returns:
+            파일 경로 또는 None (레지스트리에서 읽은 객체가 아님)
+        """
+        with self._lock:
+            key = self._source_paths.get(id(data))
+            if key is None:
+                return None
+            entry = self._entries.get(key)
+            if entry is None or entry[1] is not data:
+                return None
+        return Path(key)
+
+    def resolve_module_path(self, area: str, module_title: str, n_suffix: Optional[str] = None) -> Optional[Path]:
+        """
+        (area, module, nth)에 해당하는 스키마 파일 경로 반환
+        n_suffix가 있으면 ``{module_title}({n_suffix}).json``을 우선, 없으면 ``{module_title}.json``
+
+        Args:
+            area: 영역명
+            module_title: 모듈 타이틀
+            n_suffix: normalize_nth로 정규화된 스키마 변형 인덱스
+
+        Returns:
+            파일 경로 또는 None (파일 없음)
+        """
+        base_path = self.root / area
+        if n_suffix:
+            paren_path = base_path / f"{module_title}({n_suffix}).json"
+            if paren_path.exists():
+                return paren_path
+        default_path = base_path / f"{module_title}.json"
+        if default_path.exists():
+            return default_path
+        return None
+
+    def get_module(self, area: str, module_title: str, n_suffix: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        (area, module, nth)에 해당하는 모듈 스키마 반환
+
+        Returns:
+            모듈 스키마 딕셔너리 또는 None (파일 없음)
+        """
+        path = self.resolve_module_path(area, module_title, n_suffix)
+        if path is None:
+            return None
+        return self.load_json(path)
+
+    def get_area(self, area: str) -> Dict[str, Any]:
+        """
+        영역의 모든 모듈 스키마 반환
+
+        Returns:
+            {파일명(stem): 스키마} 딕셔너리
+        """
+        base_path = self.root / area
+        config_dict = {}
+        if base_path.exists():
+            for config_file in base_path.glob("*.json"):
+                config_dict[config_file.stem] = self.load_json(config_file)
+        return config_dict
+
+    def _schema_files(self) -> List[Path]:
+        """루트 하위 영역 디렉토리의 모든 스키마 파일 목록"""
+        if not self.root.exists():
+            return []
+        return [path for path in self.root.glob("*/*.json") if path.is_file()]
+
+    def warm_up(self, max_workers: int = DEFAULT_WARM_UP_WORKERS) -> int:
+        """
+        모든 스키마 파일을 병렬로 미리 로드
+
+        Args:
+            max_workers: 동시에 읽을 최대 파일 수
+
+        Returns:
+            로드한 파일 수
+        """
+        files = self._schema_files()
+        if not files:
+            return 0
+
+        def _load(path: Path) -> bool:
+            try:
+                self.load_json(path)
+                return True
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning("스키마 워밍업 실패: %s (%s)", path, e)
+                return False
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            loaded = sum(1 for ok in executor.map(_load, files) if ok)
+        logger.info("트래킹 스키마 워밍업 완료: %d/%d개", loaded, len(files))
+        return loaded
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 통계 (hits, misses, entries)"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries)}
+
+    def clear(self) -> None:
+        """캐시와 카운터 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self._source_paths.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_registry: Optional[SchemaRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_schema_registry() -> SchemaRegistry:
+    """프로세스 단위 SchemaRegistry 인스턴스 반환"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = SchemaRegistry()
+    return _registry
@@ -0,0 +1,175 @@
+"""
+TestRail 섹션/케이스 목록 디스크 캐시
+프로젝트/스위트별로 섹션 트리와 케이스 목록(id, section_id)을 json/ 아래에 저장하고,
+다음 실행부터는 get_sections 1회 + get_cases(updated_after=마지막 동기화 시각)로 바뀐 케이스만 받아 병합
+캐시가 없거나 형식이 다르거나 오래된 경우(삭제된 케이스 반영), 증분 조회가 실패한 경우에는 전체 조회
+"""
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / 'json'
+TESTRAIL_CACHE_VERSION = 1
+
+# get_cases 페이지 크기 (TestRail 최대 250)
+CASES_PAGE_LIMIT = 250
+# 마지막 전체 조회 후 이 시간이 지나면 전체 조회 (초, 삭제된 케이스는 증분 조회로 알 수 없음)
+FULL_REFRESH_MAX_AGE_SECONDS = 7 * 24 * 3600
+# 증분 조회 시각 여유 (초, 로컬/서버 시계 차이 대비)
+UPDATED_AFTER_SKEW_SECONDS = 300
+
+
+def _page_items(response: Any, key: str) -> List[Dict[str, Any]]:
+    """목록 응답 (구버전: 리스트, 신버전: {"<key>": [...], "_links": ...}) 에서 항목 리스트 추출"""
+    if isinstance(response, dict):
+        return response.get(key) or []
+    return response or []
+
+
+def fetch_cases(
+    get: Callable[[str], Any],
+    project_id: Any,
+    suite_id: Any,
+    updated_after: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    스위트 케이스 전체 조회 (페이지네이션)
+
+    Args:
+        get: testrail_get(endpoint) 형태의 호출 함수
+        project_id: 프로젝트 ID
+        suite_id: 스위트 ID
+        updated_after: 지정하면 이 시각(UNIX 초) 이후 수정된 케이스만
+
+    Returns:
+        케이스 리스트 ({"id", "section_id", "updated_on"})
+    """
+    base = f"get_cases/{project_id}&suite_id={suite_id}&limit={CASES_PAGE_LIMIT}"
+    if updated_after is not None:
+        base += f"&updated_after={int(updated_after)}"
+    cases: List[Dict[str, Any]] = []
+    offset = 0
+    while True:
+        page = _page_items(get(f"{base}&offset={offset}"), 'cases')
+        cases.extend(
+            {'id': case['id'], 'section_id': case.get('section_id'), 'updated_on': case.get('updated_on')}
+            for case in page
+        )
+        if len(page) < CASES_PAGE_LIMIT:
+            return cases
+        offset += CASES_PAGE_LIMIT
+
+
+class TestRailSuiteCache:
+    """
+    프로젝트/스위트 단위 섹션·케이스 캐시
+
+    - load(): (섹션 리스트, 케이스 리스트) 반환, 필요한 만큼만 TestRail 조회 후 캐시 저장
+    - load(force_full=True): 캐시를 무시하고 전체 조회 (Run 생성이 캐시의 삭제된 케이스로 실패한 경우 등)
+    """
+
+    __test__ = False  # pytest 수집 대상 아님
+
+    def __init__(self, get: Callable[[str], Any], project_id: Any, suite_id: Any, cache_dir: Optional[Path] = None):
+        """
+        TestRailSuiteCache 초기화
+
+        Args:
+            get: testrail_get(endpoint) 형태의 호출 함수
+            project_id: 프로젝트 ID
+            suite_id: 스위트 ID
+            cache_dir: 캐시 폴더 (기본: json/)
+        """
+        self._get = get
+        self.project_id = project_id
+        self.suite_id = suite_id
+        self.path = Path(cache_dir or DEFAULT_CACHE_DIR) / f"testrail_cache_{project_id}_{suite_id}.json"
+        # 마지막 load가 캐시의 케이스 목록을 사용했는지 (증분 포함)
+        self.used_cache = False
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"TestRail 캐시 로드 실패: {self.path} ({e})")
+            return None
+        if (
+            not isinstance(data, dict)
+            or data.get('version') != TESTRAIL_CACHE_VERSION
+            or str(data.get('project_id')) != str(self.project_id)
+            or str(data.get('suite_id')) != str(self.suite_id)
+        ):
+            return None
+        return data
+
+    def _write(self, sections: List[Dict[str, Any]], cases: List[Dict[str, Any]], synced_at: float, full_synced_at: float) -> None:
+        data = {
+            'version': TESTRAIL_CACHE_VERSION,
+            'project_id': self.project_id,
+            'suite_id': self.suite_id,
+            'synced_at': synced_at,
+            'full_synced_at': full_synced_at,
+            'sections': sections,
+            'cases': cases,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            tmp_path.replace(self.path)
+        except OSError as e:
+            logger.warning(f"TestRail 캐시 저장 실패: {self.path} ({e})")
+
+    def load(self, force_full: bool = False) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        섹션/케이스 목록 반환
+
+        Args:
+            force_full: 캐시를 무시하고 전체 조회
+
+        Returns:
+            (섹션 리스트 {"id", "name", "parent_id"}, 케이스 리스트 {"id", "section_id", "updated_on"})
+        """
+        started_at = time.time()
+        sections = [
+            {'id': s['id'], 'name': s.get('name'), 'parent_id': s.get('parent_id')}
+            for s in _page_items(self._get(f"get_sections/{self.project_id}&suite_id={self.suite_id}"), 'sections')
+        ]
+
+        cached = None if force_full else self._read()
+        if cached and started_at - cached.get('full_synced_at', 0) < FULL_REFRESH_MAX_AGE_SECONDS:
+            updated_after = int(cached['synced_at'] - UPDATED_AFTER_SKEW_SECONDS)
+            try:
+                changed = fetch_cases(self._get, self.project_id, self.suite_id, updated_after=updated_after)
+            except Exception as e:
+                logger.warning(f"TestRail 케이스 증분 조회 실패, 전체 조회로 대체: {e}")
+            else:
+                merged = {case['id']: case for case in cached.get('cases', [])}
+                for case in changed:
+                    merged[case['id']] = case
+                cases = list(merged.values())
+                self._write(sections, cases, started_at, cached['full_synced_at'])
+                self.used_cache = True
+                print(f"[TestRail] 케이스 캐시 사용: {len(cases)}개 (변경 {len(changed)}개 반영)")
+                return sections, cases
+
+        try:
+            cases = fetch_cases(self._get, self.project_id, self.suite_id)
+        except Exception as e:
+            if cached:
+                logger.warning(f"TestRail 케이스 전체 조회 실패, 이전 캐시 사용: {e}")
+                self.used_cache = True
+                return sections, cached.get('cases', [])
+            raise
+        self._write(sections, cases, started_at, started_at)
+        self.used_cache = False
+        print(f"[TestRail] 케이스 전체 조회: {len(cases)}개 (캐시 저장: {self.path.name})")
+        return sections, cases
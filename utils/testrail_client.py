@@ -0,0 +1,130 @@
+"""
+TestRail API 클라이언트
+requests.Session 하나를 재사용하여 연결(keep-alive)과 인증 정보를 유지하고, 요청마다 타임아웃을 적용
+재시도 정책:
+- GET: 연결 오류, 429, 5xx 재시도 (백오프, Retry-After 준수)
+- POST: 요청이 서버에 전달되지 않은 연결 오류만 재시도 (결과 중복 기록 방지, 상태 코드 재시도는 TestRailReporter가 담당)
+"""
+import logging
+from typing import Any, Dict, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# (연결, 응답) 타임아웃 (초)
+DEFAULT_TIMEOUT: Tuple[float, float] = (5.0, 30.0)
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+# 호스트당 유지할 연결 수 (TestRailReporter 스레드 + 메인 스레드)
+DEFAULT_POOL_MAXSIZE = 4
+
+_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class TestRailClient:
+    """
+    TestRail API v2 클라이언트
+
+    - get(endpoint): GET index.php?/api/v2/<endpoint>
+    - post(endpoint, payload=None, files=None): POST (files가 있으면 multipart)
+    """
+
+    __test__ = False  # pytest 수집 대상 아님
+
+    def __init__(
+        self,
+        base_url: str,
+        user: str,
+        token: str,
+        timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    ):
+        """
+        TestRailClient 초기화
+
+        Args:
+            base_url: TestRail 주소 (config.json의 tr_url)
+            user: TestRail 사용자
+            token: TestRail 비밀번호 또는 API 키
+            timeout: 요청 타임아웃 (초, 또는 (연결, 응답) 튜플)
+            max_retries: 재시도 횟수
+            backoff_factor: 재시도 대기 계수 (backoff_factor * 2^(n-1)초)
+            pool_maxsize: 호스트당 유지할 연결 수
+        """
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.auth = (user, token)
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=_RETRY_STATUS_CODES,
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def url(self, endpoint: str) -> str:
+        return f"{self.base_url}/index.php?/api/v2/{endpoint}"
+
+    def get(self, endpoint: str) -> Any:
+        """
+        GET 요청
+
+        Args:
+            endpoint: API 엔드포인트 (예: "get_sections/1&suite_id=2")
+
+        Returns:
+            응답 JSON
+
+        Raises:
+            requests.HTTPError: 재시도 후에도 실패 응답
+        """
+        response = self.session.get(self.url(endpoint), timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def post(self, endpoint: str, payload: Optional[Dict[str, Any]] = None, files: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        POST 요청
+
+        Args:
+            endpoint: API 엔드포인트 (예: "add_run/1")
+            payload: JSON 본문
+            files: 첨부 파일 (add_attachment_to_result)
+
+        Returns:
+            응답 JSON (본문이 없으면 빈 딕셔너리)
+
+        Raises:
+            requests.HTTPError: 실패 응답
+        """
+        if files:
+            response = self.session.post(self.url(endpoint), files=files, timeout=self.timeout)
+        else:
+            response = self.session.post(self.url(endpoint), json=payload if payload is not None else {}, timeout=self.timeout)
+        response.raise_for_status()
+        if not response.content:
+            return {}
+        return response.json()
+
+    def close(self) -> None:
+        """세션 연결 정리"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,282 @@
+"""
+TestRail 결과 비동기 기록
+스텝 훅은 결과를 큐에 넣기만 하고, 백그라운드 스레드가 결과를 모아 add_results_for_cases로 한 번에 기록
+(시나리오 종료 시 flush, 또는 batch_size건 / batch_interval초마다), 응답의 result id에 대기 중인 스크린샷을 첨부
+요청이 서버에 닿지 않았거나 거부된 경우(연결 실패, 429, 503)만 지수 백오프로 재시도하고, 세션 종료 시 drain으로 남은 결과를 모두 보낸 뒤 Run을 닫음
+"""
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from requests.exceptions import ConnectionError as RequestsConnectionError, ConnectTimeout
+
+logger = logging.getLogger(__name__)
+
+# 백그라운드 스레드 이름 (스텝 로그 수집 핸들러에서 이 스레드의 로그는 제외)
+REPORTER_THREAD_NAME = 'testrail-reporter'
+
+# 재시도 횟수 (첫 시도 제외) 및 백오프 (초)
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 30.0
+
+# 묶음 기록 기준: 결과 수 / 첫 결과 이후 경과 시간 (초)
+# config.json: testrail_batch_size, testrail_batch_interval_seconds
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_BATCH_INTERVAL_SECONDS = 10.0
+
+# 세션 종료 시 남은 결과를 기다리는 최대 시간 (초)
+DEFAULT_DRAIN_TIMEOUT_SECONDS = 300.0
+
+# 재시도하는 상태 코드 (서버가 요청을 처리하지 않았음이 확실한 경우만)
+_RETRYABLE_STATUS_CODES = (429, 503)
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """HTTP 오류 응답의 상태 코드 (응답이 없으면 None)"""
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None)
+
+
+def _is_retryable(error: Exception) -> bool:
+    """
+    연결 실패, 429, 503만 재시도 대상
+    POST는 멱등이 아니므로 읽기 타임아웃이나 그 밖의 5xx처럼 서버가 이미 기록했을 수 있는 실패는 재시도하지 않음
+    (중복 결과 방지)
+    """
+    if isinstance(error, (RequestsConnectionError, ConnectTimeout)):
+        return True
+    return _status_code(error) in _RETRYABLE_STATUS_CODES
+
+
+# 큐에 넣는 즉시 기록 요청 표시 (시나리오 종료, drain)
+_FLUSH = object()
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """429 응답의 Retry-After 헤더 (초)"""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None) or {}
+    try:
+        return float(headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return None
+
+
+class TestRailReporter:
+    """
+    TestRail 결과 기록 큐
+
+    - submit_result: 결과(및 스크린샷)를 큐에 추가하고 바로 반환
+    - 백그라운드 스레드가 Run별로 결과를 모아 add_results_for_cases로 기록한 뒤 스크린샷 첨부
+    - flush: 모아 둔 결과를 바로 기록하도록 요청 (시나리오 종료 시 호출)
+    - drain: 큐가 빌 때까지 대기 (close_run 전에 호출)
+    """
+
+    __test__ = False  # pytest 수집 대상 아님
+
+    def __init__(
+        self,
+        post: Callable[..., Any],
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_interval_seconds: float = DEFAULT_BATCH_INTERVAL_SECONDS,
+    ):
+        """
+        TestRailReporter 초기화
+
+        Args:
+            post: testrail_post(endpoint, payload=None, files=None) 형태의 호출 함수
+            max_retries: 일시적 실패 시 재시도 횟수
+            backoff_seconds: 첫 재시도 대기 시간 (이후 2배씩 증가, 최대 MAX_BACKOFF_SECONDS)
+            batch_size: 이 수만큼 모이면 바로 기록
+            batch_interval_seconds: 첫 결과를 모은 뒤 이 시간이 지나면 기록
+        """
+        self._post = post
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.batch_size = max(int(batch_size), 1)
+        self.batch_interval_seconds = batch_interval_seconds
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {'results': 0, 'attachments': 0, 'requests': 0, 'retries': 0, 'failed': 0}
+
+    def start(self) -> None:
+        """백그라운드 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name=REPORTER_THREAD_NAME, daemon=True)
+            self._thread.start()
+
+    def submit_result(
+        self,
+        run_id: Any,
+        case_id: int,
+        payload: Dict[str, Any],
+        screenshot_path: Optional[str] = None,
+        label: Optional[str] = None,
+    ) -> None:
+        """
+        결과 기록 요청을 큐에 추가 (스텝 실행을 막지 않음)
+
+        Args:
+            run_id: TestRail Run ID
+            case_id: 케이스 ID (숫자)
+            payload: add_result_for_case 본문 (status_id, comment)
+            screenshot_path: 결과에 첨부할 스크린샷 경로
+            label: 출력용 설명 (스텝 이름 등)
+        """
+        self.start()
+        self._queue.put({
+            'run_id': run_id,
+            'case_id': case_id,
+            'payload': payload,
+            'screenshot_path': screenshot_path,
+            'label': label,
+        })
+
+    def flush(self) -> None:
+        """모아 둔 결과를 바로 기록하도록 요청 (기다리지 않음)"""
+        if self._thread is not None:
+            self._queue.put(_FLUSH)
+
+    def pending(self) -> int:
+        """아직 처리되지 않은 요청 수"""
+        return self._queue.unfinished_tasks
+
+    def drain(self, timeout: float = DEFAULT_DRAIN_TIMEOUT_SECONDS) -> bool:
+        """
+        큐에 남은 요청을 모두 처리할 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            모두 처리되면 True, 시간 초과면 False
+        """
+        if self._thread is None:
+            return True
+        self.flush()
+        deadline = time.time() + timeout
+        while self._queue.unfinished_tasks:
+            if time.time() >= deadline or not self._thread.is_alive():
+                logger.warning(f"TestRail 결과 {self._queue.unfinished_tasks}건을 기록하지 못했습니다.")
+                return False
+            time.sleep(0.05)
+        return True
+
+    def _run(self) -> None:
+        batch: List[Dict[str, Any]] = []
+        batch_started_at = 0.0
+        while True:
+            timeout = None
+            if batch:
+                timeout = max(batch_started_at + self.batch_interval_seconds - time.time(), 0.0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                # batch_interval 경과
+                item = None
+
+            if item is not None and item is not _FLUSH:
+                if not batch:
+                    batch_started_at = time.time()
+                batch.append(item)
+                if len(batch) < self.batch_size:
+                    continue
+
+            # 기록 완료 후 task_done (drain이 전송 완료까지 기다리도록)
+            try:
+                if batch:
+                    self._flush_batch(batch)
+            except Exception as e:
+                logger.warning(f"TestRail 결과 기록 중 오류 ({len(batch)}건): {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+                if item is _FLUSH:
+                    self._queue.task_done()
+                batch = []
+
+    def _flush_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Run별로 묶어 add_results_for_cases 호출 후 result id에 스크린샷 첨부"""
+        by_run: Dict[Any, List[Dict[str, Any]]] = {}
+        for item in batch:
+            by_run.setdefault(item['run_id'], []).append(item)
+
+        for run_id, items in by_run.items():
+            try:
+                results = self._call(
+                    f"add_results_for_cases/{run_id}",
+                    payload={'results': [dict(item['payload'], case_id=item['case_id']) for item in items]},
+                )
+                # 응답은 요청한 순서대로 결과 목록을 반환
+                result_ids = [result.get('id') if isinstance(result, dict) else None for result in (results or [])]
+            except Exception as e:
+                if _status_code(e) != 400:
+                    # 연결/서버 오류는 건별로 다시 보내도 실패하거나 중복 기록될 수 있으므로 묶음 전체를 실패 처리
+                    self.stats['failed'] += len(items)
+                    logger.warning(f"TestRail 결과 묶음 기록 실패 ({len(items)}건, Run ID={run_id}): {e}")
+                    continue
+                # 400: 한 케이스 때문에 묶음 전체가 거부되었으므로 건별 기록으로 재시도
+                logger.warning(f"TestRail 결과 묶음 기록 거부 ({len(items)}건), 건별 기록으로 재시도: {e}")
+                result_ids = [self._add_single_result(item) for item in items]
+            else:
+                recorded = sum(1 for result_id in result_ids if result_id is not None)
+                self.stats['results'] += recorded
+                if recorded < len(items):
+                    self.stats['failed'] += len(items) - recorded
+                    logger.warning(f"TestRail 결과 묶음 응답 누락: {len(items)}건 중 {recorded}건만 result id 반환 (Run ID={run_id})")
+                print(f"[TestRail] 결과 {recorded}건 기록 완료 (Run ID={run_id})")
+
+            for item, result_id in zip(items, result_ids):
+                self._attach_screenshot(result_id, item.get('screenshot_path'))
+
+    def _add_single_result(self, item: Dict[str, Any]) -> Optional[Any]:
+        try:
+            result = self._call(f"add_result_for_case/{item['run_id']}/{item['case_id']}", payload=item['payload'])
+        except Exception as e:
+            self.stats['failed'] += 1
+            logger.warning(f"TestRail 결과 기록 실패 (case_id: C{item['case_id']}): {e}")
+            return None
+        self.stats['results'] += 1
+        result_id = result.get('id') if isinstance(result, dict) else None
+        print(f"[TestRail] 스텝 '{item['label']}' 결과 기록 완료 (case_id: C{item['case_id']}, result_id: {result_id})")
+        return result_id
+
+    def _attach_screenshot(self, result_id: Any, screenshot_path: Optional[str]) -> None:
+        if not screenshot_path or not result_id:
+            return
+        try:
+            with open(screenshot_path, 'rb') as f:
+                self._call(f"add_attachment_to_result/{result_id}", files={'attachment': f})
+            self.stats['attachments'] += 1
+            print(f"[TestRail] 스크린샷 첨부 완료: {screenshot_path}")
+        except Exception as e:
+            logger.warning(f"TestRail 스크린샷 업로드 실패: {e}")
+
+    def _call(self, endpoint: str, payload: Optional[Dict[str, Any]] = None, files: Optional[Dict[str, Any]] = None) -> Any:
+        """일시적 실패는 지수 백오프로 재시도하며 호출"""
+        attempt = 0
+        while True:
+            self.stats['requests'] += 1
+            try:
+                if files:
+                    for f in files.values():
+                        if hasattr(f, 'seek'):
+                            f.seek(0)
+                    return self._post(endpoint, files=files)
+                return self._post(endpoint, payload)
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    raise
+                delay = _retry_after_seconds(e) or min(self.backoff_seconds * (2 ** attempt), MAX_BACKOFF_SECONDS)
+                attempt += 1
+                self.stats['retries'] += 1
+                logger.debug(f"TestRail 호출 재시도 {attempt}/{self.max_retries} ({endpoint}, {delay:.1f}초 후): {e}")
+                time.sleep(delay)
@@ -0,0 +1,45 @@
+"""
+시나리오 모듈 기준 NetworkTracker projection
+트래킹 시작 시에는 영역 전체 스키마 키(build_area_projection)로 디코딩하고,
+module_title이 정해지면 해당 모듈 스키마의 컴파일 경로 키로 좁힘
+"""
+import logging
+from typing import Any, Optional, FrozenSet
+
+from utils.schema_compiler import collect_schema_keys
+from utils.validation_helpers import load_module_config, get_nth_for_tracking
+from utils.validation_context import _get_from_context
+
+logger = logging.getLogger(__name__)
+
+
+def update_tracker_projection(bdd_context: Any, module_title: Optional[str] = None) -> Optional[FrozenSet[str]]:
+    """
+    bdd_context의 tracker/area와 모듈 스키마로 projection을 만들어 tracker에 적용
+    (스텝마다 호출해도 키 집합이 바뀐 경우에만 다시 적용, 스키마가 없으면 기존 projection 유지)
+
+    Args:
+        bdd_context: BDD context 객체
+        module_title: 모듈 타이틀 (None이면 bdd_context의 module_title)
+
+    Returns:
+        적용된 projection 또는 None
+    """
+    tracker = _get_from_context(bdd_context, 'tracker')
+    area = _get_from_context(bdd_context, 'area')
+    module_title = module_title or _get_from_context(bdd_context, 'module_title')
+    # 전체 디코딩(projection 없음)으로 시작한 tracker는 그대로 둠
+    if not tracker or not area or not module_title or tracker.projection is None:
+        return None
+
+    module_config = load_module_config(area=area, module_title=module_title, nth=get_nth_for_tracking(bdd_context))
+    if not isinstance(module_config, dict) or not module_config:
+        return None
+
+    projection = frozenset(collect_schema_keys(module_config))
+    if not projection:
+        return None
+    if tracker.projection != projection:
+        tracker.set_projection(projection)
+        logger.debug(f"트래커 projection을 모듈 스키마 키로 좁힘: {module_title} ({len(projection)}개)")
+    return projection
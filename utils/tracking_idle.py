@@ -0,0 +1,66 @@
+"""
+스텝·페이지 객체 동작 후 비콘 안정화 대기
+고정 time.sleep 대신 NetworkTracker.wait_idle로 새 aplus 비콘이 멈출 때까지만 대기
+tracker가 없거나 config.json의 tracking_idle_wait가 "N"이면 기존 고정 대기로 동작
+(페이지 객체는 BasePage.wait_for_tracking_idle로 page의 컨텍스트에서 트래킹 중인 tracker 사용)
+"""
+import logging
+import time
+from typing import Any, Optional
+
+from utils.NetworkTracker import DEFAULT_IDLE_QUIET_MS
+from utils.validation_helpers import _load_config
+from utils.validation_context import _get_from_context
+
+logger = logging.getLogger(__name__)
+
+# config.json 키 (기본값: Y)
+TRACKING_IDLE_CONFIG_KEY = 'tracking_idle_wait'
+
+
+def is_tracking_idle_wait_enabled() -> bool:
+    """config.json의 tracking_idle_wait 값 (Y/N, 기본 Y)"""
+    return str(_load_config().get(TRACKING_IDLE_CONFIG_KEY, 'Y')).strip().upper() == 'Y'
+
+
+def wait_for_tracking_idle(
+    bdd_context: Any,
+    fallback_seconds: float,
+    quiet_ms: Optional[int] = None,
+    expect_type: Optional[str] = None,
+) -> None:
+    """
+    비콘이 잠잠해질 때까지 대기 (최대 fallback_seconds, 기존 고정 대기보다 길어지지 않음)
+
+    Args:
+        bdd_context: BDD context 객체 (tracker 조회용)
+        fallback_seconds: 기존 고정 대기 시간 (초), 대기 상한 및 비활성화 시 대기 시간
+        quiet_ms: 비콘 없이 지나야 하는 시간 (ms, 기본 DEFAULT_IDLE_QUIET_MS)
+        expect_type: 지정하면 이 타입 비콘이 들어온 뒤에만 유휴로 판단 (NetworkTracker.wait_idle 참고)
+    """
+    tracker = _get_from_context(bdd_context, 'tracker') if bdd_context is not None else None
+    wait_for_tracker_idle(tracker, fallback_seconds, quiet_ms, expect_type)
+
+
+def wait_for_tracker_idle(
+    tracker: Any,
+    fallback_seconds: float,
+    quiet_ms: Optional[int] = None,
+    expect_type: Optional[str] = None,
+) -> None:
+    """
+    tracker 기준 비콘 안정화 대기 (tracker가 없으면 fallback_seconds 고정 대기)
+
+    Args:
+        tracker: NetworkTracker 인스턴스 또는 None
+        fallback_seconds: 기존 고정 대기 시간 (초), 대기 상한 및 비활성화 시 대기 시간
+        quiet_ms: 비콘 없이 지나야 하는 시간 (ms, 기본 DEFAULT_IDLE_QUIET_MS)
+        expect_type: 지정하면 이 타입 비콘이 들어온 뒤에만 유휴로 판단
+    """
+    if tracker is None or not getattr(tracker, 'is_tracking', False) or not is_tracking_idle_wait_enabled():
+        time.sleep(fallback_seconds)
+        return
+
+    max_ms = int(fallback_seconds * 1000)
+    quiet_ms = min(quiet_ms if quiet_ms is not None else DEFAULT_IDLE_QUIET_MS, max_ms)
+    tracker.wait_idle(quiet_ms=quiet_ms, max_ms=max_ms, expect_type=expect_type)
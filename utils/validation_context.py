@@ -0,0 +1,185 @@
+"""
+시나리오 단위 검증 컨텍스트
+검증 스텝마다 반복되던 tracker/goodscode/area/모듈 설정/가격 정보/frontend_data 계산을
+시나리오당 한 번만 수행하고 bdd_context에 보관
+"""
+import logging
+from typing import Dict, List, Optional, Any, Tuple
+from utils.NetworkTracker import NetworkTracker
+from utils.event_constraints import EventConstraint, load_constraints
+from utils.validation_helpers import (
+    load_module_config,
+    extract_price_info_from_pdp_pv,
+    get_nth_for_tracking,
+)
+
+logger = logging.getLogger(__name__)
+
+# bdd_context에 검증 컨텍스트를 저장하는 키
+VALIDATION_CONTEXT_KEY = 'validation_context'
+
+# 가격 정보 추출에 사용하는 이벤트 타입 (이 타입 로그가 새로 들어오면 가격 정보 재계산)
+PRICE_SOURCE_EVENT_TYPES = ('PDP PV', 'Product Minidetail')
+
+
+class ScenarioValidationContext:
+    """
+    시나리오 단위로 재사용하는 검증 입력값 묶음
+
+    - 모듈 설정(module_config)과 이벤트 제약(constraints)은 최초 접근 시 한 번만 로드
+    - 가격 정보/frontend_data는 tracker에 PDP PV·Product Minidetail 로그가 새로 들어온 경우에만 재계산
+    """
+
+    def __init__(
+        self,
+        tracker: NetworkTracker,
+        goodscode: str,
+        module_title: str,
+        area: str,
+        nth: Optional[Any] = None,
+        keyword: str = '',
+        category_id: str = '',
+        is_ad: Optional[Any] = None,
+    ):
+        """
+        ScenarioValidationContext 초기화
+
+        Args:
+            tracker: NetworkTracker 인스턴스
+            goodscode: 상품 번호
+            module_title: 모듈 타이틀
+            area: 영역명 (SRP, PDP 등)
+            nth: 스키마 변형 인덱스
+            keyword: 검색어
+            category_id: 카테고리 ID
+            is_ad: 광고 상품 여부
+        """
+        self.tracker = tracker
+        self.goodscode = goodscode
+        self.module_title = module_title
+        self.area = area
+        self.nth = nth
+        self.keyword = keyword
+        self.category_id = category_id
+        self.is_ad = is_ad
+
+        self._module_config: Optional[Dict[str, Any]] = None
+        self._constraints: Optional[List[EventConstraint]] = None
+        self._price_info: Optional[Dict[str, Any]] = None
+        self._frontend_data: Optional[Dict[str, Any]] = None
+        self._price_revision: Optional[Tuple[int, ...]] = None
+
+    @property
+    def identity(self) -> Tuple[Any, ...]:
+        """컨텍스트 재사용 여부 판단용 식별 값 (하나라도 바뀌면 새 컨텍스트 생성)"""
+        return (
+            id(self.tracker), self.goodscode, self.module_title, self.area,
+            self.nth, self.keyword, self.category_id, self.is_ad,
+        )
+
+    @property
+    def module_config(self) -> Dict[str, Any]:
+        """모듈 설정 (최초 접근 시 한 번만 로드)"""
+        if self._module_config is None:
+            loaded = load_module_config(area=self.area, module_title=self.module_title, nth=self.nth)
+            self._module_config = loaded if isinstance(loaded, dict) else {}
+        return self._module_config
+
+    @property
+    def constraints(self) -> List[EventConstraint]:
+        """모듈 설정의 이벤트 순서·지연 제약 (최초 접근 시 한 번만 해석)"""
+        if self._constraints is None:
+            self._constraints = load_constraints(self.module_config)
+        return self._constraints
+
+    def _refresh_price_if_needed(self) -> None:
+        """PDP PV·Product Minidetail 로그가 새로 수집된 경우에만 가격 정보와 frontend_data 재계산"""
+        revision = self.tracker.get_log_revision(*PRICE_SOURCE_EVENT_TYPES)
+        if revision == self._price_revision:
+            return
+
+        self._price_info = extract_price_info_from_pdp_pv(self.tracker, self.goodscode)
+
+        frontend_data = self._price_info.copy() if self._price_info else {}
+        if self.keyword:
+            frontend_data['keyword'] = self.keyword
+        if self.category_id:
+            frontend_data['category_id'] = self.category_id
+        if self.is_ad is not None:
+            frontend_data['is_ad'] = self.is_ad
+        self._frontend_data = frontend_data if frontend_data else None
+
+        if self._price_revision is not None:
+            logger.debug(f"가격 정보 재계산: goodscode={self.goodscode}, revision={self._price_revision} → {revision}")
+        self._price_revision = revision
+
+    @property
+    def price_info(self) -> Optional[Dict[str, Any]]:
+        """PDP PV(없으면 Product Minidetail) 로그에서 추출한 가격 정보"""
+        self._refresh_price_if_needed()
+        return self._price_info
+
+    @property
+    def frontend_data(self) -> Optional[Dict[str, Any]]:
+        """가격 정보 + keyword/category_id/is_ad를 합친 frontend_data (없으면 None)"""
+        self._refresh_price_if_needed()
+        return self._frontend_data
+
+
+def _get_from_context(bdd_context: Any, key: str, default: Any = None) -> Any:
+    """bdd_context.store 우선, 없으면 bdd_context.get으로 조회"""
+    if hasattr(bdd_context, 'store') and hasattr(bdd_context.store, 'get'):
+        value = bdd_context.store.get(key)
+        if value is not None:
+            return value
+    if hasattr(bdd_context, 'get'):
+        return bdd_context.get(key, default)
+    return default
+
+
+def get_validation_context(bdd_context: Any) -> ScenarioValidationContext:
+    """
+    bdd_context에 저장된 검증 컨텍스트 반환 (없거나 입력값이 바뀌었으면 새로 생성하여 저장)
+
+    Args:
+        bdd_context: BDD context 객체
+
+    Returns:
+        ScenarioValidationContext 인스턴스
+
+    Raises:
+        ValueError: tracker, goodscode, module_title, area 중 하나라도 없을 때
+    """
+    tracker = _get_from_context(bdd_context, 'tracker')
+    if not tracker:
+        raise ValueError("bdd_context에 'tracker'가 없습니다. 네트워크 트래킹을 시작해주세요.")
+
+    goodscode = _get_from_context(bdd_context, 'goodscode')
+    if not goodscode:
+        raise ValueError("bdd_context에 'goodscode'가 없습니다.")
+
+    module_title = _get_from_context(bdd_context, 'module_title')
+    if not module_title:
+        raise ValueError("bdd_context에 'module_title'가 없습니다.")
+
+    area = _get_from_context(bdd_context, 'area')
+    if not area:
+        raise ValueError("bdd_context에 'area'가 없습니다. Feature 파일 경로에서 영역을 추론하지 못했습니다.")
+
+    candidate = ScenarioValidationContext(
+        tracker=tracker,
+        goodscode=goodscode,
+        module_title=module_title,
+        area=area,
+        nth=get_nth_for_tracking(bdd_context),
+        keyword=_get_from_context(bdd_context, 'keyword', '') or '',
+        category_id=_get_from_context(bdd_context, 'category_id', '') or '',
+        is_ad=_get_from_context(bdd_context, 'is_ad'),
+    )
+
+    existing = _get_from_context(bdd_context, VALIDATION_CONTEXT_KEY)
+    if isinstance(existing, ScenarioValidationContext) and existing.identity == candidate.identity:
+        return existing
+
+    bdd_context[VALIDATION_CONTEXT_KEY] = candidate
+    return candidate
@@ -2,12 +2,17 @@
 공통 검증 로직을 헬퍼 함수로 제공
 이벤트 타입별로 검증 수행
 """
+import hashlib
 import json
 import logging
+import threading
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union, Iterable
 from utils.NetworkTracker import NetworkTracker
+from utils.validation_report import PayloadValidationError
+from utils.schema_registry import get_schema_registry
+from utils.schema_compiler import get_compiled_schema, compile_template, KIND_MANDATORY, KIND_SKIP, KIND_TEMPLATE
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +52,21 @@ EVENT_TYPE_CONFIG_KEY_MAP = {
 # Product Minidetail 검증 시 제외할 가격 관련 필드
 MINIDETAIL_PRICE_EXCLUDE_FIELDS = ['origin_price', 'promotion_price', 'coupon_price']
 
+# 검증 모드 (config.json validation_mode 또는 pytest --validation-mode)
+VALIDATION_MODE_FULL = 'full'            # 모든 로그·필드 검증, 에러 전체 수집 (리포트용, 기본값)
+VALIDATION_MODE_FAIL_FAST = 'fail_fast'  # 첫 번째 불일치 필드/로그에서 중단
+VALIDATION_MODE_SAMPLED = 'sampled'      # 이벤트 타입별 최신 N개 로그만 검증
+VALIDATION_MODES = (VALIDATION_MODE_FULL, VALIDATION_MODE_FAIL_FAST, VALIDATION_MODE_SAMPLED)
+# sampled 모드 기본 로그 수 (config.json validation_sample_size 또는 pytest --validation-sample-size)
+DEFAULT_VALIDATION_SAMPLE_SIZE = 3
+
+# pytest 옵션으로 지정된 검증 모드 (config.json보다 우선)
+_validation_mode_override: Dict[str, Any] = {}
+
+# 검증 결과 캐시 실행 전체 통계 (tracker별 캐시의 hit/miss 합계, 세션 종료 시 출력)
+_validation_cache_stats = {'hits': 0, 'misses': 0}
+_validation_cache_stats_lock = threading.Lock()
+
 
 def normalize_nth(nth: Any) -> Optional[str]:
     """
@@ -153,20 +173,14 @@ def load_module_config(
     if area is None:
         area = detect_area_from_feature_path(feature_path)
     
-    config_base_path = Path(__file__).parent.parent / 'tracking_schemas' / area
+    # 파일은 프로세스 단위 레지스트리에서 한 번만 읽고, mtime이 바뀐 경우에만 다시 읽음
+    # (반환값은 캐시와 공유되므로 수정하지 않음)
+    registry = get_schema_registry()
     
     # module_title이 지정된 경우 해당 파일만 로드
     if module_title:
         n_suffix = normalize_nth(nth)
-        chosen: Optional[Path] = None
-        if n_suffix:
-            paren_path = config_base_path / f"{module_title}({n_suffix}).json"
-            if paren_path.exists():
-                chosen = paren_path
-        if chosen is None:
-            default_path = config_base_path / f"{module_title}.json"
-            if default_path.exists():
-                chosen = default_path
+        chosen = registry.resolve_module_path(area, module_title, n_suffix)
         if chosen is None:
             logger.info(
                 "트래킹 스키마 파일 없음: area=%s module=%s nth=%s (기대: %s(%s).json 또는 %s.json)",
@@ -178,20 +192,12 @@ def load_module_config(
                 module_title,
             )
             return {}
-        with open(chosen, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        logger.info("트래킹 스키마 로드: %s", chosen.resolve())
+        data = registry.load_json(chosen)
+        logger.debug("트래킹 스키마 로드: %s", chosen.resolve())
         return data
     
     # module_title이 None이면 전체 영역의 모든 모듈 로드
-    config_dict = {}
-    if config_base_path.exists():
-        for config_file in config_base_path.glob("*.json"):
-            module_name = config_file.stem
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_dict[module_name] = json.load(f)
-    
-    return config_dict
+    return registry.get_area(area)
 
 
 def _extract_price_info_from_payload(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -276,7 +282,13 @@ def extract_price_info_from_pdp_pv(tracker: NetworkTracker, goodscode: str) -> O
     return None
 
 
-def get_event_logs(tracker: NetworkTracker, event_type: str, goodscode: str, module_config_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+def get_event_logs(
+    tracker: NetworkTracker,
+    event_type: str,
+    goodscode: str,
+    module_config_data: Dict[str, Any],
+    latest_only: bool = True,
+) -> List[Dict[str, Any]]:
     """
     이벤트 타입별 로그 수집
     
@@ -285,6 +297,7 @@ def get_event_logs(tracker: NetworkTracker, event_type: str, goodscode: str, mod
         event_type: 이벤트 타입
         goodscode: 상품 번호
         module_config_data: 모듈 설정 데이터
+        latest_only: False면 Module/Product Exposure도 최신 1건으로 줄이지 않고 전체 반환
     
     Returns:
         로그 리스트
@@ -303,14 +316,14 @@ def get_event_logs(tracker: NetworkTracker, event_type: str, goodscode: str, mod
         logs = tracker.get_pdp_pv_logs_by_goodscode(goodscode)
     elif event_type == 'Module Exposure':
         if module_spm:
-            logs = tracker.get_module_exposure_logs_by_spm(module_spm)
+            logs = tracker.get_module_exposure_logs_by_spm(module_spm, latest_only=latest_only)
         else:
             logs = tracker.get_logs('Module Exposure')
     elif event_type == 'Product Exposure':
         if module_spm:
-            logs = tracker.get_product_exposure_logs_by_goodscode(goodscode, module_spm)
+            logs = tracker.get_product_exposure_logs_by_goodscode(goodscode, module_spm, latest_only=latest_only)
         else:
-            logs = tracker.get_product_exposure_logs_by_goodscode(goodscode)
+            logs = tracker.get_product_exposure_logs_by_goodscode(goodscode, latest_only=latest_only)
     elif event_type == 'Product Click':
         logs = tracker.get_product_click_logs_by_goodscode(goodscode)
     elif event_type == 'Product ATC Click':
@@ -333,6 +346,48 @@ def get_event_logs(tracker: NetworkTracker, event_type: str, goodscode: str, mod
     return logs
 
 
+def get_event_logs_many(
+    tracker: NetworkTracker,
+    event_type: str,
+    goodscodes: List[str],
+    module_config_data: Dict[str, Any],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    여러 goodscode에 대한 이벤트 타입별 로그 수집 (get_event_logs의 다건 버전)
+    tracker 로그를 goodscode마다 다시 훑지 않고 한 번의 순회로 분류
+    
+    Args:
+        tracker: NetworkTracker 인스턴스
+        event_type: 이벤트 타입
+        goodscodes: 상품 번호 리스트
+        module_config_data: 모듈 설정 데이터
+    
+    Returns:
+        {goodscode: 로그 리스트} 딕셔너리
+    """
+    codes = [str(code) for code in goodscodes]
+    event_config_key = EVENT_TYPE_CONFIG_KEY_MAP.get(event_type)
+    
+    # 이벤트 타입별 섹션에서 spm 값 가져오기 (재귀적으로 탐색)
+    module_spm = None
+    if event_config_key:
+        event_config = module_config_data.get(event_config_key, {})
+        module_spm = _find_spm_recursive(event_config)
+    
+    # goodscode와 무관한 로그는 한 번만 조회해서 공유
+    if event_type in ('PV', 'Module Exposure'):
+        logs = get_event_logs(tracker, event_type, codes[0] if codes else '', module_config_data)
+        return {code: logs for code in codes}
+    
+    if event_type == 'Product Exposure':
+        return tracker.get_product_exposure_logs_by_goodscodes(codes, module_spm)
+    
+    if event_type in EVENT_TYPE_METHODS:
+        return tracker.get_logs_by_goodscodes(codes, event_type)
+    
+    return {code: [] for code in codes}
+
+
 def _find_spm_recursive(config_section: Dict[str, Any]) -> Optional[str]:
     """
     config 섹션에서 spm 값을 재귀적으로 찾기
@@ -424,100 +479,108 @@ def _process_config_section(
 
 
 def _load_config() -> Dict[str, Any]:
-    """config.json 파일 로드"""
+    """config.json 파일 로드 (레지스트리 캐시 사용, 파일이 바뀐 경우에만 다시 읽음)"""
     config_path = Path(__file__).parent.parent / 'config.json'
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return get_schema_registry().load_json(config_path)
     except FileNotFoundError:
         # config.json이 없으면 기본값 반환
         return {'environment': 'prod'}
 
 
-def replace_placeholders(value: Any, goodscode: str, frontend_data: Optional[Dict[str, Any]] = None) -> Any:
+def _is_ad_traffic(is_ad_value: Any) -> bool:
+    """is_ad 값이 광고 상품을 의미하는지 여부 (<trafficType> 치환용)"""
+    return is_ad_value is True or (isinstance(is_ad_value, str) and is_ad_value.upper() in ('Y', 'TRUE', '1')) or is_ad_value == 1
+
+
+def build_placeholder_bindings(
+    goodscode: str,
+    frontend_data: Optional[Dict[str, Any]] = None,
+    placeholders: Optional[Iterable[str]] = None,
+) -> Dict[str, str]:
     """
-    값에서 placeholder를 실제 값으로 치환
+    시나리오 값(goodscode, frontend_data)으로 placeholder 치환 테이블 생성
+    치환 조건을 만족하지 않는 placeholder는 테이블에 넣지 않아 원문 그대로 유지됨
     
     Args:
-        value: 치환할 값
         goodscode: 상품 번호
         frontend_data: 프론트에서 읽은 데이터 (keyword, origin_price, promotion_price, coupon_price, is_ad 등)
+        placeholders: 필요한 placeholder 집합 (None이면 전체 계산)
     
     Returns:
-        치환된 값
+        {placeholder: 치환값} 딕셔너리
     """
-    if isinstance(value, str):
-        # mandatory 값 처리: "mandatory" → "__MANDATORY__"
-        if value.strip() == "mandatory":
-            return "__MANDATORY__"
-        
-        # skip 값 처리: "skip" → "__SKIP__"
-        if value.strip() == "skip":
-            return "__SKIP__"
+    def needed(placeholder: str) -> bool:
+        return placeholders is None or placeholder in placeholders
+    
+    bindings: Dict[str, str] = {}
+    if goodscode is not None:
+        bindings['<상품번호>'] = str(goodscode)
+        # {goodscode} placeholder (기존 형식 유지)
+        bindings['{goodscode}'] = str(goodscode)
+    
+    # <environment> (config.json에서 읽어옴)
+    if needed('<environment>'):
+        bindings['<environment>'] = _load_config().get('environment', 'prod')
+    
+    # frontend_data 기반 placeholder
+    if frontend_data:
+        # <검색어>: keyword 또는 category_id 사용, 없으면 공란
+        if frontend_data.get('keyword'):
+            bindings['<검색어>'] = str(frontend_data['keyword'])
+        elif frontend_data.get('category_id'):
+            bindings['<검색어>'] = str(frontend_data['category_id'])
+        else:
+            bindings['<검색어>'] = ''
         
-        # <상품번호> placeholder 치환
-        if '<상품번호>' in value:
-            value = value.replace('<상품번호>', goodscode)
+        if 'origin_price' in frontend_data:
+            bindings['<원가>'] = str(frontend_data['origin_price'])
+        if 'promotion_price' in frontend_data:
+            bindings['<할인가>'] = str(frontend_data['promotion_price'])
         
-        # {goodscode} placeholder 치환 (기존 형식 유지)
-        if '{goodscode}' in value:
-            value = value.replace('{goodscode}', goodscode)
+        # <쿠폰적용가>: 없거나 None이거나 빈 문자열이면 공란
+        coupon_price = frontend_data.get('coupon_price', '')
+        bindings['<쿠폰적용가>'] = '' if coupon_price is None or coupon_price == '' else str(coupon_price)
         
-        # <environment> placeholder 치환 (config.json에서 읽어옴)
-        if '<environment>' in value:
-            config = _load_config()
-            environment = config.get('environment', 'prod')
-            value = value.replace('<environment>', environment)
+        if frontend_data.get('is_ad') is not None:
+            bindings['<is_ad>'] = str(frontend_data['is_ad'])
         
-        # frontend_data에서 값 가져오기
-        if frontend_data:
-            # <검색어> placeholder 치환 (keyword 또는 category_id 사용, 없으면 공란)
-            if '<검색어>' in value:
-                if 'keyword' in frontend_data and frontend_data['keyword']:
-                    search_value = str(frontend_data['keyword'])
-                elif 'category_id' in frontend_data and frontend_data['category_id']:
-                    search_value = str(frontend_data['category_id'])
-                else:
-                    search_value = ''
-                value = value.replace('<검색어>', search_value)
-            
-            # <원가> placeholder 치환
-            if '<원가>' in value and 'origin_price' in frontend_data:
-                value = value.replace('<원가>', str(frontend_data['origin_price']))
-            
-            # <할인가> placeholder 치환
-            if '<할인가>' in value and 'promotion_price' in frontend_data:
-                value = value.replace('<할인가>', str(frontend_data['promotion_price']))
-            
-            # <쿠폰적용가> placeholder 치환
-            if '<쿠폰적용가>' in value:
-                # coupon_price가 frontend_data에 없거나 None이거나 빈 문자열이면 공란("")으로 치환
-                coupon_price = frontend_data.get('coupon_price', '')
-                if coupon_price is None or coupon_price == '':
-                    coupon_price_str = ''
-                else:
-                    coupon_price_str = str(coupon_price)
-                value = value.replace('<쿠폰적용가>', coupon_price_str)
-            
-            # <is_ad> placeholder 치환
-            if '<is_ad>' in value and 'is_ad' in frontend_data:
-                is_ad_value = frontend_data.get('is_ad')
-                if is_ad_value is not None:
-                    value = value.replace('<is_ad>', str(is_ad_value))
-            
-            # <trafficType> placeholder 치환 (is_ad에 따라 "ad" 또는 "organic")
-            if '<trafficType>' in value:
-                if 'is_ad' in frontend_data:
-                    is_ad_val = frontend_data.get('is_ad')
-                    if is_ad_val is True or (isinstance(is_ad_val, str) and str(is_ad_val).upper() in ('Y', 'TRUE', '1')) or is_ad_val == 1:
-                        traffic_type = "ad"
-                    else:
-                        traffic_type = "organic"
-                else:
-                    traffic_type = "organic"  # is_ad 없을 때 기본 organic
-                value = value.replace('<trafficType>', traffic_type)
+        # <trafficType>: is_ad에 따라 "ad" 또는 "organic" (is_ad 없을 때 기본 organic)
+        bindings['<trafficType>'] = "ad" if _is_ad_traffic(frontend_data.get('is_ad')) else "organic"
+    
+    return bindings
 
-    return value
+
+def replace_placeholders(value: Any, goodscode: str, frontend_data: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    값에서 placeholder를 실제 값으로 치환
+    값은 PlaceholderTemplate으로 한 번만 파싱되며, 여러 값을 같은 시나리오 값으로 치환할 때는
+    build_placeholder_bindings로 만든 테이블을 재사용하는 편이 빠름
+    
+    Args:
+        value: 치환할 값
+        goodscode: 상품 번호
+        frontend_data: 프론트에서 읽은 데이터 (keyword, origin_price, promotion_price, coupon_price, is_ad 등)
+    
+    Returns:
+        치환된 값
+    """
+    if not isinstance(value, str):
+        return value
+    
+    # mandatory 값 처리: "mandatory" → "__MANDATORY__"
+    if value.strip() == "mandatory":
+        return "__MANDATORY__"
+    
+    # skip 값 처리: "skip" → "__SKIP__"
+    if value.strip() == "skip":
+        return "__SKIP__"
+    
+    # placeholder가 없는 값은 치환 없이 그대로 반환
+    template = compile_template(value)
+    if not template.placeholders:
+        return value
+    return template.render(build_placeholder_bindings(goodscode, frontend_data, template.placeholders))
 
 
 def build_expected_from_module_config(
@@ -553,11 +616,61 @@ def build_expected_from_module_config(
         event_config = module_config.get(event_config_key, {})
 
         if event_config:
-            _process_config_section(event_config, event_type, goodscode, frontend_data, exclude_fields, expected, is_common=False)
+            # 레지스트리에서 읽은 스키마는 컴파일된 평면 목록 사용 (재귀 순회 생략)
+            compiled = get_compiled_schema(module_config)
+            if compiled is not None and event_config_key in compiled['events']:
+                _build_expected_from_compiled(compiled['events'][event_config_key], goodscode, frontend_data, exclude_fields, expected)
+            else:
+                _process_config_section(event_config, event_type, goodscode, frontend_data, exclude_fields, expected, is_common=False)
     
     return expected
 
 
+def _build_expected_from_compiled(
+    entries: List[Dict[str, Any]],
+    goodscode: str,
+    frontend_data: Optional[Dict[str, Any]],
+    exclude_fields: List[str],
+    expected: Dict[str, Any],
+):
+    """
+    컴파일된 평면 기대값 목록으로 expected_values 생성 (_process_config_section과 동일한 결과)
+    
+    Args:
+        entries: schema_compiler.compile_event_section 결과
+        goodscode: 상품 번호
+        frontend_data: 프론트에서 읽은 데이터
+        exclude_fields: 제외할 필드 목록 (상위 키에 포함돼도 하위 필드 전체 제외)
+        expected: 결과를 저장할 딕셔너리
+    """
+    is_ad_y = bool(frontend_data) and frontend_data.get('is_ad') is not None and str(frontend_data.get('is_ad')).upper() == 'Y'
+    # 시나리오 값 치환 테이블은 한 번만 생성 (템플릿 항목이 있을 때만)
+    bindings: Optional[Dict[str, str]] = None
+    
+    for entry in entries:
+        field_name = entry['field']
+        if field_name in exclude_fields:
+            continue
+        if exclude_fields and any(key in exclude_fields for key in entry['path']):
+            continue
+        
+        # adProduct, adSubProduct 필드는 is_ad가 "Y"일 때만 검증
+        if entry.get('ad_only') and not is_ad_y:
+            continue
+        
+        kind = entry['kind']
+        if kind == KIND_MANDATORY:
+            expected[field_name] = "__MANDATORY__"
+        elif kind == KIND_SKIP:
+            expected[field_name] = "__SKIP__"
+        elif kind == KIND_TEMPLATE:
+            if bindings is None:
+                bindings = build_placeholder_bindings(goodscode, frontend_data)
+            expected[field_name] = compile_template(entry['value']).render(bindings)
+        else:
+            expected[field_name] = entry['value']
+
+
 def find_value_recursive(data: Dict[str, Any], target_key: str) -> Optional[Any]:
     """
     딕셔너리에서 재귀적으로 키를 찾아 값 반환
@@ -586,37 +699,22 @@ def find_value_recursive(data: Dict[str, Any], target_key: str) -> Optional[Any]
     return None
 
 
-def validate_event_type_logs(
-    tracker: NetworkTracker,
+def _prepare_event_validation(
     event_type: str,
-    goodscode: str,
     module_title: str,
-    frontend_data: Optional[Dict[str, Any]] = None,
-    module_config: Optional[Dict[str, Any]] = None,
-    exclude_fields: Optional[List[str]] = None,
-    area: Optional[str] = None,
-    feature_path: Optional[str] = None,
-    nth: Optional[Any] = None,
-) -> Tuple[bool, List[str], Dict[str, Any]]:
+    module_config: Optional[Dict[str, Any]],
+    exclude_fields: Optional[List[str]],
+    area: Optional[str],
+    feature_path: Optional[str],
+    nth: Optional[Any],
+) -> Tuple[Optional[Dict[str, Any]], List[str]]:
     """
-    특정 이벤트 타입의 트래킹 로그 정합성 검증 (module_config.json만 사용)
-    
-    Args:
-        tracker: NetworkTracker 인스턴스
-        event_type: 이벤트 타입 ('PV', 'Module Exposure', 'Product Exposure' 등)
-        goodscode: 상품 번호
-        module_title: 모듈 타이틀
-        frontend_data: 프론트에서 읽은 데이터 (price, keyword, is_ad 등)
-        module_config: 모듈별 설정 딕셔너리 (None이면 JSON 파일에서 자동 로드)
-        exclude_fields: 검증에서 제외할 필드 목록
-        area, feature_path, nth: module_config가 None일 때 load_module_config에 전달
+    이벤트 타입 검증에 필요한 모듈 설정 데이터와 제외 필드 목록 준비
     
     Returns:
-        (성공 여부, 에러 메시지 리스트, 통과한 필드와 기대값 딕셔너리)
+        (module_config_data, exclude_fields) 튜플
+        - 검증 대상이 아니면 module_config_data는 None (알 수 없는 이벤트 타입, config에 섹션 없음)
     """
-    errors = []
-    all_passed_fields = {}  # 모든 로그에서 통과한 필드와 값 딕셔너리
-    
     # 모듈 설정 로드
     if module_config is None:
         module_config = load_module_config(
@@ -639,11 +737,11 @@ def validate_event_type_logs(
     if not event_config_key:
         # PV는 특별한 구조가 없을 수 있음
         if event_type != 'PV':
-            return True, [], {}  # 알 수 없는 이벤트 타입은 스킵
+            return None, []  # 알 수 없는 이벤트 타입은 스킵
     
     # module_config.json에 이벤트 타입별 섹션이 없으면 검증 스킵
     if event_config_key and event_config_key not in module_config_data:
-        return True, [], {}  # config에 정의되지 않은 이벤트는 검증하지 않음
+        return None, []  # config에 정의되지 않은 이벤트는 검증하지 않음
     
     # Product Minidetail: 가격 관련 필드 검증 건너뛰기
     if event_type == 'Product Minidetail':
@@ -654,39 +752,292 @@ def validate_event_type_logs(
     elif exclude_fields is None:
         exclude_fields = []
     
-    # 로그 가져오기
-    logs = get_event_logs(tracker, event_type, goodscode, module_config_data)
+    return module_config_data, exclude_fields
+
+
+def set_validation_mode(mode: Optional[str] = None, sample_size: Optional[int] = None) -> None:
+    """
+    검증 모드 지정 (pytest 옵션 처리용, 지정한 값이 config.json보다 우선)
     
-    # 로그가 없고 config에도 정의되지 않은 경우는 스킵 (정상)
-    if len(logs) == 0:
-        return True, [], {}
+    Args:
+        mode: VALIDATION_MODES 중 하나 (None이면 config.json 사용)
+        sample_size: sampled 모드에서 검증할 최신 로그 수 (None이면 config.json 사용)
     
-    # module_config.json에서 expected 값 생성
-    expected = build_expected_from_module_config(
-        module_config_data,
-        event_type,
-        goodscode,
-        frontend_data,
-        exclude_fields
-    )
+    Raises:
+        ValueError: 알 수 없는 모드
+    """
+    if mode is not None and mode not in VALIDATION_MODES:
+        raise ValueError(f"알 수 없는 검증 모드: {mode} (사용 가능: {', '.join(VALIDATION_MODES)})")
+    _validation_mode_override.clear()
+    if mode is not None:
+        _validation_mode_override['mode'] = mode
+    if sample_size is not None:
+        _validation_mode_override['sample_size'] = sample_size
+
+
+def get_validation_mode() -> Tuple[str, int]:
+    """
+    현재 검증 모드 반환 (pytest 옵션 → config.json → 기본값 순)
+    
+    Returns:
+        (검증 모드, sampled 모드 로그 수) 튜플
+    """
+    config = _load_config()
+    mode = _validation_mode_override.get('mode') or str(config.get('validation_mode') or VALIDATION_MODE_FULL).strip().lower()
+    if mode not in VALIDATION_MODES:
+        logger.warning(f"알 수 없는 validation_mode 값 '{mode}', 전체 검증으로 진행합니다.")
+        mode = VALIDATION_MODE_FULL
+    
+    sample_size = _validation_mode_override.get('sample_size', config.get('validation_sample_size', DEFAULT_VALIDATION_SAMPLE_SIZE))
+    try:
+        sample_size = max(int(sample_size), 1)
+    except (TypeError, ValueError):
+        sample_size = DEFAULT_VALIDATION_SAMPLE_SIZE
+    return mode, sample_size
+
+
+def _apply_validation_mode(logs: List[Dict[str, Any]], mode: str, sample_size: int) -> List[Dict[str, Any]]:
+    """sampled 모드면 수집 시각 기준 최신 sample_size개 로그만 남김 (순서는 수집 순서 유지)"""
+    if mode != VALIDATION_MODE_SAMPLED or len(logs) <= sample_size:
+        return logs
+    latest = sorted(range(len(logs)), key=lambda idx: logs[idx].get('timestamp') or 0)[-sample_size:]
+    return [logs[idx] for idx in sorted(latest)]
+
+
+def _hash_expected(expected: Dict[str, Any]) -> str:
+    """
+    기대값 딕셔너리의 해시
+    기대값은 (컴파일된 스키마, frontend_data, goodscode, 제외 필드)로 결정되므로 이 조합의 식별자로 사용
+    """
+    canonical = json.dumps(expected, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+
+def _validate_payload_cached(
+    tracker: NetworkTracker,
+    log: Dict[str, Any],
+    expected: Dict[str, Any],
+    expected_hash: str,
+    goodscode: str,
+    event_type: str,
+    fail_fast: bool = False,
+) -> Tuple[bool, Dict[str, Any]]:
+    """
+    tracker 검증 결과 캐시를 거쳐 validate_payload 호출
+    같은 로그를 같은 기대값으로 다시 검증하면 (PV/PDP PV 중복 조회, 스텝 재시도 등) 이전 결과를 그대로 반환
+    
+    Returns:
+        validate_payload와 동일 (실패 시 캐시된 PayloadValidationError를 다시 발생)
+    """
+    log_id = log.get('log_id')
+    cache = getattr(tracker, 'validation_cache', None)
+    if log_id is None or cache is None:
+        return tracker.validate_payload(log, expected, goodscode, event_type, fail_fast=fail_fast)
+    
+    key = (log_id, event_type, goodscode, expected_hash, fail_fast)
+    cached = cache.get(key)
+    if cached is not None:
+        with _validation_cache_stats_lock:
+            _validation_cache_stats['hits'] += 1
+        if isinstance(cached, AssertionError):
+            raise cached
+        return True, dict(cached)
+    
+    with _validation_cache_stats_lock:
+        _validation_cache_stats['misses'] += 1
+    try:
+        result = tracker.validate_payload(log, expected, goodscode, event_type, fail_fast=fail_fast)
+    except AssertionError as e:
+        cache[key] = e
+        raise
+    if isinstance(result, tuple) and len(result) == 2 and isinstance(result[1], dict):
+        cache[key] = dict(result[1])
+    return result
+
+
+def get_validation_cache_stats() -> Dict[str, int]:
+    """검증 결과 캐시 실행 전체 통계 (hits, misses)"""
+    with _validation_cache_stats_lock:
+        return dict(_validation_cache_stats)
+
+
+def _validate_logs_against_expected(
+    tracker: NetworkTracker,
+    logs: List[Dict[str, Any]],
+    expected: Dict[str, Any],
+    goodscode: str,
+    event_type: str,
+    fail_fast: bool = False,
+) -> Tuple[bool, List[Union[PayloadValidationError, str]], Dict[str, Any]]:
+    """
+    로그 리스트를 기대값으로 검증 (fail_fast이면 첫 번째 실패 로그에서 중단)
+    
+    Returns:
+        (성공 여부, 에러 리스트, 통과한 필드와 기대값 딕셔너리)
+    """
+    errors = []
+    all_passed_fields = {}  # 모든 로그에서 통과한 필드와 값 딕셔너리
+    expected_hash = _hash_expected(expected)
     
     # 각 로그에 대해 검증
     for log in logs:
         # expected 값 검증 (AssertionError를 잡아서 에러 리스트에 추가)
         # validate_payload는 전체 로그 객체를 받아 내부에서 log.get('payload')로 추출함
         try:
-            result = tracker.validate_payload(log, expected, goodscode, event_type)
+            result = _validate_payload_cached(tracker, log, expected, expected_hash, goodscode, event_type, fail_fast)
             # result가 튜플인 경우 (성공 여부, 통과한 필드와 값 딕셔너리)
             if isinstance(result, tuple) and len(result) == 2:
                 _, passed_fields_dict = result
                 # 통과한 필드와 값 딕셔너리에 병합 (나중 로그의 값이 우선)
                 if isinstance(passed_fields_dict, dict):
                     all_passed_fields.update(passed_fields_dict)
+        except PayloadValidationError as e:
+            # 메시지 렌더링은 리포트를 표시할 때까지 미룸
+            errors.append(e)
         except AssertionError as e:
             errors.append(str(e))
+        
+        if fail_fast and errors:
+            break
     
     # 에러가 있으면 실패
     if errors:
         return False, errors, all_passed_fields
     
     return True, [], all_passed_fields
+
+
+def validate_event_type_logs(
+    tracker: NetworkTracker,
+    event_type: str,
+    goodscode: str,
+    module_title: str,
+    frontend_data: Optional[Dict[str, Any]] = None,
+    module_config: Optional[Dict[str, Any]] = None,
+    exclude_fields: Optional[List[str]] = None,
+    area: Optional[str] = None,
+    feature_path: Optional[str] = None,
+    nth: Optional[Any] = None,
+) -> Tuple[bool, List[Union[PayloadValidationError, str]], Dict[str, Any]]:
+    """
+    특정 이벤트 타입의 트래킹 로그 정합성 검증 (module_config.json만 사용)
+    
+    Args:
+        tracker: NetworkTracker 인스턴스
+        event_type: 이벤트 타입 ('PV', 'Module Exposure', 'Product Exposure' 등)
+        goodscode: 상품 번호
+        module_title: 모듈 타이틀
+        frontend_data: 프론트에서 읽은 데이터 (price, keyword, is_ad 등)
+        module_config: 모듈별 설정 딕셔너리 (None이면 JSON 파일에서 자동 로드)
+        exclude_fields: 검증에서 제외할 필드 목록
+        area, feature_path, nth: module_config가 None일 때 load_module_config에 전달
+    
+    Returns:
+        (성공 여부, 에러 리스트, 통과한 필드와 기대값 딕셔너리)
+        - 에러 리스트 항목은 PayloadValidationError(표시 시점에 렌더링) 또는 문자열
+    
+    Note:
+        검증 모드(get_validation_mode)에 따라 fail_fast는 첫 번째 불일치에서 중단,
+        sampled는 최신 N개 로그만 검증
+    """
+    module_config_data, exclude_fields = _prepare_event_validation(
+        event_type, module_title, module_config, exclude_fields, area, feature_path, nth
+    )
+    if module_config_data is None:
+        return True, [], {}
+    
+    # 로그 가져오기
+    logs = get_event_logs(tracker, event_type, goodscode, module_config_data)
+    
+    # 로그가 없고 config에도 정의되지 않은 경우는 스킵 (정상)
+    if len(logs) == 0:
+        return True, [], {}
+    
+    # 검증 모드 적용 (sampled: 최신 N개만, fail_fast: 첫 실패에서 중단)
+    mode, sample_size = get_validation_mode()
+    logs = _apply_validation_mode(logs, mode, sample_size)
+    
+    # module_config.json에서 expected 값 생성
+    expected = build_expected_from_module_config(
+        module_config_data,
+        event_type,
+        goodscode,
+        frontend_data,
+        exclude_fields
+    )
+    
+    return _validate_logs_against_expected(
+        tracker, logs, expected, goodscode, event_type, fail_fast=(mode == VALIDATION_MODE_FAIL_FAST)
+    )
+
+
+def validate_event_type_logs_many(
+    tracker: NetworkTracker,
+    event_type: str,
+    goodscodes: List[str],
+    module_title: str,
+    frontend_data: Optional[Dict[str, Any]] = None,
+    module_config: Optional[Dict[str, Any]] = None,
+    exclude_fields: Optional[List[str]] = None,
+    area: Optional[str] = None,
+    feature_path: Optional[str] = None,
+    nth: Optional[Any] = None,
+    frontend_data_by_goodscode: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, Tuple[bool, List[Union[PayloadValidationError, str]], Dict[str, Any]]]:
+    """
+    여러 goodscode에 대해 특정 이벤트 타입의 트래킹 로그 정합성 검증 (validate_event_type_logs의 다건 버전)
+    tracker 로그를 한 번만 순회하여 goodscode별로 분류한 뒤 검증하므로,
+    모듈 노출 상품 전체를 검증해도 단건 검증과 비슷한 비용으로 처리됨
+    
+    Args:
+        tracker: NetworkTracker 인스턴스
+        event_type: 이벤트 타입 ('Product Exposure', 'Product Click' 등)
+        goodscodes: 상품 번호 리스트
+        module_title: 모듈 타이틀
+        frontend_data: 모든 goodscode에 공통으로 사용할 프론트 데이터
+        module_config: 모듈별 설정 딕셔너리 (None이면 JSON 파일에서 자동 로드)
+        exclude_fields: 검증에서 제외할 필드 목록
+        area, feature_path, nth: module_config가 None일 때 load_module_config에 전달
+        frontend_data_by_goodscode: goodscode별 프론트 데이터 (있으면 frontend_data 대신 사용)
+    
+    Returns:
+        {goodscode: (성공 여부, 에러 리스트, 통과한 필드와 기대값 딕셔너리)} 딕셔너리
+    """
+    codes = [str(code) for code in goodscodes]
+    
+    module_config_data, exclude_fields = _prepare_event_validation(
+        event_type, module_title, module_config, exclude_fields, area, feature_path, nth
+    )
+    if module_config_data is None:
+        return {code: (True, [], {}) for code in codes}
+    
+    # 로그 가져오기 (goodscode별 분류를 한 번의 순회로 수행)
+    logs_by_goodscode = get_event_logs_many(tracker, event_type, codes, module_config_data)
+    mode, sample_size = get_validation_mode()
+    
+    results = {}
+    for code in codes:
+        logs = logs_by_goodscode.get(code, [])
+        if len(logs) == 0:
+            results[code] = (True, [], {})
+            continue
+        logs = _apply_validation_mode(logs, mode, sample_size)
+        
+        code_frontend_data = frontend_data
+        if frontend_data_by_goodscode and code in frontend_data_by_goodscode:
+            code_frontend_data = frontend_data_by_goodscode[code]
+        
+        expected = build_expected_from_module_config(
+            module_config_data,
+            event_type,
+            code,
+            code_frontend_data,
+            exclude_fields
+        )
+        results[code] = _validate_logs_against_expected(
+            tracker, logs, expected, code, event_type, fail_fast=(mode == VALIDATION_MODE_FAIL_FAST)
+        )
+    
+    failed = [code for code, (success, _, _) in results.items() if not success]
+    logger.info(f"{event_type} 다건 검증 완료: {len(codes) - len(failed)}/{len(codes)}개 통과")
+    return results
@@ -0,0 +1,263 @@
+"""
+검증 실패 정보를 구조화된 객체로 보관하고 필요할 때만 텍스트로 렌더링
+대량 Exposure 로그 검증 실패 시 디코딩된 gokey 전체를 매번 json.dumps하지 않도록
+렌더링을 표시 시점까지 미루고, TestRail용으로는 길이 제한 요약을 제공
+"""
+import json
+import re
+from typing import Dict, List, Optional, Any, Callable, Iterable
+
+# TestRail 코멘트에 들어가는 검증 실패 요약의 최대 길이 (문자 수)
+TESTRAIL_SUMMARY_MAX_CHARS = 4000
+
+# FieldFailure.reason 값
+REASON_MISSING = 'missing'
+REASON_MANDATORY_EMPTY = 'mandatory_empty'
+REASON_MISMATCH = 'mismatch'
+
+# FieldFailure.match_mode 값 (기대값 표시 라벨)
+MATCH_EMPTY = '빈 문자열'
+MATCH_ONE_OF = '리스트 중 하나'
+MATCH_CONTAINS = '포함 여부'
+
+
+def find_key_path(obj: Any, target_key: str, parent_path: str = '', visited: Optional[set] = None) -> Optional[str]:
+    """
+    validate_payload의 재귀 탐색 순서와 동일하게 target_key가 발견되는 경로를 반환
+    실패 필드를 렌더링할 때만 호출됨
+
+    Args:
+        obj: 탐색할 객체 (payload)
+        target_key: 찾을 키 (key[N] 형태 지원)
+        parent_path: 부모 경로
+        visited: 방문한 객체 ID 집합 (순환 참조 방지)
+
+    Returns:
+        "decoded_gokey.params.spm" 형태의 경로 또는 None
+    """
+    if visited is None:
+        visited = set()
+
+    if isinstance(obj, (dict, list)):
+        if id(obj) in visited:
+            return None
+        visited.add(id(obj))
+
+    array_index_match = re.match(r'^(.+)\[(\d+)\]$', target_key)
+    if array_index_match:
+        base_path = find_key_path(obj, array_index_match.group(1), parent_path, visited)
+        if base_path is not None:
+            return f"{base_path}[{array_index_match.group(2)}]"
+
+    def join(key: Any) -> str:
+        return f"{parent_path}.{key}" if parent_path else str(key)
+
+    if isinstance(obj, dict):
+        if target_key in obj:
+            return join(target_key)
+        if 'parsed' in obj and isinstance(obj['parsed'], (dict, list)):
+            result = find_key_path(obj['parsed'], target_key, join('parsed'), visited)
+            if result is not None:
+                return result
+        for key, value in obj.items():
+            if isinstance(value, str) and value.strip().startswith(('{', '[')):
+                try:
+                    result = find_key_path(json.loads(value), target_key, join(key), visited)
+                    if result is not None:
+                        return result
+                except (json.JSONDecodeError, TypeError):
+                    pass
+            result = find_key_path(value, target_key, join(key), visited)
+            if result is not None:
+                return result
+    elif isinstance(obj, list):
+        for idx, item in enumerate(obj):
+            result = find_key_path(item, target_key, f"{parent_path}[{idx}]", visited)
+            if result is not None:
+                return result
+
+    if isinstance(obj, (dict, list)):
+        visited.discard(id(obj))
+    return None
+
+
+class FieldFailure:
+    """필드 하나의 검증 실패 정보 (field, expected, actual, path)"""
+
+    def __init__(
+        self,
+        field: str,
+        expected: Any,
+        actual: Any,
+        reason: str = REASON_MISMATCH,
+        match_mode: Optional[str] = None,
+        path_resolver: Optional[Callable[[str], Optional[str]]] = None,
+    ):
+        """
+        FieldFailure 초기화
+
+        Args:
+            field: 필드명
+            expected: 기대값
+            actual: 실제값
+            reason: 실패 사유 (REASON_MISSING, REASON_MANDATORY_EMPTY, REASON_MISMATCH)
+            match_mode: 비교 방식 라벨 (MATCH_EMPTY, MATCH_ONE_OF, MATCH_CONTAINS 또는 None)
+            path_resolver: 필드 경로를 계산하는 함수 (path 접근 시에만 호출)
+        """
+        self.field = field
+        self.expected = expected
+        self.actual = actual
+        self.reason = reason
+        self.match_mode = match_mode
+        self._path_resolver = path_resolver
+        self._path: Optional[str] = None
+        self._path_resolved = False
+
+    @property
+    def path(self) -> Optional[str]:
+        """payload 내 필드 경로 (최초 접근 시 계산)"""
+        if not self._path_resolved:
+            self._path_resolved = True
+            if self._path_resolver is not None and self.reason != REASON_MISSING:
+                self._path = self._path_resolver(self.field)
+        return self._path
+
+    def render(self) -> str:
+        """사람이 읽는 한 줄 메시지로 렌더링"""
+        if self.reason == REASON_MISSING:
+            return f"키 '{self.field}'에 해당하는 값이 없습니다."
+        if self.reason == REASON_MANDATORY_EMPTY:
+            return f"키 '{self.field}'는 mandatory 필드이지만 값이 비어있습니다."
+
+        label = f" ({self.match_mode})" if self.match_mode else ""
+        expected = '""' if self.match_mode == MATCH_EMPTY else self.expected
+        message = f"키 '{self.field}'의 값이 일치하지 않습니다. 기대값{label}: {expected}, 실제값: {self.actual}"
+        if self.path:
+            message += f" (경로: {self.path})"
+        return message
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def __repr__(self) -> str:
+        return f"FieldFailure(field={self.field!r}, reason={self.reason!r})"
+
+
+class PayloadValidationError(AssertionError):
+    """
+    validate_payload 검증 실패 예외
+    실패 필드 목록만 보관하고, 메시지(디코딩된 gokey 파라미터 덤프 포함)는 str() 시점에 한 번만 렌더링
+    """
+
+    def __init__(self, failures: List[FieldFailure], log: Dict[str, Any], event_type: Optional[str] = None):
+        """
+        PayloadValidationError 초기화
+
+        Args:
+            failures: 실패한 필드 목록
+            log: 검증 대상 로그 딕셔너리
+            event_type: 이벤트 타입
+        """
+        super().__init__()
+        self.failures = failures
+        self.log = log
+        self.event_type = event_type
+        self._rendered: Optional[str] = None
+
+    @property
+    def url(self) -> Optional[str]:
+        """검증 대상 로그의 URL"""
+        return self.log.get('url') if isinstance(self.log, dict) else None
+
+    def failure_lines(self) -> List[str]:
+        """실패 필드별 메시지 리스트"""
+        return [failure.render() for failure in self.failures]
+
+    def render(self) -> str:
+        """전체 메시지 (디코딩된 gokey 파라미터 포함)"""
+        if self._rendered is None:
+            payload = self.log.get('payload') if isinstance(self.log, dict) else None
+            decoded_info = payload.get('decoded_gokey', {}) if isinstance(payload, dict) else {}
+            self._rendered = (
+                f"Payload 검증 실패:\n" + "\n".join(self.failure_lines()) + "\n"
+                f"디코딩된 gokey 파라미터: {json.dumps(decoded_info.get('params', {}), ensure_ascii=False, indent=2)}"
+            )
+        return self._rendered
+
+    def summary(self) -> str:
+        """페이로드 덤프 없이 URL과 실패 필드만 담은 요약"""
+        return f"Payload 검증 실패 (URL: {self.url}):\n" + "\n".join(self.failure_lines())
+
+    def __str__(self) -> str:
+        return self.render()
+
+
+def _summarize_error(error: Any) -> str:
+    """에러 항목을 요약 문자열로 변환 (PayloadValidationError는 덤프 제외)"""
+    if hasattr(error, 'summary') and callable(error.summary):
+        return error.summary()
+    return str(error)
+
+
+class ValidationReport:
+    """
+    이벤트 타입 검증 결과 리포트
+    bdd_context['validation_error_message']에 저장되며, str()은 전체 내용을,
+    summary()는 TestRail 코멘트용 길이 제한 요약을 반환
+    """
+
+    def __init__(self, header: str, errors: Iterable[Any], passed_fields: Optional[Dict[str, Any]] = None):
+        """
+        ValidationReport 초기화
+
+        Args:
+            header: 리포트 첫 줄 (예: "[TestRail TC: C123] Product Exposure 로그 정합성 검증 실패:")
+            errors: 에러 항목 리스트 (PayloadValidationError 또는 문자열)
+            passed_fields: 통과한 필드와 기대값 딕셔너리
+        """
+        self.header = header
+        self.errors = list(errors)
+        self.passed_fields = passed_fields or {}
+        self._rendered: Optional[str] = None
+
+    def _passed_fields_text(self) -> str:
+        if not self.passed_fields or not isinstance(self.passed_fields, dict):
+            return ""
+        text = "\n\n[통과한 필드]\n"
+        for field, value in self.passed_fields.items():
+            text += f"{field}: {value}\n"
+        return text
+
+    def render(self) -> str:
+        """전체 리포트 텍스트"""
+        if self._rendered is None:
+            body = "\n".join(str(error) for error in self.errors)
+            self._rendered = f"{self.header}\n{body}{self._passed_fields_text()}"
+        return self._rendered
+
+    def summary(self, max_chars: int = TESTRAIL_SUMMARY_MAX_CHARS) -> str:
+        """
+        길이 제한 요약 (페이로드 덤프 제외, 통과 필드 목록 제외)
+
+        Args:
+            max_chars: 최대 문자 수
+
+        Returns:
+            max_chars 이내의 요약 문자열
+        """
+        text = self.header
+        for idx, error in enumerate(self.errors):
+            chunk = "\n" + _summarize_error(error)
+            if len(text) + len(chunk) > max_chars:
+                remaining = len(self.errors) - idx
+                trailer = f"\n... (이하 {remaining}건 생략, 전체 내용은 실행 로그 참고)"
+                text = (text + chunk)[:max(max_chars - len(trailer), 0)]
+                return text + trailer
+            text += chunk
+        return text
+
+    def __contains__(self, item: str) -> bool:
+        return item in self.header or any(item in _summarize_error(error) for error in self.errors)
+
+    def __str__(self) -> str:
+        return self.render()